@@ -0,0 +1,101 @@
+"""Benchmark sem janela de todos os jogos de ``games/``.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench [--frames N] [--output bench_results.json] [pasta ...]
+    python -m bench --baseline bench_baseline.json --tolerance 0.25
+
+Cada jogo roda num processo próprio (``bench/game_runner.py``) com os drivers
+``dummy`` do SDL, entrada roteirizada e sem limite de FPS. O relatório tem FPS,
+p50/p95/p99 do tempo de quadro e pico de RSS por jogo; um jogo que sai sozinho
+antes de ``--frames`` quadros aparece como "saiu cedo" (ou "parado", se
+travou sem desenhar) e fica fora da comparação. Com ``--baseline``, o
+comando termina com erro se o p95 de algum jogo piorar além da tolerância.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from bench.game_runner import MARKER
+from main import scan_game_directory
+
+TIMEOUT = 120
+
+
+def run_one(game_folder, frames):
+    command = [sys.executable, '-m', 'bench.game_runner', os.path.join('games', game_folder), '--frames', str(frames)]
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, encoding='utf-8', errors='replace', timeout=TIMEOUT)
+    except subprocess.TimeoutExpired:
+        return {'game': game_folder, 'frames': 0, 'error': f'timeout após {TIMEOUT}s'}
+
+    for line in completed.stdout.splitlines():
+        if line.startswith(MARKER):
+            return json.loads(line[len(MARKER):])
+
+    last_error = completed.stderr.strip().splitlines()[-1:] or [f'código de saída {completed.returncode}']
+    return {'game': game_folder, 'frames': 0, 'error': last_error[0]}
+
+
+def find_regressions(results, baseline, tolerance):
+    previous = {entry['game']: entry for entry in baseline.get('games', [])}
+    regressions = []
+    for entry in results:
+        old = previous.get(entry['game'])
+        if not old or old.get('p95_ms') is None or entry.get('p95_ms') is None:
+            continue
+        if any(run.get('early_exit') or run.get('stalled') for run in (old, entry)):
+            continue
+        if entry['p95_ms'] > old['p95_ms'] * (1 + tolerance):
+            regressions.append((entry['game'], old['p95_ms'], entry['p95_ms']))
+    return regressions
+
+
+def format_ms(value):
+    return f"{value:.2f}" if value is not None else '-'
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m bench', description=__doc__.splitlines()[0])
+    parser.add_argument('games', nargs='*', help='pastas em games/ (padrão: todas do catálogo)')
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    args = parser.parse_args()
+
+    folders = args.games or [game['folder'] for game in scan_game_directory()]
+
+    results = []
+    print(f"{'jogo':<24} {'quadros':>8} {'FPS':>8} {'p50':>7} {'p95':>7} {'p99':>7} {'RSS (MiB)':>10}")
+    for folder in folders:
+        entry = run_one(folder, args.frames)
+        results.append(entry)
+
+        if entry.get('error') and not entry.get('frames'):
+            print(f"{folder:<24} erro: {entry['error']}")
+            continue
+
+        fps = f"{entry['fps']:.0f}" if entry.get('fps') else '-'
+        rss = entry['peak_rss_kb'] / 1024
+        print(f"{folder:<24} {entry['frames']:>8} {fps:>8} {format_ms(entry['p50_ms']):>7} "
+              f"{format_ms(entry['p95_ms']):>7} {format_ms(entry['p99_ms']):>7} {rss:>10.1f}"
+              f"{'  saiu cedo' if entry.get('early_exit') else ''}{'  parado' if entry.get('stalled') else ''}")
+
+    with open(args.output, 'w', encoding='utf-8') as output_file:
+        json.dump({'frames': args.frames, 'games': results}, output_file, ensure_ascii=False, indent=2)
+    print(f"Resultados salvos em {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as baseline_file:
+            regressions = find_regressions(results, json.load(baseline_file), args.tolerance)
+        for game, old, new in regressions:
+            print(f"Regressão em {game}: p95 {old:.2f} ms -> {new:.2f} ms")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
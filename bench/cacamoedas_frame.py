@@ -0,0 +1,140 @@
+"""Quadro do CaçaMoedas num labirinto grande: desenho antigo × paredes em cache.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.cacamoedas_frame [--size N] [--enemies N] [--frames N]
+
+Gera um labirinto de ``--size`` × ``--size`` (501 por padrão) com
+``--enemies`` inimigos e faz o player andar por ele, com a câmera seguindo,
+sem janela e sem limite de FPS. Cada quadro roda a lógica dos inimigos (flow
+field com o raio de perseguição do jogo) e o desenho. A versão antiga desenha
+como o jogo fazia: um ``pygame.draw.rect`` por parede da lista ``walls`` e um
+círculo por moeda do ``set``, todas as do mapa, a cada quadro. A nova usa ``WallLayer`` (paredes
+prontas em pedaços de superfície) e ``draw_coins`` (só as moedas visíveis do
+bytearray). Mostra média, p95 e pior quadro contra o orçamento de 60 FPS.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join('games', 'CaçaMoedas')))
+
+from levels import Level, WallLayer, draw_coins, camera
+from main import CHASE_RADIUS
+from pathing import FlowField
+
+WIDTH, HEIGHT = 800, 600
+TILE = 40
+BUDGET_MS = 1000 / 60
+
+
+def player_walk(level, frames, seed):
+    # o player anda sempre em frente até bater numa parede, como no jogo
+    rng = random.Random(seed)
+    c, r = level.player_start
+    dc, dr = 1, 0
+    path = []
+    for _ in range(frames):
+        if level.is_wall(c + dc, r + dr) or rng.random() < 0.1:
+            options = [(x, y) for x, y in ((1, 0), (-1, 0), (0, 1), (0, -1)) if not level.is_wall(c + x, r + y)]
+            dc, dr = rng.choice(options)
+        c, r = c + dc, r + dr
+        path.append((c, r))
+    return path
+
+
+def legacy_draw(screen, state, cam_x, cam_y):
+    for w in state['walls']:
+        pygame.draw.rect(screen, (40, 40, 200), w.move(-cam_x, -cam_y))
+    for (c, r) in state['dots']:
+        pygame.draw.circle(screen, (255, 255, 0), (c * TILE + TILE // 2 - cam_x, r * TILE + TILE // 2 - cam_y), 6)
+
+
+def legacy_state(level):
+    walls = []
+    dots = set()
+    for r in range(level.rows):
+        for c in range(level.cols):
+            if level.is_wall(c, r):
+                walls.append(pygame.Rect(c * TILE, r * TILE, TILE, TILE))
+            elif level.coins[r * level.cols + c]:
+                dots.add((c, r))
+    return {'walls': walls, 'dots': dots}
+
+
+def new_draw(screen, state, cam_x, cam_y):
+    state['walls'].draw(screen, cam_x, cam_y)
+    draw_coins(screen, state['level'], TILE, cam_x, cam_y)
+
+
+def run(screen, level, walk, enemies, draw, state):
+    flow = FlowField(level.cols, level.rows, level.walkable, max_dist=CHASE_RADIUS)
+    rng = random.Random(0)
+    times = []
+    for frame, (c, r) in enumerate(walk):
+        start = time.perf_counter()
+        # o player anda a cada 0,12 s e os inimigos a cada 0,18 s, como no jogo
+        if frame % 11 == 0:
+            flow.update((c, r))
+            enemies = [
+                flow.next_step(*e) if flow.distance(*e) >= 0 else rng.choice(level.neighbors(*e) or [tuple(e)])
+                for e in enemies
+            ]
+        cam_x, cam_y = camera(c * TILE + TILE // 2, r * TILE + TILE // 2, level, TILE, WIDTH, HEIGHT)
+        screen.fill((0, 0, 0))
+        draw(screen, state, cam_x, cam_y)
+        for ex, ey in enemies:
+            pygame.draw.circle(screen, (255, 50, 50), (ex * TILE + 20 - cam_x, ey * TILE + 20 - cam_y), 16)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def report(name, times):
+    ordered = sorted(times)
+    mean = statistics.fmean(ordered) * 1000
+    p95 = ordered[int(len(ordered) * 0.95)] * 1000
+    worst = ordered[-1] * 1000
+    status = 'ok' if p95 <= BUDGET_MS else 'ESTOURA'
+    print(f"{name:<8} {mean:>11.2f} {p95:>9.2f} {worst:>10.2f}   {status}")
+    return p95
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=501)
+    parser.add_argument('--enemies', type=int, default=20)
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--legacy-frames', type=int, default=20, help='quadros da versão antiga (é lenta)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    start = time.perf_counter()
+    level = Level.generate(args.size, args.size, enemies=args.enemies, seed=args.seed)
+    generated = time.perf_counter() - start
+    walk = player_walk(level, args.frames, args.seed)
+
+    print(f"labirinto {level.cols}x{level.rows} (gerado em {generated:.2f} s), "
+          f"{len(level.enemy_starts)} inimigos, orçamento {BUDGET_MS:.1f} ms")
+    print(f"{'versão':<8} {'média (ms)':>11} {'p95 (ms)':>9} {'pior (ms)':>10}")
+    legacy = legacy_state(level)
+    report('antiga', run(screen, level, walk[:args.legacy_frames], level.enemy_starts, legacy_draw, legacy))
+    layer = {'walls': WallLayer(level, TILE, (40, 40, 200)), 'level': level}
+    p95 = report('nova', run(screen, level, walk, level.enemy_starts, new_draw, layer))
+    if p95 > BUDGET_MS:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""Perseguição do CaçaMoedas: BFS por inimigo × flow field compartilhado.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.cacamoedas_pathing [--size N] [--enemies 1,10,100] [--ticks N]
+
+Gera um labirinto de ``--size`` × ``--size`` células com
+``levels.generate_maze`` e espalha os inimigos em células livres. A cada passo
+o player anda para uma célula vizinha e todos os inimigos dão um passo em
+direção a ele. A versão antiga roda o ``bfs_step`` que o jogo usava (uma BFS
+com dicionário ``parent`` por inimigo); a nova refaz o ``FlowField`` uma vez e
+cada inimigo só consulta o array. Antes de medir, confere que os dois passos
+de cada inimigo estão num caminho mais curto.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import deque
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+sys.path.insert(0, os.path.abspath(os.path.join('games', 'CaçaMoedas')))
+
+from levels import generate_maze
+from pathing import FlowField, walkable_grid
+
+
+def legacy_bfs_step(level, start, goal):
+    # cópia do bfs_step antigo de CaçaMoedas/main.py, com o mapa como parâmetro
+    rows, cols = len(level), len(level[0])
+
+    def neighbors(c, r):
+        for dc, dr in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            nc, nr = c + dc, r + dr
+            if 0 <= nc < cols and 0 <= nr < rows and level[nr][nc] != '#':
+                yield nc, nr
+
+    if start == goal:
+        return start
+    q = deque([start])
+    parent = {start: None}
+    while q:
+        cur = q.popleft()
+        if cur == goal:
+            break
+        for nb in neighbors(*cur):
+            if nb not in parent:
+                parent[nb] = cur
+                q.append(nb)
+    if goal not in parent:
+        return start
+    cur = goal
+    path = []
+    while cur is not None:
+        path.append(cur)
+        cur = parent[cur]
+    path.reverse()
+    if len(path) >= 2:
+        return path[1]
+    return start
+
+
+def open_cells(level):
+    return [(c, r) for r, line in enumerate(level) for c, ch in enumerate(line) if ch != '#']
+
+
+def player_walk(level, start, ticks, rng):
+    # caminho aleatório do player: troca de célula a cada passo
+    path = [start]
+    c, r = start
+    for _ in range(ticks):
+        options = [(c + dc, r + dr) for dc, dr in ((1, 0), (-1, 0), (0, 1), (0, -1)) if level[r + dr][c + dc] != '#']
+        c, r = rng.choice(options)
+        path.append((c, r))
+    return path
+
+
+def run_legacy(level, enemies, walk):
+    enemies = list(enemies)
+    start = time.perf_counter()
+    for player in walk:
+        enemies = [legacy_bfs_step(level, e, player) for e in enemies]
+    return time.perf_counter() - start
+
+
+def run_flow(level, enemies, walk):
+    rows, cols = len(level), len(level[0])
+    field = FlowField(cols, rows, walkable_grid(level))
+    enemies = list(enemies)
+    start = time.perf_counter()
+    for player in walk:
+        field.update(player)
+        enemies = [field.next_step(*e) for e in enemies]
+    return time.perf_counter() - start
+
+
+def check(level, enemies, player):
+    rows, cols = len(level), len(level[0])
+    field = FlowField(cols, rows, walkable_grid(level))
+    field.update(player)
+    for e in enemies:
+        expected = max(0, field.distance(*e) - 1)
+        if field.distance(*legacy_bfs_step(level, e, player)) != expected:
+            return False
+        if field.distance(*field.next_step(*e)) != expected:
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=200)
+    parser.add_argument('--enemies', default='1,10,100')
+    parser.add_argument('--ticks', type=int, default=10, help='passos de inimigo medidos')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    level = generate_maze(args.size, args.size, args.seed)
+    cells = open_cells(level)
+    rng = random.Random(args.seed)
+    walk = player_walk(level, rng.choice(cells), args.ticks - 1, rng)
+    counts = [int(n) for n in args.enemies.split(',')]
+
+    if not check(level, rng.sample(cells, max(counts)), walk[0]):
+        print("ERRO: algum passo não está num caminho mais curto")
+        sys.exit(1)
+
+    print(f"labirinto {len(level[0])}x{len(level)} ({len(cells)} células livres), {args.ticks} passos")
+    print(f"{'inimigos':>8} {'BFS/inimigo (ms/passo)':>24} {'flow field (ms/passo)':>22} {'aceleração':>11}")
+    for n in counts:
+        enemies = rng.sample(cells, n)
+        legacy = run_legacy(level, enemies, walk) / args.ticks * 1000
+        flow = run_flow(level, enemies, walk) / args.ticks * 1000
+        print(f"{n:>8} {legacy:>24.2f} {flow:>22.2f} {legacy / flow:>10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,343 @@
+"""CampoMinado2 em tabuleiros grandes: Cell por célula × planos de bytes.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.campominado2_board [--sizes 100,500,1000,2000] [--frames N]
+
+Para cada tamanho N × N, com uma mina a cada 100 células, mede a montagem do
+tabuleiro (minas + vizinhas) e o primeiro clique, que abre a área vazia em
+volta dele. A versão antiga é o ``Board`` de antes (um ``Cell`` por célula,
+vizinhas contadas célula a célula e ``reveal``/``flood_fill`` recursivos, que
+estouram o limite de recursão); ela só roda até ``--legacy-max``. A nova é o
+``Board`` em planos de bytes de ``campo_minado_board.py``.
+
+Depois mede o quadro: o cursor anda e marca bandeiras por ``--frames`` quadros,
+com o ``Renderer`` antigo (redesenha tudo e renderiza cada número a cada
+quadro) num tabuleiro de ``--frame-size``, e com o novo (só repinta o que
+mudou, com viewport) no mesmo tamanho e no maior de ``--sizes``.
+
+Antes de medir, confere em tabuleiros pequenos que as duas versões abrem as
+mesmas células e que os repintes parciais deixam a tela igual a um desenho
+completo.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join('games', 'CampoMinado2')))
+
+from campo_minado_board import Board
+from campo_minado_renderer import Renderer
+
+WIDTH, HEIGHT = 800, 600
+CELL = 24
+OX, OY = 20, 50
+VIEW_ROWS, VIEW_COLS = (HEIGHT - OY - 20) // CELL, (WIDTH - 2 * OX) // CELL
+
+
+# ---------- versão antiga (cópia de antes, sem mudanças de lógica) ----------
+
+class LegacyCell:
+    def __init__(self):
+        self.mine = False
+        self.revealed = False
+        self.flagged = False
+        self.adj = 0
+
+
+class LegacyBoard:
+    def __init__(self, rows, cols, mines):
+        self.rows, self.cols, self.mines = rows, cols, mines
+        self.grid = [[LegacyCell() for _ in range(cols)] for _ in range(rows)]
+        self.first_move = True
+        self.remaining = rows * cols - mines
+        self.game_over = False
+        self.victory = False
+
+    def place_mines(self, safe_r, safe_c):
+        positions = [(r,c) for r in range(self.rows) for c in range(self.cols)]
+        forbidden = {(safe_r+dr, safe_c+dc) for dr in (-1,0,1) for dc in (-1,0,1)
+                      if 0 <= safe_r+dr < self.rows and 0 <= safe_c+dc < self.cols}
+        eligible = [p for p in positions if p not in forbidden]
+        random.shuffle(eligible)
+        for i in range(self.mines):
+            r,c = eligible[i]
+            self.grid[r][c].mine = True
+        self.calculate_adj()
+
+    def calculate_adj(self):
+        for r in range(self.rows):
+            for c in range(self.cols):
+                cell = self.grid[r][c]
+                if cell.mine:
+                    cell.adj = -1
+                    continue
+                total = 0
+                for dr in (-1,0,1):
+                    for dc in (-1,0,1):
+                        if dr==0 and dc==0: continue
+                        rr,cc = r+dr, c+dc
+                        if 0<=rr<self.rows and 0<=cc<self.cols and self.grid[rr][cc].mine:
+                            total+=1
+                cell.adj = total
+
+    def reveal(self, r, c):
+        if self.game_over or self.victory: return
+        cell = self.grid[r][c]
+        if cell.revealed or cell.flagged: return
+        if self.first_move:
+            self.place_mines(r, c)
+            self.first_move = False
+        cell.revealed = True
+        if cell.mine:
+            self.trigger_game_over(); return
+        self.remaining -= 1
+        if cell.adj == 0:
+            self.flood_fill(r, c)
+        if self.remaining == 0:
+            self.trigger_victory()
+
+    def flood_fill(self, r, c):
+        for dr in (-1,0,1):
+            for dc in (-1,0,1):
+                rr,cc=r+dr,c+dc
+                if 0<=rr<self.rows and 0<=cc<self.cols:
+                    if not self.grid[rr][cc].revealed and not self.grid[rr][cc].mine:
+                        self.reveal(rr,cc)
+
+    def toggle_flag(self, r, c):
+        if not self.grid[r][c].revealed:
+            self.grid[r][c].flagged = not self.grid[r][c].flagged
+
+    def trigger_game_over(self):
+        self.game_over = True
+        for r in range(self.rows):
+            for c in range(self.cols):
+                if self.grid[r][c].mine:
+                    self.grid[r][c].revealed = True
+
+    def trigger_victory(self):
+        self.victory = True
+        for r in range(self.rows):
+            for c in range(self.cols):
+                self.grid[r][c].revealed = True
+
+
+class LegacyRenderer:
+    def __init__(self, screen, board, cell_size, ox, oy):
+        self.screen = screen
+        self.board = board
+        self.cs = cell_size
+        self.ox = ox
+        self.oy = oy
+        self.font = pygame.font.SysFont(None, int(cell_size*0.65))
+        self.status_font = pygame.font.SysFont(None, 24)
+
+    def draw(self, cursor):
+        self.screen.fill((30,30,30))
+        for r in range(self.board.rows):
+            for c in range(self.board.cols):
+                self.draw_cell(r,c)
+        self.draw_cursor(cursor)
+        self.draw_status()
+        pygame.display.flip()
+
+    def draw_cell(self, r, c):
+        cell = self.board.grid[r][c]
+        x = self.ox + c*self.cs
+        y = self.oy + r*self.cs
+        rect = pygame.Rect(x,y,self.cs,self.cs)
+        if cell.revealed:
+            pygame.draw.rect(self.screen,(200,200,200),rect)
+            if cell.mine:
+                pygame.draw.circle(self.screen,(0,0,0),(x+self.cs//2,y+self.cs//2),self.cs//3)
+            elif cell.adj>0:
+                t=self.font.render(str(cell.adj),True,(20,20,180))
+                self.screen.blit(t,t.get_rect(center=rect.center))
+        else:
+            pygame.draw.rect(self.screen,(100,100,100),rect)
+            if cell.flagged:
+                pygame.draw.polygon(self.screen,(200,40,40),[
+                    (x+self.cs*0.25,y+self.cs*0.2),
+                    (x+self.cs*0.6, y+self.cs*0.3),
+                    (x+self.cs*0.25,y+self.cs*0.5)
+                ])
+        pygame.draw.rect(self.screen,(50,50,50),rect,1)
+
+    def draw_cursor(self,cursor):
+        r,c=cursor
+        x=self.ox+c*self.cs
+        y=self.oy+r*self.cs
+        pygame.draw.rect(self.screen,(255,255,0),(x,y,self.cs,self.cs),max(2,self.cs//12))
+
+    def draw_status(self):
+        if self.board.game_over: msg="Game Over — Pause para sair"
+        elif self.board.victory: msg="Vitória — Pause para sair"
+        else: msg=f"Restantes: {self.board.remaining} | Minas: {self.board.mines}"
+        st=self.status_font.render(msg,True,(230,230,230))
+        self.screen.blit(st,(10,10))
+
+
+# ---------- conferência ----------
+
+def copy_mines(board, legacy):
+    # o tabuleiro antigo recebe as minas do novo, sem sortear de novo
+    legacy.first_move = False
+    for i in range(board.rows * board.cols):
+        legacy.grid[i // board.cols][i % board.cols].mine = bool(board.mine[i])
+    legacy.calculate_adj()
+
+
+def to_legacy(board):
+    # cópia completa do estado, para os dois renderers desenharem o mesmo jogo
+    legacy = LegacyBoard(board.rows, board.cols, board.mines)
+    copy_mines(board, legacy)
+    for i in range(board.rows * board.cols):
+        cell = legacy.grid[i // board.cols][i % board.cols]
+        cell.revealed, cell.flagged = bool(board.revealed[i]), bool(board.flagged[i])
+    legacy.remaining = board.remaining
+    return legacy
+
+
+def check_board(rng):
+    rows, cols = rng.randint(4, 30), rng.randint(4, 30)
+    board = Board(rows, cols, rng.randint(0, rows * cols // 5))
+    legacy = LegacyBoard(rows, cols, board.mines)
+    r, c = rng.randrange(rows), rng.randrange(cols)
+    board.reveal(r, c)
+    copy_mines(board, legacy)
+    legacy.reveal(r, c)
+    for _ in range(8):
+        r, c = rng.randrange(rows), rng.randrange(cols)
+        if rng.random() < 0.3:
+            board.toggle_flag(r, c)
+            legacy.toggle_flag(r, c)
+        else:
+            board.reveal(r, c)
+            legacy.reveal(r, c)
+    for i in range(rows * cols):
+        cell = legacy.grid[i // cols][i % cols]
+        adj = 9 if cell.mine else cell.adj
+        if (board.adj[i], board.revealed[i], board.flagged[i]) != (adj, cell.revealed, cell.flagged):
+            return False
+    return (board.remaining, board.game_over, board.victory) == (legacy.remaining, legacy.game_over, legacy.victory)
+
+
+def check_render(screen, rng):
+    # repintes parciais ao longo de várias jogadas × um desenho completo do zero
+    rows, cols = rng.randint(VIEW_ROWS, 3 * VIEW_ROWS), rng.randint(VIEW_COLS, 3 * VIEW_COLS)
+    board = Board(rows, cols, rows * cols // 8)
+    renderer = Renderer(screen, board, CELL, OX, OY, VIEW_ROWS, VIEW_COLS)
+    cursor = (rng.randrange(rows), rng.randrange(cols))
+    for _ in range(40):
+        cursor = (min(rows - 1, max(0, cursor[0] + rng.randint(-6, 6))),
+                  min(cols - 1, max(0, cursor[1] + rng.randint(-6, 6))))
+        (board.reveal if rng.random() < 0.4 else board.toggle_flag)(*cursor)
+        renderer.draw(cursor)
+    partial = pygame.image.tobytes(screen, 'RGB')
+    fresh = Renderer(screen, board, CELL, OX, OY, VIEW_ROWS, VIEW_COLS)
+    fresh.top, fresh.left = renderer.top, renderer.left
+    fresh.draw(cursor)
+    return partial == pygame.image.tobytes(screen, 'RGB')
+
+
+def check(screen, rounds, rng):
+    # a versão antiga precisa de um limite de recursão maior até em 30 x 30
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(10000)
+    try:
+        return all(check_board(rng) and check_render(screen, rng) for _ in range(rounds))
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+# ---------- medições ----------
+
+def first_click(make_board, size, seed):
+    random.seed(seed)
+    start = time.perf_counter()
+    board = make_board(size, size, size * size // 100)
+    board.place_mines(size // 2, size // 2)
+    board.first_move = False
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    try:
+        board.reveal(size // 2, size // 2)
+        clicked = f"{(time.perf_counter() - start) * 1000:.1f}"
+    except RecursionError:
+        clicked = 'RecursionError'
+    return built * 1000, clicked, board
+
+
+def run_frames(screen, board, renderer, frames, seed):
+    rng = random.Random(seed)
+    rows, cols = board.rows, board.cols
+    r, c = rows // 2, cols // 2
+    times = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        dr, dc = rng.choice(((1, 0), (-1, 0), (0, 1), (0, -1)))
+        r, c = (r + dr) % rows, (c + dc) % cols
+        if frame % 10 == 0:
+            board.toggle_flag(r, c)
+        renderer.draw((r, c))
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return statistics.fmean(times) * 1000, times[int(len(times) * 0.95)] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='100,500,1000,2000')
+    parser.add_argument('--legacy-max', type=int, default=500, help='maior tamanho medido na versão antiga')
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--frame-size', type=int, default=100)
+    parser.add_argument('--checks', type=int, default=100, help='tabuleiros pequenos conferidos')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    if not check(screen, args.checks, random.Random(args.seed)):
+        print("ERRO: a versão nova não bate com a antiga")
+        sys.exit(1)
+
+    sizes = [int(n) for n in args.sizes.split(',')]
+    print(f"limite de recursão: {sys.getrecursionlimit()}, uma mina a cada 100 células")
+    print(f"{'tabuleiro':>11} {'montar antigo (ms)':>19} {'1º clique antigo':>17} "
+          f"{'montar novo (ms)':>17} {'1º clique novo (ms)':>20} {'abertas':>9}")
+    for size in sizes:
+        if size <= args.legacy_max:
+            built, clicked, _ = first_click(LegacyBoard, size, args.seed)
+            legacy = f"{built:>19.1f} {clicked:>17}"
+        else:
+            legacy = f"{'-':>19} {'-':>17}"
+        built, clicked, board = first_click(Board, size, args.seed)
+        opened = size * size - board.mines - board.remaining
+        print(f"{f'{size}x{size}':>11} {legacy} {built:>17.1f} {clicked:>20} {opened:>9}")
+
+    print(f"\n{args.frames} quadros, tela {WIDTH}x{HEIGHT}, células de {CELL} px")
+    print(f"{'versão':<7} {'tabuleiro':>11} {'média (ms)':>11} {'p95 (ms)':>9}")
+    size = args.frame_size
+    legacy = to_legacy(first_click(Board, size, args.seed)[2])
+    # o renderer antigo desenha o tabuleiro todo, mesmo fora da tela
+    mean, p95 = run_frames(screen, legacy, LegacyRenderer(screen, legacy, CELL, OX, OY), args.frames, args.seed)
+    print(f"{'antiga':<7} {f'{size}x{size}':>11} {mean:>11.2f} {p95:>9.2f}")
+    for size in (args.frame_size, max(sizes)):
+        _, _, board = first_click(Board, size, args.seed)
+        renderer = Renderer(screen, board, CELL, OX, OY, VIEW_ROWS, VIEW_COLS)
+        mean, p95 = run_frames(screen, board, renderer, args.frames, args.seed)
+        print(f"{'nova':<7} {f'{size}x{size}':>11} {mean:>11.2f} {p95:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
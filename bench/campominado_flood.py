@@ -0,0 +1,171 @@
+"""Flood-fill do Campo Minado: reveal_cell recursivo × iterativo com pilha.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.campominado_flood [--sizes 100,500,1000,2000]
+
+Para cada tamanho monta um tabuleiro N × N sem minas (o pior caso: um clique
+abre o tabuleiro inteiro) e mede um clique no canto. A versão antiga é o
+``reveal_cell`` recursivo de antes sobre listas de listas, que estoura o
+limite de recursão do Python bem antes de 100 × 100; a nova é o flood-fill
+iterativo sobre bytearrays de ``main.py``. A coluna "serpentina" mede o mesmo
+clique num tabuleiro com paredes de minas que deixam um único corredor
+serpenteando de ponta a ponta. Também mede o ``check_win`` antigo (varre o
+tabuleiro) contra o contador de células reveladas. Antes de medir, confere em
+tabuleiros pequenos, com minas e bandeiras, que as duas versões revelam as
+mesmas células.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+sys.path.insert(0, os.path.abspath(os.path.join('games', 'Campo_Minado')))
+
+import main as game
+
+
+class LegacyBoard:
+    # cópia do reveal_cell/check_win antigos, com o estado como atributos
+
+    def __init__(self, board, flagged):
+        rows, cols = game.ROWS, game.COLS
+        self.rows, self.cols = rows, cols
+        self.board = [[-1 if board[r*cols + c] == game.MINE else board[r*cols + c] for c in range(cols)] for r in range(rows)]
+        self.revealed = [[False]*cols for _ in range(rows)]
+        self.flagged = [[bool(flagged[r*cols + c]) for c in range(cols)] for r in range(rows)]
+
+    def reveal_cell(self, r, c):
+        if self.revealed[r][c] or self.flagged[r][c]:
+            return
+        self.revealed[r][c] = True
+        if self.board[r][c] == 0:
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    rr, cc = r+dr, c+dc
+                    if 0 <= rr < self.rows and 0 <= cc < self.cols and not self.revealed[rr][cc]:
+                        self.reveal_cell(rr, cc)
+
+    def check_win(self):
+        for r in range(self.rows):
+            for c in range(self.cols):
+                if self.board[r][c] != -1 and not self.revealed[r][c]:
+                    return False
+        return True
+
+
+def setup(size, mines):
+    game.ROWS = game.COLS = size
+    game.MINES = mines
+    game.reset_game()
+
+
+def setup_serpentine(size):
+    # uma parede de minas a cada 4 linhas, com a passagem (3 células) alternando
+    # entre a ponta direita e a esquerda
+    setup(size, 0)
+    mines = []
+    for r in range(2, size - 2, 4):
+        cols = range(size - 3) if r % 8 == 2 else range(3, size)
+        mines.extend(r*size + c for c in cols)
+    board = game.board
+    for i in mines:
+        board[i] = game.MINE
+    for i in mines:
+        r, c = divmod(i, size)
+        for rr in range(max(0, r-1), min(size, r+2)):
+            for j in range(rr*size + max(0, c-1), rr*size + min(size, c+2)):
+                if board[j] != game.MINE:
+                    board[j] += 1
+    game.mines = mines
+    game.MINES = len(mines)
+
+
+def check(rounds, rng):
+    # tabuleiros pequenos com minas e bandeiras: as duas versões têm que bater
+    # (a recursiva precisa de um limite maior até em 40 x 40)
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(10000)
+    try:
+        return all(check_board(rng) for _ in range(rounds))
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+def check_board(rng):
+    size = rng.randint(2, 40)
+    setup(size, rng.randint(0, size * size // 6))
+    for i in rng.sample(range(size * size), size):
+        game.flagged[i] = 1
+    legacy = LegacyBoard(game.board, game.flagged)
+    for _ in range(5):
+        r, c = rng.randrange(size), rng.randrange(size)
+        if game.board[r*size + c] == game.MINE:
+            continue
+        legacy.reveal_cell(r, c)
+        game.reveal_cell(r, c)
+    expected = [i for i in range(size * size) if legacy.revealed[i // size][i % size]]
+    got = [i for i in range(size * size) if game.revealed[i]]
+    return got == expected and game.revealed_count == len(got) and game.check_win() == legacy.check_win()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='100,500,1000,2000')
+    parser.add_argument('--checks', type=int, default=200, help='tabuleiros pequenos conferidos')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    if not check(args.checks, random.Random(args.seed)):
+        print("ERRO: o flood-fill novo não revela as mesmas células que o antigo")
+        sys.exit(1)
+
+    print(f"limite de recursão: {sys.getrecursionlimit()}")
+    print(f"{'tabuleiro':>11} {'recursivo (ms)':>15} {'iterativo (ms)':>15} {'serpentina (ms)':>16} "
+          f"{'check_win antigo (ms)':>22} {'contador (ms)':>14}")
+    for size in (int(n) for n in args.sizes.split(',')):
+        setup(size, 0)
+        legacy = LegacyBoard(game.board, game.flagged)
+        start = time.perf_counter()
+        try:
+            legacy.reveal_cell(0, 0)
+            recursive = f"{(time.perf_counter() - start) * 1000:.1f}"
+        except RecursionError:
+            recursive = 'RecursionError'
+        # o check_win antigo varre tudo quando só falta a última célula
+        legacy.revealed = [[True]*size for _ in range(size)]
+        legacy.revealed[-1][-1] = False
+        start = time.perf_counter()
+        legacy.check_win()
+        legacy_win = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        game.reveal_cell(0, 0)
+        iterative = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        won = game.check_win()
+        counter = (time.perf_counter() - start) * 1000
+        if game.revealed_count != size * size or not won:
+            print(f"ERRO: {size}x{size} revelou {game.revealed_count} células")
+            sys.exit(1)
+
+        setup_serpentine(size)
+        start = time.perf_counter()
+        game.reveal_cell(0, 0)
+        serpentine = (time.perf_counter() - start) * 1000
+        if not game.check_win():
+            print(f"ERRO: serpentina {size}x{size} revelou {game.revealed_count} de "
+                  f"{size * size - game.MINES} células")
+            sys.exit(1)
+        print(f"{f'{size}x{size}':>11} {recursive:>15} {iterative:>15.1f} {serpentine:>16.1f} "
+              f"{legacy_win:>22.2f} {counter:>14.4f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Varredura do catálogo a frio e a quente numa árvore sintética de jogos.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.catalog_scan [--games 5000]
+
+Compara a varredura completa original (stat + configparser em todas as pastas)
+com o ``GameCatalog``: sem índice, com o índice lido do disco, com o índice já
+em memória e depois de alterar algumas pastas.
+"""
+import argparse
+import configparser
+import os
+import tempfile
+import time
+
+from hub.catalog import GameCatalog
+
+CHANGED_FOLDERS = 10
+
+
+def build_tree(games_dir, count):
+    for i in range(count):
+        folder = os.path.join(games_dir, f'Jogo{i:05d}')
+        os.makedirs(folder)
+        with open(os.path.join(folder, 'main.py'), 'w', encoding='utf-8') as main_py:
+            main_py.write('import pygame\n')
+        with open(os.path.join(folder, 'data.inf'), 'w', encoding='utf-8') as data_inf:
+            data_inf.write(f'[Game]\nnome = Jogo {i}\nautores = Autor {i}\n')
+
+
+def full_scan(games_dir):
+    game_list = []
+    for folder_name in os.listdir(games_dir):
+        game_folder_path = os.path.join(games_dir, folder_name)
+        if not os.path.isdir(game_folder_path):
+            continue
+
+        main_py_path = os.path.join(game_folder_path, 'main.py')
+        data_inf_path = os.path.join(game_folder_path, 'data.inf')
+        if os.path.exists(main_py_path) and os.path.exists(data_inf_path):
+            game_config = configparser.ConfigParser()
+            game_config.read(data_inf_path, encoding='utf-8')
+            game_list.append({
+                'folder': folder_name,
+                'name': game_config.get('Game', 'nome', fallback=folder_name),
+                'authors': game_config.get('Game', 'autores', fallback='Autor Desconhecido')
+            })
+    return game_list
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        games_dir = os.path.join(root, 'games')
+        index_path = os.path.join(root, 'catalog.json')
+        build_tree(games_dir, args.games)
+
+        results = []
+        results.append(('varredura completa (original)',) + timed(lambda: full_scan(games_dir)))
+        results.append(('catálogo a frio (sem índice)',) + timed(GameCatalog(games_dir, index_path).scan))
+        catalog = GameCatalog(games_dir, index_path)
+        results.append(('catálogo a quente (índice em disco)',) + timed(catalog.scan))
+        results.append(('catálogo a quente (índice em memória)',) + timed(catalog.scan))
+
+        for i in range(CHANGED_FOLDERS):
+            with open(os.path.join(games_dir, f'Jogo{i:05d}', 'data.inf'), 'a', encoding='utf-8') as data_inf:
+                data_inf.write('\n')
+        results.append((f'incremental ({CHANGED_FOLDERS} pastas alteradas)',) + timed(catalog.scan))
+
+        print(f"{args.games} pastas de jogos")
+        for label, elapsed, game_list in results:
+            print(f"{label:<40} {elapsed:>9.1f} ms  ({len(game_list)} jogos)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+"""Executa um jogo sem janela e mede o custo de cada quadro.
+
+Processo filho do ``python -m bench``: roda ``games/<pasta>/main.py`` pelo
+lançador do Hub com os drivers ``dummy`` do SDL, sem o limite de FPS do
+``Clock.tick`` e com entrada roteirizada (eventos postados na fila e
+``pygame.key.get_pressed``/``pygame.mouse.get_pos`` substituídos). O roteiro avança a
+cada ``Clock.tick`` (ou a cada quadro, nos jogos sem ``Clock``), e um jogo que
+passa ``STALL_SECONDS`` sem desenhar nada (por exemplo, parado numa tela de fim
+de jogo esperando Enter) é encerrado e marcado como ``stalled``; um jogo que
+volta sozinho antes de ``--frames`` quadros é marcado como ``early_exit``, e
+os números dele não valem como uma rodada completa. O resultado sai no stdout
+como JSON, numa linha com o prefixo ``MARKER``.
+"""
+import argparse
+import configparser
+import json
+import math
+import os
+import random
+import resource
+import signal
+import time
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+from hub.launcher import StopGame, run_game
+
+MARKER = '@@bench'
+
+# Quantos quadros cada tecla fica pressionada pelo roteiro.
+HOLD_FRAMES = 20
+STALL_SECONDS = 5
+
+original_clock = pygame.time.Clock
+
+
+class UncappedClock:
+    """``pygame.time.Clock`` que ignora o limite de FPS pedido pelo jogo."""
+
+    scripted_input = None
+
+    def __init__(self):
+        self.clock = original_clock()
+
+    def tick(self, framerate=0):
+        if self.scripted_input is not None:
+            self.scripted_input.step()
+            self.scripted_input.ticked = True
+        return self.clock.tick()
+
+    def tick_busy_loop(self, framerate=0):
+        return self.tick()
+
+    def __getattr__(self, name):
+        return getattr(self.clock, name)
+
+
+class PressedKeys:
+    def __init__(self, held):
+        self.held = held
+
+    def __getitem__(self, key):
+        return key in self.held
+
+    def __len__(self):
+        return 512
+
+
+def script_keys(conf_path):
+    """Teclas usadas no roteiro: controles do conf.ini e as setas.
+
+    Pause, Ação B e o espaço ficam de fora, porque em vários jogos eles
+    encerram a partida (no TowerDefense, o espaço sai do jogo).
+    """
+    config = configparser.ConfigParser()
+    config.read(conf_path)
+
+    keys = {pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT}
+    for option in ('up', 'down', 'left', 'right', 'action_a'):
+        try:
+            keys.add(pygame.key.key_code(config.get('Controls', option)))
+        except (configparser.Error, ValueError):
+            pass
+    return sorted(keys)
+
+
+class ScriptedInput:
+    def __init__(self, keys, seed=0):
+        self.keys = keys
+        self.random = random.Random(seed)
+        self.held = set()
+        self.frame = 0
+        self.ticked = False
+
+    def step(self):
+        self.frame += 1
+        if self.frame % HOLD_FRAMES == 0:
+            for key in self.held:
+                pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode='', scancode=0))
+            self.held = set(self.random.sample(self.keys, 2))
+            for key in self.held:
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='', scancode=0))
+
+    def pressed(self):
+        return PressedKeys(self.held)
+
+    def mouse_pos(self):
+        width, height = pygame.display.get_surface().get_size() if pygame.display.get_surface() else (800, 600)
+        angle = self.frame / 30
+        return (int(width / 2 + math.cos(angle) * width / 3), int(height / 2 + math.sin(angle) * height / 3))
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('game_dir')
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    scripted_input = ScriptedInput(script_keys(os.path.join('conf', 'conf.ini')), args.seed)
+    UncappedClock.scripted_input = scripted_input
+    pygame.time.Clock = UncappedClock
+    pygame.key.get_pressed = scripted_input.pressed
+    pygame.mouse.get_pos = scripted_input.mouse_pos
+
+    frame_times = []
+    last_frame = None
+    stalled = False
+
+    def on_stall(signum, stack):
+        nonlocal stalled
+        stalled = True
+        raise StopGame()
+
+    def on_frame():
+        nonlocal last_frame
+        now = time.perf_counter()
+        if last_frame is not None:
+            frame_times.append(now - last_frame)
+        last_frame = now
+
+        if len(frame_times) >= args.frames:
+            raise StopGame()
+        signal.setitimer(signal.ITIMER_REAL, STALL_SECONDS)
+
+        if not scripted_input.ticked:
+            scripted_input.step()
+        scripted_input.ticked = False
+
+    signal.signal(signal.SIGALRM, on_stall)
+    signal.setitimer(signal.ITIMER_REAL, STALL_SECONDS)
+    result = run_game(args.game_dir, on_frame=on_frame)
+    signal.setitimer(signal.ITIMER_REAL, 0)
+
+    ordered = sorted(frame_times)
+    total = sum(frame_times)
+    report = {
+        'game': os.path.basename(os.path.normpath(args.game_dir)),
+        'frames': len(frame_times),
+        'fps': len(frame_times) / total if total else None,
+        'p50_ms': percentile(ordered, 0.50) * 1000 if ordered else None,
+        'p95_ms': percentile(ordered, 0.95) * 1000 if ordered else None,
+        'p99_ms': percentile(ordered, 0.99) * 1000 if ordered else None,
+        'first_frame_ms': result['first_frame'] * 1000 if result['first_frame'] is not None else None,
+        # No Linux ru_maxrss vem em KiB.
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'stalled': stalled,
+        'early_exit': not stalled and result['error'] is None and len(frame_times) < args.frames,
+        'error': repr(result['error']) if result['error'] is not None else None,
+    }
+    print(f"{MARKER} {json.dumps(report)}", flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Uso de CPU do menu principal parado e navegando, antes e depois do modo retido.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.idle_cpu [--seconds N]
+
+"antes" é o loop antigo (desenha e faz ``flip`` da tela inteira a 60 FPS);
+"depois" usa ``wait_for_events``/``present`` do Hub, que só redesenham as áreas
+sujas e dormem em ``pygame.event.wait`` quando não há nada a fazer.
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+import main as hub_main
+
+NAVIGATION_INTERVAL_MS = 250
+
+
+def legacy_loop(state, seconds):
+    clock = pygame.time.Clock()
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        for event in pygame.event.get():
+            state.handle_event(event)
+        state.draw()
+        pygame.display.flip()
+        clock.tick(60)
+
+
+def retained_loop(state, seconds):
+    clock = pygame.time.Clock()
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        for event in hub_main.wait_for_events(state):
+            state.handle_event(event)
+        if hub_main.present(state):
+            clock.tick(60)
+
+
+def cpu_percent(loop, state, seconds, navigate):
+    state.invalidate()
+    pygame.event.clear()
+    if navigate:
+        key_down = pygame.event.Event(pygame.KEYDOWN, key=pygame.key.key_code(hub_main.CONTROLS['DOWN']))
+        pygame.time.set_timer(key_down, NAVIGATION_INTERVAL_MS)
+
+    start = time.process_time()
+    loop(state, seconds)
+    used = time.process_time() - start
+
+    if navigate:
+        pygame.time.set_timer(pygame.KEYDOWN, 0)
+    return used / seconds * 100
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=5)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = hub_main.create_display()
+    menu = hub_main.MainMenu(screen)
+
+    print(f"{'cenário':<12} {'antes (% CPU)':>14} {'depois (% CPU)':>15}")
+    for label, navigate in (('parado', False), ('navegando', True)):
+        before = cpu_percent(legacy_loop, menu, args.seconds, navigate)
+        after = cpu_percent(retained_loop, menu, args.seconds, navigate)
+        print(f"{label:<12} {before:>14.1f} {after:>15.1f}")
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
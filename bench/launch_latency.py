@@ -0,0 +1,65 @@
+"""Latência do lançador em processo para cada jogo de ``games/``.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.launch_latency [--repeat N]
+
+Para cada jogo mede o tempo entre o lançamento e o primeiro quadro desenhado
+(o jogo é interrompido nesse ponto) e o tempo para o Hub restaurar o display e
+desenhar o próprio quadro de volta ao menu.
+"""
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from hub.launcher import run_game
+from main import create_display, scan_game_directory
+
+
+def measure(game_folder):
+    result = run_game(os.path.join('games', game_folder), stop_on_first_frame=True)
+
+    start = time.perf_counter()
+    create_display()
+    pygame.display.flip()
+    back_to_menu = time.perf_counter() - start
+
+    return result, back_to_menu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    pygame.init()
+    create_display()
+
+    print(f"{'jogo':<24} {'1º quadro (ms)':>15} {'retorno (ms)':>13}")
+    for game in scan_game_directory():
+        first_frames = []
+        returns = []
+        for _ in range(args.repeat):
+            result, back_to_menu = measure(game['folder'])
+            if result['first_frame'] is None:
+                break
+            first_frames.append(result['first_frame'] * 1000)
+            returns.append(back_to_menu * 1000)
+
+        if not first_frames:
+            print(f"{game['folder']:<24} {'sem quadro':>15} {'-':>13}")
+            continue
+
+        print(f"{game['folder']:<24} {statistics.median(first_frames):>15.1f} {statistics.median(returns):>13.1f}")
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Lançamento a frio contra lançamento pelo pool pré-aquecido, jogo a jogo.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.launch_pool [--repeat N]
+
+A frio, o cronômetro começa ao criar o processo (interpretador, ``import
+pygame``, ``pygame.init()`` e o jogo). Pelo pool, começa quando um processo já
+pronto recebe a pasta do jogo. Nos dois casos para no primeiro quadro desenhado.
+"""
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from hub.pool import Worker
+from main import scan_game_directory
+
+WORKER_ARGS = ('--stop-on-first-frame',)
+TIMEOUT = 30
+
+
+def cold_launch(game_dir):
+    start = time.perf_counter()
+    worker = Worker(WORKER_ARGS)
+    worker.run(game_dir, launched_at=start)
+    worker.first_frame.wait(TIMEOUT)
+    worker.close()
+    return worker.first_frame_latency
+
+
+def warm_launch(game_dir):
+    worker = Worker(WORKER_ARGS)
+    worker.ready.wait(TIMEOUT)
+    worker.run(game_dir)
+    worker.first_frame.wait(TIMEOUT)
+    worker.close()
+    return worker.first_frame_latency
+
+
+def median_ms(samples):
+    samples = [s for s in samples if s is not None]
+    if not samples:
+        return None
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'jogo':<24} {'frio (ms)':>10} {'pool (ms)':>10} {'ganho':>7}")
+    for game in scan_game_directory():
+        game_dir = os.path.join('games', game['folder'])
+        cold = median_ms([cold_launch(game_dir) for _ in range(args.repeat)])
+        warm = median_ms([warm_launch(game_dir) for _ in range(args.repeat)])
+
+        if cold is None or warm is None:
+            print(f"{game['folder']:<24} {'sem quadro':>10}")
+            continue
+
+        print(f"{game['folder']:<24} {cold:>10.1f} {warm:>10.1f} {cold / warm:>6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
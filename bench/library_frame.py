@@ -0,0 +1,85 @@
+"""Tempo de quadro da Biblioteca de Jogos conforme o tamanho do catálogo.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.library_frame [--frames N]
+
+Para cada tamanho mede o redesenho completo da tela, a rolagem suave (uma
+página por vez) e a busca incremental por prefixo.
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+import main as hub_main
+
+SIZES = (10, 100, 1000, 10000)
+
+
+def synthetic_games(count):
+    return [{'folder': f'Jogo{i:05d}', 'name': f'Jogo {i:05d}', 'authors': f'Autor {i}'} for i in range(count)]
+
+
+def full_redraw_ms(library, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        library.invalidate()
+        library.render()
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def scrolling_ms(library, frames):
+    list_view = library.list_view
+    now = 0.0
+    elapsed = 0.0
+    for frame in range(frames):
+        if not list_view.is_scrolling():
+            list_view.page(1 if frame % 2 == 0 else -1)
+        now += 1 / 60
+        start = time.perf_counter()
+        if list_view.step(now):
+            library.invalidate(list_view.rect)
+        library.render()
+        elapsed += time.perf_counter() - start
+    return elapsed / frames * 1000
+
+
+def search_us(library, count):
+    list_view = library.list_view
+    start = time.perf_counter()
+    for i in range(0, count, max(1, count // 100)):
+        list_view.search = ''
+        for char in f'jogo {i:05d}':
+            list_view.type_char(char, now=0.0)
+    return (time.perf_counter() - start) / min(count, 100) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=300)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = hub_main.create_display()
+
+    print(f"{'jogos':>6} {'redesenho (ms)':>15} {'rolagem (ms)':>13} {'busca (µs)':>11}")
+    for count in SIZES:
+        library = hub_main.GameLibrary(screen)
+        library.set_games(synthetic_games(count))
+        library.on_enter()
+
+        redraw = full_redraw_ms(library, args.frames)
+        scroll = scrolling_ms(library, args.frames)
+        search = search_us(library, count)
+        print(f"{count:>6} {redraw:>15.3f} {scroll:>13.3f} {search:>11.1f}")
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
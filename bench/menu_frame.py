@@ -0,0 +1,78 @@
+"""Custo por quadro das telas estáticas do Hub, com e sem cache de texto.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.menu_frame [--frames N]
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+import main as hub_main
+from hub import text
+
+
+def uncached_draw_text(surface, text, size, x, y, color=(255, 255, 255), anchor="topleft"):
+    font = pygame.font.Font(None, size)
+    text_surface = font.render(text, True, color)
+    text_rect = text_surface.get_rect()
+
+    if anchor == "center":
+        text_rect.center = (x, y)
+    elif anchor == "topleft":
+        text_rect.topleft = (x, y)
+    elif anchor == "midtop":
+        text_rect.midtop = (x, y)
+
+    surface.blit(text_surface, text_rect)
+    return text_rect
+
+
+def frame_time(state, frames):
+    start = time.process_time()
+    for _ in range(frames):
+        state.draw()
+    return (time.process_time() - start) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=300)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = hub_main.create_display()
+    games = hub_main.scan_game_directory()
+
+    library = hub_main.GameLibrary(screen)
+    library.set_games(list(games))
+    about = hub_main.AboutScreen(screen)
+    about.set_games(list(games))
+
+    states = [
+        ('MainMenu', hub_main.MainMenu(screen)),
+        ('GameLibrary', library),
+        ('HelpScreen', hub_main.HelpScreen(screen)),
+        ('SettingsScreen', hub_main.SettingsScreen(screen)),
+        ('AboutScreen', about),
+    ]
+
+    print(f"{'tela':<16} {'sem cache (ms)':>15} {'com cache (ms)':>15}")
+    for name, state in states:
+        hub_main.draw_text = uncached_draw_text
+        before = frame_time(state, args.frames)
+        hub_main.draw_text = text.draw_text
+        after = frame_time(state, args.frames)
+        print(f"{name:<16} {before:>15.3f} {after:>15.3f}")
+
+    print(text.text_cache.stats())
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
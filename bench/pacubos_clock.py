@@ -0,0 +1,201 @@
+"""Relógio do Pacubos: time.time() consultado a cada quadro × agenda no tempo do jogo.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.pacubos_clock [--minutes 1,10] [--dt 0.0166667]
+
+Sem janela, roda ``PacubosGame.update`` com um dt fixo até completar
+``--minutes`` minutos de tempo do jogo, o mais rápido que der, com o player
+imortal. Mostra quantas vezes isso é mais rápido que o tempo real e quantas
+paredes, especiais e fantasmas nasceram. A versão antiga dos timers (copiada
+abaixo) decide pela hora do sistema, então no mesmo avanço rápido quase nada
+nasce; a nova segue o ``GameClock`` e nasce o que o tempo do jogo pede.
+
+Antes de medir confere que:
+
+* o intervalo entre dois nascimentos fica entre o intervalo configurado e um
+  quadro a mais;
+* o speed acaba depois de ``SPEED_DURATION`` segundos do jogo, nem antes nem
+  depois, e pegar outro no meio adia o fim;
+* duas rodadas com a mesma semente dão o mesmo jogo, mesmo com ``time.time``
+  pulando uma hora a cada chamada.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join('games', 'Pacubos')))
+
+from main import (PacubosGame, PLAYER_SPEED, SPEED_DURATION,
+                  SPECIAL_SPAWN_INTERVAL, WALL_SPAWN_INTERVAL, GHOST_SPAWN_INTERVAL)
+
+
+class LegacyTimers:
+    # os timers de antes, só a parte de tempo de PacubosGame.update
+
+    def __init__(self):
+        self.spawned = {'wall': 0, 'special': 0, 'ghost': 0}
+        self._last_special = time.time() - (SPECIAL_SPAWN_INTERVAL / 2)
+        self._last_wall = time.time() - (WALL_SPAWN_INTERVAL / 2)
+        self._last_ghost = time.time() - (GHOST_SPAWN_INTERVAL / 2)
+        self._speed_until = time.time() + SPEED_DURATION
+
+    def update(self):
+        if hasattr(self, '_speed_until') and time.time() > self._speed_until:
+            try:
+                del self._speed_until
+            except Exception:
+                pass
+        if hasattr(self, '_giant_until') and time.time() > self._giant_until:
+            try:
+                del self._giant_until
+            except Exception:
+                pass
+        if time.time() - self._last_special > SPECIAL_SPAWN_INTERVAL:
+            self._last_special = time.time()
+            self.spawned['special'] += 1
+        if time.time() - self._last_wall > WALL_SPAWN_INTERVAL:
+            self._last_wall = time.time()
+            self.spawned['wall'] += 1
+        if time.time() - self._last_ghost > GHOST_SPAWN_INTERVAL:
+            self._last_ghost = time.time()
+            self.spawned['ghost'] += 1
+
+
+def new_game(seed):
+    # jogo já em andamento, com os nascimentos anotados no tempo do jogo
+    random.seed(seed)
+    g = PacubosGame()
+    g.spawned = {'wall': [], 'special': [], 'ghost': []}
+    for kind in g.spawned:
+        spawn = getattr(g, 'spawn_' + kind)
+
+        def counted(spawn=spawn, log=g.spawned[kind]):
+            log.append(g.game_clock.now)
+            spawn()
+        setattr(g, 'spawn_' + kind, counted)
+    g.game_state = 'playing'
+    g.start_game()
+    g.lives = 10 ** 9
+    return g
+
+
+def simulate(g, seconds, dt):
+    frames = round(seconds / dt)
+    for _ in range(frames):
+        g.update(dt)
+    return frames
+
+
+def snapshot(g):
+    return (g.game_clock.now, g.score, len(g.ghosts), len(g.specials), len(g.walls),
+            round(g.player_x, 6), round(g.player_y, 6), g.player_speed, g.player_size,
+            tuple((round(x.x, 6), round(x.y, 6)) for x in g.ghosts),
+            {kind: tuple(log) for kind, log in g.spawned.items()})
+
+
+def check(dt, seed):
+    g = new_game(seed)
+    simulate(g, 10 * 60, dt)
+    for kind, interval in (('wall', WALL_SPAWN_INTERVAL), ('special', SPECIAL_SPAWN_INTERVAL),
+                           ('ghost', GHOST_SPAWN_INTERVAL)):
+        log = g.spawned[kind]
+        gaps = [b - a for a, b in zip(log, log[1:])]
+        if not gaps or not all(interval - 1e-9 <= gap <= interval + dt + 1e-9 for gap in gaps):
+            print(f"ERRO: {kind}: intervalos fora de [{interval}, {interval + dt:.3f}]: "
+                  f"{min(gaps, default=None)}..{max(gaps, default=None)}")
+            sys.exit(1)
+
+    # speed no meio do jogo: acaba SPEED_DURATION depois, e um segundo speed adia o fim
+    g.ghosts.clear()   # sem fantasma para não morrer (e cancelar o speed) no meio
+    for extra in (0.0, 2.0):
+        px = g.player_x + g.player_size / 2
+        py = g.player_y + g.player_size / 2
+        g.specials.append({'x': px, 'y': py, 'type': 'speed'})
+        g.update(dt)
+        taken = g.game_clock.now
+        if extra:
+            simulate(g, extra, dt)
+            g.specials.append({'x': px, 'y': py, 'type': 'speed'})
+            g.update(dt)
+            taken = g.game_clock.now
+        while g.game_clock.now < taken + SPEED_DURATION - dt / 2:
+            if g.player_speed == PLAYER_SPEED:
+                print(f"ERRO: o speed acabou cedo, {g.game_clock.now - taken:.3f} s depois")
+                sys.exit(1)
+            g.update(dt)
+        g.update(dt)
+        if g.player_speed != PLAYER_SPEED:
+            print(f"ERRO: o speed não acabou {g.game_clock.now - taken:.3f} s depois")
+            sys.exit(1)
+
+    # mesma semente, mesmo jogo, com a hora do sistema pulando
+    first = new_game(seed)
+    simulate(first, 2 * 60, dt)
+    real_time = time.time
+    jump = [real_time()]
+
+    def jumping():
+        jump[0] += 3600
+        return jump[0]
+    time.time = jumping
+    try:
+        second = new_game(seed)
+        simulate(second, 2 * 60, dt)
+    finally:
+        time.time = real_time
+    if snapshot(first) != snapshot(second):
+        print("ERRO: duas rodadas com a mesma semente deram jogos diferentes")
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--minutes', default='1,10')
+    parser.add_argument('--dt', type=float, default=1 / 60)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    check(args.dt, args.seed)
+    print(f"dt {args.dt * 1000:.2f} ms; nascimentos no tempo do jogo: paredes a cada {WALL_SPAWN_INTERVAL:g} s, "
+          f"especiais a cada {SPECIAL_SPAWN_INTERVAL:g} s, fantasmas a cada {GHOST_SPAWN_INTERVAL:g} s")
+    print(f"{'minutos':>8} {'real (s)':>9} {'x tempo real':>13} {'paredes':>8} {'especiais':>10} "
+          f"{'fantasmas':>10} {'antiga p/ e/ f':>15} {'timers antigos (us)':>20} {'agenda (us)':>12}")
+    for minutes in (float(v) for v in args.minutes.split(',')):
+        g = new_game(args.seed)
+        start = time.perf_counter()
+        frames = simulate(g, minutes * 60, args.dt)
+        real = time.perf_counter() - start
+
+        # só o custo dos timers por quadro: a consulta antiga × run_due sem nada vencido
+        legacy = LegacyTimers()
+        old = []
+        for _ in range(frames):
+            t = time.perf_counter()
+            legacy.update()
+            old.append(time.perf_counter() - t)
+        new = []
+        for _ in range(min(frames, 10000)):
+            t = time.perf_counter()
+            g.timers.run_due()
+            new.append(time.perf_counter() - t)
+
+        s = {kind: len(log) for kind, log in g.spawned.items()}
+        ls = legacy.spawned
+        print(f"{minutes:>8g} {real:>9.2f} {minutes * 60 / real:>13.0f} {s['wall']:>8} {s['special']:>10} "
+              f"{s['ghost']:>10} {ls['wall']:>5}/{ls['special']:>3}/{ls['ghost']:>3} "
+              f"{statistics.fmean(old) * 1e6:>20.2f} {statistics.fmean(new) * 1e6:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""Placar do Pacubos: JSON lido a cada quadro × placar em memória.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.pacubos_leaderboard [--frames N] [--scores N]
+
+Monta o jogo sem janela com um ``leaderboard.json`` temporário de dez
+entradas (o do jogo não é tocado) e desenha ``--frames`` quadros. A versão
+antiga faz o que o ``draw`` fazia: abre e lê o JSON e renderiza as dez linhas a
+cada quadro. A nova usa ``Leaderboard`` (lido uma vez) e a superfície do placar
+em cache. Para cada uma mostra o tempo médio do quadro e só do placar
+(``draw_leaderboard``), os arquivos abertos por quadro (contados por um audit hook) e as chamadas de sistema de leitura e
+escrita por quadro (de ``/proc/self/io``, quando existe). Depois mede quanto o
+laço principal fica parado ao registrar ``--scores`` pontuações: antes a
+gravação era feita na hora, agora vai para uma thread.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join('games', 'Pacubos')))
+
+import main as pacubos
+from leaderboard import Leaderboard
+
+OPENS = [0]
+
+
+def count_opens(event, args):
+    if event == 'open':
+        OPENS[0] += 1
+
+
+def io_syscalls():
+    # chamadas read/write do processo até agora, ou None fora do Linux
+    try:
+        with open('/proc/self/io') as f:
+            fields = dict(line.split(': ') for line in f.read().splitlines())
+        return int(fields['syscr']) + int(fields['syscw'])
+    except OSError:
+        return None
+
+
+# ---------- versão antiga (cópia de antes) ----------
+
+def legacy_load(path):
+    try:
+        if os.path.isfile(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except Exception:
+        pass
+    return []
+
+
+def legacy_add_score(path, name, score, elapsed):
+    board = legacy_load(path)
+    board.append({'name': name, 'score': int(score), 'time': int(elapsed)})
+    board = sorted(board, key=lambda x: x['score'], reverse=True)[:10]
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(board, f, ensure_ascii=False, indent=2)
+    except Exception:
+        pass
+    return board
+
+
+class LegacyGame(pacubos.PacubosGame):
+    def draw_leaderboard(self):
+        board = legacy_load(pacubos.LEADERBOARD_FILE)
+        x = pacubos.SCREEN_WIDTH - 220
+        y = 80
+        head = self.font.render('Top 10', True, (220, 220, 220))
+        self.screen.blit(head, (x, y))
+        y += 30
+        for i, e in enumerate(board):
+            line = self.font.render(f"{i+1}. {e['name']} {e['score']} ({e['time']}s)", True, (200, 200, 200))
+            self.screen.blit(line, (x, y))
+            y += 22
+
+
+# ---------- medições ----------
+
+def run_frames(game, frames):
+    times = []
+    opens = OPENS[0]
+    syscalls = io_syscalls()
+    for _ in range(frames):
+        start = time.perf_counter()
+        game.draw()
+        times.append(time.perf_counter() - start)
+    opens = (OPENS[0] - opens) / frames
+    if syscalls is not None:
+        # desconta a leitura do próprio /proc/self/io
+        syscalls = (io_syscalls() - syscalls - 1) / frames
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.draw_leaderboard()
+    board = (time.perf_counter() - start) / frames
+    return statistics.fmean(times) * 1000, board * 1000, opens, syscalls
+
+
+def run_scores(add, scores, rng):
+    # tempo que cada registro de pontuação segura o laço principal
+    times = []
+    for i in range(scores):
+        start = time.perf_counter()
+        add(f"J{i % 100:02d}", rng.randint(0, 5000), rng.randint(0, 600))
+        times.append(time.perf_counter() - start)
+    return statistics.fmean(times) * 1000, max(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--scores', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    sys.addaudithook(count_opens)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'leaderboard.json')
+        entries = [{'name': f"J{i:02d}", 'score': rng.randint(0, 5000), 'time': rng.randint(0, 600)} for i in range(10)]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(sorted(entries, key=lambda e: e['score'], reverse=True), f)
+        pacubos.LEADERBOARD_FILE = path
+
+        print(f"{args.frames} quadros, placar com {len(entries)} entradas")
+        print(f"{'versão':<8} {'quadro (ms)':>12} {'placar (ms)':>12} {'arquivos/quadro':>16} {'syscalls r/w por quadro':>24}")
+        for name, cls in (('antiga', LegacyGame), ('nova', pacubos.PacubosGame)):
+            mean, board, opens, syscalls = run_frames(cls(), args.frames)
+            syscalls = '-' if syscalls is None else f"{syscalls:.1f}"
+            print(f"{name:<8} {mean:>12.3f} {board:>12.3f} {opens:>16.1f} {syscalls:>24}")
+
+        board = Leaderboard(path)
+        print(f"\n{args.scores} pontuações registradas")
+        print(f"{'versão':<8} {'média (ms)':>11} {'pior (ms)':>10}")
+        mean, worst = run_scores(lambda *a: legacy_add_score(path, *a), args.scores, rng)
+        print(f"{'antiga':<8} {mean:>11.3f} {worst:>10.3f}")
+        mean, worst = run_scores(board.add, args.scores, rng)
+        board.flush()
+        print(f"{'nova':<8} {mean:>11.3f} {worst:>10.3f}")
+
+        with open(path, encoding='utf-8') as f:
+            saved = json.load(f)
+        if saved != board.entries:
+            print("ERRO: o placar gravado não bate com o da memória")
+            sys.exit(1)
+        print(f"gravações em segundo plano: {board.writes} (pedidos juntados enquanto uma gravação rodava)")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
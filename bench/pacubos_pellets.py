@@ -0,0 +1,137 @@
+"""Pastilhas do Pacubos: lista de tuplas × grade com camada de fundo.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.pacubos_pellets [--sizes 800x600,1920x1080,3840x2160] [--spacings 36,12]
+
+Para cada resolução e espaçamento enche a tela de pastilhas como o jogo e faz
+o player andar por ``--frames`` quadros, sem janela. A versão antiga faz o que
+``update``/``draw`` faziam: testa a distância de todas as pastilhas da lista,
+tira as comidas com ``list.remove`` e desenha um ``pygame.draw.circle`` por
+pastilha a cada quadro. A nova usa ``PelletField``: só as células sob o player
+são testadas e o desenho é um blit da camada já pintada. Antes de medir,
+confere que as duas comem as mesmas pastilhas e deixam a tela igual.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join('games', 'Pacubos')))
+
+from main import MARGIN, PELLET_RADIUS, PELLET_COLOR, BG_COLOR, PLAYER_SIZE, PLAYER_SPEED
+from pellets import PelletField
+
+BUDGET_MS = 1000 / 60
+
+
+class LegacyPellets:
+    # a lista e os laços de antes de PacubosGame, com a tela como parâmetro
+
+    def __init__(self, width, height, spacing):
+        self.pellets = []
+        for x in range(MARGIN, width - MARGIN, spacing):
+            for y in range(MARGIN, height - MARGIN, spacing):
+                dx = x - width // 2
+                dy = y - height // 2
+                if abs(dx) < 40 and abs(dy) < 40:
+                    continue
+                self.pellets.append((x, y))
+
+    def __len__(self):
+        return len(self.pellets)
+
+    def eat(self, px1, py1, reach):
+        to_remove = []
+        eaten = 0
+        for p in self.pellets:
+            dx = px1 - p[0]
+            dy = py1 - p[1]
+            if dx*dx + dy*dy < reach**2:
+                to_remove.append(p)
+                eaten += 1
+        for r in to_remove:
+            if r in self.pellets:
+                self.pellets.remove(r)
+        return eaten
+
+    def draw(self, screen):
+        screen.fill(BG_COLOR)
+        for p in self.pellets:
+            pygame.draw.circle(screen, PELLET_COLOR, (int(p[0]), int(p[1])), PELLET_RADIUS)
+
+
+def player_walk(width, height, frames, seed):
+    # o player anda em linha reta e troca de direção ao acaso ou na borda
+    rng = random.Random(seed)
+    x, y = width / 2, height / 2
+    vx, vy = PLAYER_SPEED, 0.0
+    path = []
+    for _ in range(frames):
+        if rng.random() < 0.02 or not (0 <= x + vx <= width - PLAYER_SIZE and 0 <= y + vy <= height - PLAYER_SIZE):
+            vx, vy = rng.choice(((PLAYER_SPEED, 0.0), (-PLAYER_SPEED, 0.0), (0.0, PLAYER_SPEED), (0.0, -PLAYER_SPEED)))
+        x = max(0, min(x + vx, width - PLAYER_SIZE))
+        y = max(0, min(y + vy, height - PLAYER_SIZE))
+        path.append((x + PLAYER_SIZE / 2, y + PLAYER_SIZE / 2))
+    return path
+
+
+def run(screen, pellets, walk):
+    times = []
+    eaten = 0
+    for px, py in walk:
+        start = time.perf_counter()
+        eaten += pellets.eat(px, py, PLAYER_SIZE / 2 + PELLET_RADIUS)
+        pellets.draw(screen)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return statistics.fmean(times) * 1000, times[int(len(times) * 0.95)] * 1000, eaten
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='800x600,1920x1080,3840x2160')
+    parser.add_argument('--spacings', default='36,12')
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--legacy-frames', type=int, default=30, help='quadros da versão antiga (é lenta)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    print(f"{args.frames} quadros (antiga: {args.legacy_frames}), orçamento {BUDGET_MS:.1f} ms")
+    print(f"{'tela':>10} {'espaço':>7} {'pastilhas':>10} {'antiga média (ms)':>18} "
+          f"{'nova média (ms)':>16} {'nova p95 (ms)':>14} {'montar (ms)':>12}")
+    for size in args.sizes.split(','):
+        width, height = (int(v) for v in size.split('x'))
+        screen = pygame.display.set_mode((width, height))
+        for spacing in (int(v) for v in args.spacings.split(',')):
+            walk = player_walk(width, height, args.frames, args.seed)
+
+            legacy = LegacyPellets(width, height, spacing)
+            total = len(legacy)
+            start = time.perf_counter()
+            field = PelletField(width, height, spacing, MARGIN, PELLET_RADIUS, PELLET_COLOR, BG_COLOR)
+            field.reset()
+            built = (time.perf_counter() - start) * 1000
+
+            old_mean, _, old_eaten = run(screen, legacy, walk[:args.legacy_frames])
+            old_screen = pygame.image.tobytes(screen, 'RGB')
+            _, _, new_eaten = run(screen, field, walk[:args.legacy_frames])
+            if new_eaten != old_eaten or pygame.image.tobytes(screen, 'RGB') != old_screen:
+                print(f"ERRO: {size} com espaço {spacing}: a grade não bate com a lista")
+                sys.exit(1)
+            field.reset()
+            new_mean, new_p95, _ = run(screen, field, walk)
+            print(f"{size:>10} {spacing:>7} {total:>10} {old_mean:>18.2f} {new_mean:>16.2f} {new_p95:>14.2f} {built:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+"""Churn de projéteis em fase de bullet-hell: alocar por tiro × pool.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.projectile_churn [--seconds N] [--shots N] [--ttl N]
+
+Simula ``--seconds`` segundos a 60 quadros por segundo disparando ``--shots``
+projéteis por quadro, cada um vivendo ``--ttl`` quadros, com as classes reais
+do Rogue-like (``bossProjectile``), do Ageo (``Bullet``) e do SurvivorsGeometry
+(``BulletStore``). A versão "antes" cria um objeto por tiro como os jogos
+faziam; a "depois" usa ``hub.projectiles.ProjectilePool`` (ou o armazenamento
+em colunas, no SurvivorsGeometry). Para cada uma mostra os objetos de projétil
+criados por segundo de jogo, quantas coletas o GC fez e o tempo total parado
+nelas.
+"""
+import argparse
+import gc
+import importlib.util
+import math
+import os
+import sys
+import time
+from collections import deque
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+from hub.projectiles import ProjectilePool
+
+FPS = 60
+W, H = 1280, 720
+
+
+def load_module(name, path, search_dir=None):
+    if search_dir is not None and search_dir not in sys.path:
+        sys.path.insert(0, search_dir)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class GCWatch:
+    def __init__(self):
+        self.collections = 0
+        self.paused = 0.0
+        self.started = None
+
+    def __call__(self, phase, info):
+        if phase == 'start':
+            self.started = time.perf_counter()
+        elif self.started is not None:
+            self.paused += time.perf_counter() - self.started
+            self.collections += 1
+            self.started = None
+
+    def __enter__(self):
+        gc.collect()
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        gc.callbacks.remove(self)
+
+
+def ring(frame, shots):
+    # direções de um anel de tiros que gira a cada quadro
+    for i in range(shots):
+        angle = i * math.tau / shots + frame * 0.1
+        yield math.cos(angle), math.sin(angle), math.degrees(angle)
+
+
+def simulate(spawn, move, expire, args):
+    frames = args.seconds * FPS
+    alive = deque()
+    for frame in range(frames):
+        for dx, dy, degrees in ring(frame, args.shots):
+            alive.append((frame, spawn(dx, dy, degrees)))
+        move()
+        while alive and frame - alive[0][0] >= args.ttl:
+            expire(alive.popleft()[1])
+
+
+def rogue_like(args, pooled):
+    projectile = load_module(
+        'rogue_projectile', os.path.join('games', 'Rogue-like', 'entities', 'projectile.py'),
+        os.path.abspath(os.path.join('games', 'Rogue-like')),
+    )
+    live = set()
+    if pooled:
+        pool = ProjectilePool(projectile.bossProjectile, projectile.BOSS_PROJECTILE_POOL_SIZE)
+
+        def spawn(dx, dy, degrees):
+            p = pool.acquire(W / 2, H / 2, amplitude=1200, dir_x=dx, dir_y=dy, speed=120)
+            live.add(p)
+            return p
+
+        def expire(p):
+            live.discard(p)
+            pool.release(p)
+    else:
+        def spawn(dx, dy, degrees):
+            p = projectile.bossProjectile(W / 2, H / 2, amplitude=1200, dir_x=dx, dir_y=dy, speed=120)
+            live.add(p)
+            return p
+
+        expire = live.discard
+
+    def move():
+        # speed e amplitude em px/s: 120 e 1200 são os 2 e 20 px por quadro de antes
+        for p in live:
+            p.move(1 / FPS)
+
+    simulate(spawn, move, expire, args)
+    shots = args.seconds * FPS * args.shots
+    return (pool.capacity + pool.overflow) if pooled else shots
+
+
+def ageo(args, pooled):
+    game = load_module('ageo_main', os.path.join('games', 'Ageo', 'main.py'))
+
+    class LegacyBullet(game.Bullet):
+        # como o Ageo criava o tiro antes do pool: um Bullet e um Vector2 novos
+        def __init__(self, pos, vel):
+            self.pos = pygame.Vector2(pos)
+            self.vel = pygame.Vector2(vel)
+            self.life = 1.5
+
+    ship_pos = pygame.Vector2(W / 2, H / 2)
+    live = set()
+    if pooled:
+        pool = ProjectilePool(game.Bullet, game.BULLET_POOL_SIZE)
+
+        def spawn(dx, dy, degrees):
+            b = pool.acquire(ship_pos, game.BULLET_SPEED, degrees)
+            live.add(b)
+            return b
+
+        def expire(b):
+            live.discard(b)
+            pool.release(b)
+    else:
+        def spawn(dx, dy, degrees):
+            b = LegacyBullet(ship_pos, pygame.Vector2(dx, dy) * game.BULLET_SPEED)
+            live.add(b)
+            return b
+
+        expire = live.discard
+
+    def move():
+        for b in live:
+            b.update(1 / FPS, W, H)
+
+    simulate(spawn, move, expire, args)
+    shots = args.seconds * FPS * args.shots
+    return (pool.capacity + pool.overflow) if pooled else shots
+
+
+def survivors(args, pooled):
+    # Aqui as balas expiram sozinhas pelo tempo de vida, como no jogo.
+    from bench.survivors_entities import LegacyBullet
+
+    entities = load_module('survivors_entities', os.path.join('games', 'SurvivorsGeometry', 'entities.py'))
+    life = args.ttl / FPS
+    if pooled:
+        store = entities.BulletStore(args.shots * (args.ttl + 1))
+
+        def spawn(dx, dy, degrees):
+            return store.spawn(W / 2, H / 2, (dx, dy), speed=60, life=life)
+
+        def move():
+            store.integrate(1 / FPS, W, H)
+
+        simulate(spawn, move, lambda i: None, args)
+        return 0
+
+    live = []
+
+    def spawn(dx, dy, degrees):
+        b = LegacyBullet(W / 2, H / 2, (dx, dy), speed=60, life=life)
+        live.append(b)
+        return b
+
+    def move():
+        for b in live:
+            b.update(1 / FPS)
+        live[:] = [b for b in live if b.alive()]
+
+    simulate(spawn, move, lambda b: None, args)
+    return args.seconds * FPS * args.shots
+
+
+GAMES = (('Rogue-like', rogue_like), ('Ageo', ageo), ('SurvivorsGeometry', survivors))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seconds', type=int, default=30)
+    parser.add_argument('--shots', type=int, default=8, help='tiros por quadro')
+    parser.add_argument('--ttl', type=int, default=120, help='vida de cada tiro, em quadros')
+    args = parser.parse_args()
+
+    print(f"{args.seconds}s a {FPS} FPS, {args.shots} tiros/quadro, vida de {args.ttl} quadros")
+    print(f"{'jogo':<18} {'versão':<7} {'objetos/s':>10} {'coletas GC':>11} {'pausa GC (ms)':>14} {'tempo (s)':>10}")
+    for name, run in GAMES:
+        for pooled in (False, True):
+            with GCWatch() as watch:
+                start = time.perf_counter()
+                created = run(args, pooled)
+                elapsed = time.perf_counter() - start
+            label = 'depois' if pooled else 'antes'
+            print(f"{name:<18} {label:<7} {created / args.seconds:>10.0f} {watch.collections:>11} "
+                  f"{watch.paused * 1000:>14.2f} {elapsed:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""Quadro do Rogue-like com muitos inimigos: laço antigo × HUD em cache e rects fixos.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.roguelike_frame [--enemies N] [--frames N] [--seed N]
+
+Monta a mesma fase com ``--enemies`` inimigos (100 por padrão) para as duas
+versões e roda ``--frames`` quadros sem janela e sem limite de FPS, com o
+jogador imortal. A versão antiga reproduz o laço de ``main.py`` de antes: um
+``SysFont`` e três textos renderizados por quadro, um ``pygame.Rect`` novo por
+par inimigo × tiro e remoção das listas durante o laço. A nova usa ``Hud``,
+os rects das entidades e ``core.collision``. Mostra o tempo médio e o p95 do
+quadro.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import types
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join('games', 'Rogue-like')))
+
+from settings import WIDTH, HEIGHT, TICK_RATE, PROJECTILE_TTL
+from entities.player import Player
+from entities.enemy import Enemy
+from entities.projectile import projectile_pool, ProjectileManager
+from core.collision import hits, hit_enemies
+from ui.hud import Hud
+
+DT = 1 / TICK_RATE
+
+
+def make_state(window, enemies, seed):
+    random.seed(seed)
+    projectile_pool.release_all()
+    player = Player(WIDTH // 2, HEIGHT // 2)
+    player.hp = 10 ** 9
+    return types.SimpleNamespace(
+        window=window, player=player, score=0, hud=Hud(),
+        enemies=[Enemy() for _ in range(enemies)],
+        projectiles=ProjectileManager(projectile_pool, PROJECTILE_TTL),
+        enemy_projectiles=ProjectileManager(projectile_pool, PROJECTILE_TTL),
+    )
+
+
+def move_everything(s):
+    s.window.fill((20, 20, 20))
+    s.player.auto_shoot(s.projectiles, s.enemies, None)
+    s.player.update_cooldown(DT)
+    s.player.draw(s.window)
+
+
+def legacy_frame(s):
+    move_everything(s)
+    for e in s.enemies:
+        e.follow(s.player, DT)
+        e.shoot(s.player, s.enemy_projectiles, DT)
+        e.draw(s.window)
+        for p in s.projectiles:
+            if pygame.Rect(p.x, p.y, 6, 6).colliderect(pygame.Rect(e.x, e.y, 35, 35)):
+                e.hp -= 1
+                s.projectiles.kill(p)
+                # o laço antigo quebrava ao remover o mesmo inimigo duas vezes
+                if e.hp <= 0 and e in s.enemies:
+                    s.enemies.remove(e)
+                    s.score += 1
+    s.projectiles.update(DT)
+    s.projectiles.draw(s.window)
+    s.enemy_projectiles.update(DT)
+    s.enemy_projectiles.draw(s.window)
+    for ep in s.enemy_projectiles:
+        if pygame.Rect(ep.x, ep.y, 6, 6).colliderect(pygame.Rect(s.player.x, s.player.y, 40, 40)):
+            s.player.hp -= 1
+            s.enemy_projectiles.kill(ep)
+    font = pygame.font.SysFont('arial', 24)
+    s.window.blit(font.render(f'vida : {s.player.hp}', True, (255, 0, 0)), (10, 10))
+    s.window.blit(font.render(f'pontos : {s.score}', True, (255, 255, 0)), (10, 40))
+    s.window.blit(font.render('use O para acelerar', True, (0, 0, 255)), (WIDTH // 2, 10))
+
+
+def frame(s):
+    move_everything(s)
+    for e in s.enemies:
+        e.follow(s.player, DT)
+        e.shoot(s.player, s.enemy_projectiles, DT)
+        e.draw(s.window)
+    s.score += hit_enemies(s.projectiles, s.enemies)
+    s.projectiles.update(DT)
+    s.projectiles.draw(s.window)
+    s.enemy_projectiles.update(DT)
+    s.enemy_projectiles.draw(s.window)
+    spent = hits(s.player.rect, s.enemy_projectiles)
+    s.player.hp -= len(spent)
+    s.enemy_projectiles.kill_many(set(spent))
+    s.hud.draw(s.window, s.player.hp, s.score)
+
+
+def run(window, step, args):
+    state = make_state(window, args.enemies, args.seed)
+    times = []
+    for _ in range(args.frames):
+        start = time.perf_counter()
+        step(state)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return statistics.fmean(times) * 1000, times[int(len(times) * 0.95)] * 1000, state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--enemies', type=int, default=100)
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    window = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    print(f"{args.enemies} inimigos, {args.frames} quadros")
+    print(f"{'versão':<8} {'média (ms)':>11} {'p95 (ms)':>9} {'inimigos no fim':>16}")
+    results = {}
+    for name, step in (('antiga', legacy_frame), ('nova', frame)):
+        mean, p95, state = run(window, step, args)
+        results[name] = mean
+        print(f"{name:<8} {mean:>11.3f} {p95:>9.3f} {len(state.enemies):>16}")
+    print(f"Aceleração: {results['antiga'] / results['nova']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""Soak da luta contra o boss do Rogue-like: tempo de quadro ao longo da sessão.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.roguelike_soak [--minutes N] [--window N] [--legacy]
+
+Simula ``--minutes`` minutos de jogo (30 por padrão) em passos fixos de
+``1 / TICK_RATE`` segundos, sem esperar o relógio: um quadro por passo. O
+boss dispara o anel de 8 tiros a cada segundo, os 10 inimigos atiram no
+jogador e o jogador atira de volta. O jogador não toma dano, então a luta não
+acaba. A cada ``--window`` minutos mostra o tempo médio e o p95 do quadro
+(tiros + desenho) e quantos tiros estão vivos; no fim compara a última janela
+com a primeira. ``--legacy`` só move os tiros, sem descartar os que saem da
+tela ou expiram, como o jogo fazia antes do ``ProjectileManager`` (use poucos
+minutos: o tempo de quadro cresce sem limite).
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join('games', 'Rogue-like')))
+
+from settings import WIDTH, HEIGHT, TICK_RATE, PROJECTILE_TTL, BOSS_PROJECTILE_TTL
+from entities.player import Player
+from entities.enemy import Enemy
+from entities.boss import Boss
+from entities.projectile import projectile_pool, boss_projectile_pool, ProjectileManager
+
+DRIFT_LIMIT = 1.5
+
+
+class LegacyProjectiles(ProjectileManager):
+    # comportamento antigo: os tiros só saem da lista quando acertam algo
+    def update(self, dt):
+        for p in self.items:
+            p.move(dt)
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--minutes', type=float, default=30)
+    parser.add_argument('--window', type=float, default=5, help='minutos por linha da tabela')
+    parser.add_argument('--legacy', action='store_true')
+    args = parser.parse_args()
+
+    pygame.init()
+    window = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    manager = LegacyProjectiles if args.legacy else ProjectileManager
+    projectiles = manager(projectile_pool, PROJECTILE_TTL)
+    enemy_projectiles = manager(projectile_pool, PROJECTILE_TTL)
+    boss_projectiles = manager(boss_projectile_pool, BOSS_PROJECTILE_TTL)
+    groups = (projectiles, enemy_projectiles, boss_projectiles)
+
+    player = Player(400, 500)
+    enemies = [Enemy() for _ in range(10)]
+    boss = Boss()
+
+    dt = 1 / TICK_RATE
+    frames = int(args.minutes * 60 * TICK_RATE)
+    per_window = max(1, int(args.window * 60 * TICK_RATE))
+    rows = []
+    times = []
+    for frame in range(1, frames + 1):
+        start = time.perf_counter()
+
+        window.fill((20, 20, 20))
+        player.auto_shoot(projectiles, enemies, boss)
+        player.update_cooldown(dt)
+        player.draw(window)
+        for e in enemies:
+            e.shoot(player, enemy_projectiles, dt)
+            e.draw(window)
+        boss.draw(window)
+        boss.shoot(boss_projectiles, dt)
+        for group in groups:
+            group.update(dt)
+            group.draw(window)
+
+        times.append(time.perf_counter() - start)
+        if frame % per_window == 0 or frame == frames:
+            rows.append((frame / TICK_RATE / 60, statistics.fmean(times) * 1000,
+                         percentile(times, 0.95) * 1000, sum(len(g) for g in groups)))
+            times = []
+
+    label = 'sem descarte (antigo)' if args.legacy else 'ProjectileManager'
+    print(f"{args.minutes:g} minutos simulados a {TICK_RATE} passos/s, {label}")
+    print(f"{'até (min)':>10} {'média (ms)':>11} {'p95 (ms)':>9} {'tiros vivos':>12}")
+    for minute, mean, p95, alive in rows:
+        print(f"{minute:>10.1f} {mean:>11.3f} {p95:>9.3f} {alive:>12}")
+    if not args.legacy:
+        print(f"Descartados fora da tela: {sum(g.culled for g in groups)}, "
+              f"expirados: {sum(g.expired for g in groups)}")
+        print(f"Pool dos tiros: {projectile_pool.stats()}")
+        print(f"Pool do boss: {boss_projectile_pool.stats()}")
+
+    drift = rows[-1][1] / rows[0][1]
+    print(f"Última janela / primeira: {drift:.2f}x")
+    if not args.legacy and drift > DRIFT_LIMIT:
+        print(f"ERRO: o tempo de quadro cresceu mais de {DRIFT_LIMIT}x ao longo da sessão")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""Colisão bala × inimigo do SurvivorsGeometry: laço ingênuo × grade espacial.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.survivors_collision [--bullets N] [--enemies N] [--repeats N]
+
+Monta o mesmo cenário aleatório para as duas versões e mede só a passada de
+colisão. A versão ingênua reproduz o laço antigo do ``Game.update`` (todos os
+pares, ``math.hypot`` e ``list.remove`` sobre as classes antigas); a nova usa
+``Game.index_bullets`` e ``Game.hit_targets`` sobre o armazenamento em colunas.
+Os resultados das duas são comparados antes de medir.
+"""
+import argparse
+import math
+import os
+import random
+import runpy
+import sys
+import time
+import types
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from bench.survivors_entities import LegacyBullet, LegacyMinion
+
+GAME_DIR = os.path.join('games', 'SurvivorsGeometry')
+
+
+def load_game():
+    sys.path.insert(0, os.path.abspath(GAME_DIR))
+    return runpy.run_path(os.path.join(GAME_DIR, 'main.py'), run_name='bench')
+
+
+def scene(game, bullets, enemies, seed):
+    rng = random.Random(seed)
+    W, H = game['W'], game['H']
+    shots = []
+    for _ in range(bullets):
+        ang = rng.uniform(0, math.tau)
+        shots.append((rng.uniform(0, W), rng.uniform(0, H), (math.cos(ang), math.sin(ang)), rng.random() < 0.1))
+    targets = [(rng.uniform(0, W), rng.uniform(0, H), rng.randint(1, 8)) for _ in range(enemies)]
+    return shots, targets
+
+
+def make_naive(game, bullets, enemies, seed):
+    shots, targets = scene(game, bullets, enemies, seed)
+    state = types.SimpleNamespace(bullets=[], enemies=[], player=types.SimpleNamespace(kills=0))
+    for x, y, d, piercing in shots:
+        b = LegacyBullet(x, y, d)
+        b.damage = 16
+        b.piercing = piercing
+        state.bullets.append(b)
+    for x, y, phase in targets:
+        state.enemies.append(LegacyMinion(x, y, phase=phase))
+    return state
+
+
+def make_game(game, bullets, enemies, seed):
+    shots, targets = scene(game, bullets, enemies, seed)
+    state = game['Game']()
+    state.player.x, state.player.y = -1000, -1000
+    state.bullets = game['BulletStore'](bullets)
+    state.enemies = game['MinionStore'](enemies)
+    for x, y, d, piercing in shots:
+        b = state.bullets.spawn(x, y, d, damage=16)
+        state.bullets.piercing[b] = piercing
+    for x, y, phase in targets:
+        state.enemies.spawn(x, y, phase=phase)
+    return state
+
+
+def naive_pass(state):
+    for e in list(state.enemies):
+        for b in list(state.bullets):
+            if (not getattr(b, "laser", False)) and b.friendly and math.hypot(b.x - e.x, b.y - e.y) < e.size + b.radius:
+                e.hp -= int(b.damage)
+                if not b.piercing:
+                    try: state.bullets.remove(b)
+                    except: pass
+        if e.hp <= 0:
+            try: state.enemies.remove(e)
+            except: pass
+            state.player.kills += 1
+
+
+def grid_pass(state):
+    spent = state.index_bullets()
+    state.hit_targets(state.enemies, spent)
+    state.bullets.release_all(spent)
+
+
+def naive_outcome(state):
+    return (
+        [(e.x, e.y, e.hp) for e in state.enemies],
+        sorted((b.x, b.y) for b in state.bullets),
+        state.player.kills,
+    )
+
+
+def grid_outcome(state):
+    enemies, bullets = state.enemies, state.bullets
+    return (
+        [(float(enemies.x[i]), float(enemies.y[i]), float(enemies.hp[i])) for i in enemies.slots()],
+        sorted((float(bullets.x[i]), float(bullets.y[i])) for i in bullets.slots()),
+        state.player.kills,
+    )
+
+
+def timed(game, make, collide, args):
+    times = []
+    for repeat in range(args.repeats):
+        state = make(game, args.bullets, args.enemies, seed=repeat)
+        start = time.perf_counter()
+        collide(state)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000, sum(times) / len(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bullets', type=int, default=2000)
+    parser.add_argument('--enemies', type=int, default=500)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    game = load_game()
+
+    naive_state = make_naive(game, args.bullets, args.enemies, seed=0)
+    grid_state = make_game(game, args.bullets, args.enemies, seed=0)
+    naive_pass(naive_state)
+    grid_pass(grid_state)
+    if naive_outcome(naive_state) != grid_outcome(grid_state):
+        print("ERRO: a grade e o laço ingênuo chegaram a resultados diferentes")
+        sys.exit(1)
+
+    print(f"{args.bullets} balas × {args.enemies} inimigos, {args.repeats} repetições")
+    print(f"{'versão':<10} {'mín (ms)':>10} {'média (ms)':>11}")
+    naive_min, naive_avg = timed(game, make_naive, naive_pass, args)
+    print(f"{'ingênua':<10} {naive_min:>10.2f} {naive_avg:>11.2f}")
+    grid_min, grid_avg = timed(game, make_game, grid_pass, args)
+    print(f"{'grade':<10} {grid_min:>10.2f} {grid_avg:>11.2f}")
+    print(f"Aceleração: {naive_avg / grid_avg:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+"""Balas e minions do SurvivorsGeometry: classes antigas × armazenamento em colunas.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.survivors_entities [--count N] [--repeats N] [--no-numpy]
+
+Mede a memória por bala (tracemalloc, incluindo a lista/free-list) e o tempo de
+um tick de movimento e tempo de vida para ``--count`` balas e minions. As
+classes ``LegacyBullet``/``LegacyMinion`` reproduzem as que o jogo usava antes
+de ``entities.py``. ``--no-numpy`` força o caminho sem NumPy.
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join('games', 'SurvivorsGeometry')))
+
+import entities
+
+W, H = 1280, 720
+
+
+def normalize(v):
+    l = math.hypot(v[0], v[1])
+    if l == 0:
+        return (0, 0)
+    return (v[0]/l, v[1]/l)
+
+
+class LegacyBullet:
+    def __init__(self, x, y, dirv, speed=640, life=2.0, friendly=True):
+        self.x = x
+        self.y = y
+        self.dirv = dirv
+        self.speed = speed
+        self.life = life
+        self.radius = 5
+        self.friendly = friendly
+        self.piercing = False
+        self.damage = 14
+        self.laser = getattr(self, "laser", False)
+        self.beam_length = getattr(self, "beam_length", 0)
+        self.hit_done = getattr(self, "hit_done", False)
+
+    def update(self, dt):
+        if not getattr(self, "laser", False):
+            self.x += self.dirv[0]*self.speed*dt
+            self.y += self.dirv[1]*self.speed*dt
+        self.life -= dt
+
+    def alive(self):
+        return self.life > 0 and (-40 <= self.x <= W+40 and -40 <= self.y <= H+40)
+
+
+class LegacyMinion:
+    def __init__(self, x, y, phase=1):
+        self.x = x
+        self.y = y
+        self.size = 14 + int(phase*0.8)
+        self.speed = random.uniform(70 + phase*4, 140 + phase*6)
+        self.hp = 18 + phase*4
+        self.phase = phase
+
+    def update(self, dt, player):
+        dirv = normalize((player.x - self.x, player.y - self.y))
+        self.x += dirv[0]*self.speed*dt
+        self.y += dirv[1]*self.speed*dt
+
+
+class Player:
+    x = W / 2
+    y = H / 2
+
+
+def bullet_params(count, seed):
+    rng = random.Random(seed)
+    params = []
+    for _ in range(count):
+        ang = rng.uniform(0, math.tau)
+        params.append((rng.uniform(0, W), rng.uniform(0, H), (math.cos(ang), math.sin(ang))))
+    return params
+
+
+def legacy_bullets(params):
+    return [LegacyBullet(x, y, d) for x, y, d in params]
+
+
+def store_bullets(params):
+    store = entities.BulletStore(len(params))
+    for x, y, d in params:
+        store.spawn(x, y, d)
+    return store
+
+
+def legacy_minions(params):
+    return [LegacyMinion(x, y, phase=3) for x, y, _ in params]
+
+
+def store_minions(params):
+    store = entities.MinionStore(len(params))
+    for x, y, _ in params:
+        store.spawn(x, y, phase=3)
+    return store
+
+
+def legacy_bullet_tick(bullets, dt):
+    moving = []
+    for b in bullets:
+        b.update(dt)
+        if b.alive():
+            moving.append(b)
+    return moving
+
+
+def legacy_minion_tick(minions, dt):
+    player = Player()
+    for m in minions:
+        m.update(dt, player)
+    return minions
+
+
+def store_bullet_tick(store, dt):
+    store.integrate(dt, W, H)
+    return store
+
+
+def store_minion_tick(store, dt):
+    store.update(dt, Player.x, Player.y)
+    return store
+
+
+def measure_memory(build, params):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built = build(params)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return (after - before) / len(params)
+
+
+def measure_tick(build, tick, params, repeats):
+    times = []
+    for _ in range(repeats):
+        built = build(params)
+        start = time.perf_counter()
+        tick(built, 1 / 60)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--no-numpy', action='store_true')
+    args = parser.parse_args()
+
+    if args.no_numpy:
+        entities.np = None
+    backend = 'numpy' if entities.np is not None else 'array'
+
+    params = bullet_params(args.count, seed=0)
+
+    legacy = legacy_bullet_tick(legacy_bullets(params), 1 / 60)
+    store = store_bullet_tick(store_bullets(params), 1 / 60)
+    xs, ys = entities.to_list(store.x), entities.to_list(store.y)
+    if [(b.x, b.y) for b in legacy] != [(xs[i], ys[i]) for i in store.slots()]:
+        print("ERRO: as duas versões discordam depois de um tick")
+        sys.exit(1)
+
+    print(f"{args.count} entidades, colunas com {backend}, melhor de {args.repeats} ticks")
+    print(f"{'':<20} {'bytes/entidade':>15} {'tick (ms)':>10}")
+    rows = [
+        ('Bullet (classe)', legacy_bullets, legacy_bullet_tick),
+        ('BulletStore', store_bullets, store_bullet_tick),
+        ('Minion (classe)', legacy_minions, legacy_minion_tick),
+        ('MinionStore', store_minions, store_minion_tick),
+    ]
+    for name, build, tick in rows:
+        memory = measure_memory(build, params)
+        elapsed = measure_tick(build, tick, params, args.repeats)
+        print(f"{name:<20} {memory:>15.0f} {elapsed:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""Teste de acerto dos lasers do SurvivorsGeometry: laço antigo × NumPy × Python puro.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.survivors_laser [--lasers N] [--repeats N]
+
+Para cada quantidade de alvos dispara ``--lasers`` feixes aleatórios e mede o
+tempo do tick inteiro (montar os arrays, testar e aplicar o dano). A versão
+antiga chama ``point_line_distance`` por alvo e por feixe, como o
+``Game.update`` fazia; as outras usam ``laser.LaserTargets`` com e sem NumPy.
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join('games', 'SurvivorsGeometry')))
+
+import laser
+
+SIZES = (50, 500, 5000)
+PAD = 6
+
+
+class Target:
+    def __init__(self, x, y, size, hp):
+        self.x = x
+        self.y = y
+        self.size = size
+        self.hp = hp
+
+
+def point_line_distance(px, py, x1, y1, x2, y2):
+    vx, vy = x2 - x1, y2 - y1
+    wx, wy = px - x1, py - y1
+    c1 = vx*wx + vy*wy
+    if c1 <= 0:
+        return math.hypot(px-x1, py-y1), 0
+    c2 = vx*vx + vy*vy
+    if c2 <= c1:
+        return math.hypot(px-x2, py-y2), 1
+    b = c1 / c2
+    bx = x1 + b*vx
+    by = y1 + b*vy
+    return math.hypot(px-bx, py-by), b
+
+
+def make_scene(count, lasers, seed):
+    rng = random.Random(seed)
+    targets = [Target(rng.uniform(0, 1280), rng.uniform(0, 720), rng.randint(14, 60), 1000) for _ in range(count)]
+    beams = []
+    for _ in range(lasers):
+        x, y = rng.uniform(0, 1280), rng.uniform(0, 720)
+        ang = rng.uniform(0, math.tau)
+        beams.append((x, y, x + math.cos(ang) * 1920, y + math.sin(ang) * 1920, 120))
+    return targets, beams
+
+
+def old_tick(targets, beams):
+    for x1, y1, x2, y2, damage in beams:
+        for t in targets:
+            dist, u = point_line_distance(t.x, t.y, x1, y1, x2, y2)
+            if dist <= t.size + PAD and 0.0 <= u <= 1.0:
+                t.hp -= damage
+
+
+def batched_tick(use_numpy):
+    def tick(targets, beams):
+        field = laser.LaserTargets(
+            [t.x for t in targets], [t.y for t in targets], [t.size for t in targets],
+            PAD, use_numpy=use_numpy,
+        )
+        for x1, y1, x2, y2, damage in beams:
+            field.apply(x1, y1, x2, y2, damage)
+        for i, damage in field.damage_dealt():
+            targets[i].hp -= damage
+    return tick
+
+
+def timed(tick, count, args):
+    times = []
+    for repeat in range(args.repeats):
+        targets, beams = make_scene(count, args.lasers, seed=repeat)
+        start = time.perf_counter()
+        tick(targets, beams)
+        times.append(time.perf_counter() - start)
+    return sum(times) / len(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lasers', type=int, default=4)
+    parser.add_argument('--repeats', type=int, default=20)
+    args = parser.parse_args()
+
+    versions = [('antiga', old_tick), ('python', batched_tick(False))]
+    if laser.np is not None:
+        versions.append(('numpy', batched_tick(True)))
+    else:
+        print("NumPy não encontrado: medindo só o caminho em Python puro")
+
+    for count in SIZES:
+        results = []
+        for _, tick in versions:
+            targets, beams = make_scene(count, args.lasers, seed=0)
+            tick(targets, beams)
+            results.append([t.hp for t in targets])
+        if any(result != results[0] for result in results):
+            print(f"ERRO: as versões discordam com {count} alvos")
+            sys.exit(1)
+
+    print(f"{args.lasers} lasers por tick, {args.repeats} repetições (ms por tick)")
+    print(f"{'alvos':>6} " + " ".join(f"{name:>9}" for name, _ in versions))
+    for count in SIZES:
+        row = " ".join(f"{timed(tick, count, args):>9.3f}" for _, tick in versions)
+        print(f"{count:>6} {row}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+"""Caminho do TowerDefense: hypot até o próximo ponto × distância andada na tabela.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.towerdefense_path [--enemies 1000,5000,20000] [--segments 7,200] [--wave 10]
+
+Para o caminho do jogo (7 trechos) e para caminhos longos sorteados com
+``--segments`` trechos, espalha ``--enemies`` inimigos ao longo dele e mede,
+por quadro, sem janela:
+
+* andar todos os inimigos: a versão antiga (copiada abaixo) calcula o
+  ``hypot`` até o próximo ponto do ``PATH`` a cada quadro; a nova soma a
+  velocidade ao ``progress`` e tira a posição da reta do trecho, guardada da
+  tabela de ``Road``;
+* ordenar os inimigos do mais adiantado para o mais atrasado: antes pela
+  chave (ponto, distância até o próximo); agora pelo ``progress``;
+* pintar o fundo: duas ``pygame.draw.line`` por trecho × um blit da
+  superfície feita por ``Road.bake``.
+
+Antes de medir confere que o fundo pronto é igual ao desenhado, que o inimigo
+novo fica sempre em cima do caminho e chega ao fim em ``comprimento /
+velocidade`` quadros, e que as duas ordenações dão a mesma ordem. Também
+mostra em quantos quadros um inimigo da wave 30 atravessa o caminho do jogo:
+com o passo maior que 4 px, o antigo pode ficar indo e voltando numa curva.
+"""
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from operator import attrgetter
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join('games', 'TowerDefense')))
+
+from main import PATH, SCREEN, Enemy, width, height
+from road import Road
+
+GRASS = (30, 80, 30)
+
+
+class LegacyEnemy:
+    # o movimento de Enemy antes da tabela, com o caminho como parâmetro
+
+    def __init__(self, wave, path):
+        self.path = path
+        self.path_index = 0
+        self.x, self.y = path[0]
+        self.speed = 1.2 + (wave * 0.25)
+
+    def update(self):
+        if self.path_index >= len(self.path) - 1:
+            return True
+
+        tx, ty = self.path[self.path_index + 1]
+        dx = tx - self.x
+        dy = ty - self.y
+        dist = math.hypot(dx, dy)
+
+        if dist < 2:
+            self.path_index += 1
+            return False
+
+        self.x += (dx / dist) * self.speed
+        self.y += (dy / dist) * self.speed
+        return False
+
+    def ahead(self):
+        # chave para ordenar: mais adiantado primeiro
+        tx, ty = self.path[min(self.path_index + 1, len(self.path) - 1)]
+        return (-self.path_index, math.hypot(tx - self.x, ty - self.y))
+
+
+def legacy_road(surf, path):
+    surf.fill(GRASS)
+    for i in range(len(path)-1):
+        pygame.draw.line(surf, (120, 120, 120), path[i], path[i+1], 50)
+        pygame.draw.line(surf, (255, 255, 0), path[i], path[i+1], 4)
+
+
+def random_path(segments, rng):
+    # entra pela esquerda, passeia pela tela e sai pela direita
+    points = [(-40, rng.randint(60, height - 60))]
+    for _ in range(segments - 1):
+        points.append((rng.randint(60, width - 60), rng.randint(60, height - 60)))
+    points.append((width + 40, rng.randint(60, height - 60)))
+    return points
+
+
+def off_path(road, x, y):
+    # distância de (x, y) até a polilinha
+    best = math.inf
+    for (ax, ay), (bx, by) in zip(road.points, road.points[1:]):
+        vx, vy = bx - ax, by - ay
+        t = max(0.0, min(1.0, ((x - ax) * vx + (y - ay) * vy) / (vx * vx + vy * vy)))
+        best = min(best, math.hypot(ax + vx * t - x, ay + vy * t - y))
+    return best
+
+
+def crossing(enemy, limit=100000):
+    frames = 1
+    while not enemy.update():
+        frames += 1
+        if frames > limit:
+            return None
+    return frames
+
+
+def check(road, wave):
+    legacy_road(SCREEN, road.points)
+    if pygame.image.tobytes(SCREEN, 'RGB') != pygame.image.tobytes(road.bake((width, height), GRASS), 'RGB'):
+        print("ERRO: o fundo pronto não é igual à estrada desenhada")
+        sys.exit(1)
+    e = Enemy(wave, road)
+    frames = 1
+    while not e.update():
+        frames += 1
+        if off_path(road, e.x, e.y) > 1e-6:
+            print(f"ERRO: inimigo fora do caminho em ({e.x:.2f}, {e.y:.2f}), progress {e.progress:.2f}")
+            sys.exit(1)
+    if frames != math.ceil(road.length / e.speed):
+        print(f"ERRO: atravessou em {frames} quadros, esperava {math.ceil(road.length / e.speed)}")
+        sys.exit(1)
+
+
+def spread(wave, road, count, rng):
+    # os mesmos inimigos nas duas versões, espalhados pelo caminho
+    old, new = [], []
+    for _ in range(count):
+        e = Enemy(wave, road)
+        e.place(rng.uniform(0, road.length * 0.5))
+        l = LegacyEnemy(wave, road.points)
+        l.x, l.y, l.path_index = e.x, e.y, e.path_index
+        old.append(l)
+        new.append(e)
+    return old, new
+
+
+def per_frame(fn, frames):
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.fmean(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--enemies', default='1000,5000,20000')
+    parser.add_argument('--segments', default='7,200')
+    parser.add_argument('--wave', type=int, default=10)
+    parser.add_argument('--frames', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    game = Road(PATH)
+    fast_old = crossing(LegacyEnemy(30, PATH))
+    fast_new = crossing(Enemy(30, game))
+    print(f"wave 30 no caminho do jogo ({game.length:.0f} px): antiga "
+          f"{'não chega ao fim' if fast_old is None else f'{fast_old} quadros'}, nova {fast_new} quadros")
+
+    print(f"wave {args.wave}, {args.frames} quadros")
+    print(f"{'trechos':>8} {'inimigos':>9} {'andar antiga (ms)':>18} {'andar nova (ms)':>16} "
+          f"{'ordenar antiga (ms)':>20} {'ordenar nova (ms)':>18} {'estrada antiga (ms)':>20} {'fundo pronto (ms)':>18}")
+    for segments in (int(v) for v in args.segments.split(',')):
+        road = game if segments == len(PATH) - 1 else Road(random_path(segments, rng))
+        check(road, args.wave)
+        old_bg = per_frame(lambda: legacy_road(SCREEN, road.points), args.frames)
+        background = road.bake((width, height), GRASS)
+        new_bg = per_frame(lambda: SCREEN.blit(background, (0, 0)), args.frames)
+
+        for count in (int(v) for v in args.enemies.split(',')):
+            old, new = spread(args.wave, road, count, rng)
+            by_key = sorted(range(count), key=lambda i: old[i].ahead())
+            by_progress = sorted(range(count), key=lambda i: -new[i].progress)
+            if [new[i].progress for i in by_key] != [new[i].progress for i in by_progress]:
+                print(f"ERRO: {segments} trechos, {count} inimigos: as ordenações não batem")
+                sys.exit(1)
+            old_move = per_frame(lambda: [e.update() for e in old], args.frames)
+            new_move = per_frame(lambda: [e.update() for e in new], args.frames)
+            old_sort = per_frame(lambda: old.sort(key=LegacyEnemy.ahead), args.frames)
+            new_sort = per_frame(lambda: new.sort(key=attrgetter('progress'), reverse=True), args.frames)
+
+            print(f"{segments:>8} {count:>9} {old_move:>18.2f} {new_move:>16.2f} "
+                  f"{old_sort:>20.2f} {new_sort:>18.2f} {old_bg:>20.2f} {new_bg:>18.2f}")
+
+
+if __name__ == '__main__':
+    main()
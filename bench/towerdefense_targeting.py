@@ -0,0 +1,234 @@
+"""Alvos do TowerDefense: varrer a lista de inimigos × registro com grade.
+
+Uso (a partir da raiz do Hub)::
+
+    python -m bench.towerdefense_targeting [--cases 50x200,200x1000] [--wave 30] [--frames 300]
+
+Cada caso é ``torresxinimigos``: as torres ficam espalhadas ao longo do
+caminho e os inimigos da wave ``--wave`` entram num fluxo contínuo, na taxa
+que mantém uns ``inimigos`` na tela. Depois de o caminho encher, roda
+``--frames`` quadros das duas versões lado a lado, sem janela e sem desenhar.
+A versão antiga (copiada abaixo) faz o que o laço do jogo fazia: cada torre
+mede a distância de todos os inimigos, os mortos saem com ``list.remove`` e
+cada bala procura o alvo na lista (``b.target not in enemies``). A nova é
+``update_combat`` com o ``EnemyRegistry``.
+
+A cada quadro confere que as duas mataram e deixaram passar os mesmos
+inimigos, com as mesmas balas no ar; no fim, que ``first`` e ``strongest``
+do registro batem com uma busca por todos os inimigos. As colunas "mira"
+medem só a busca de alvo de todas as torres de uma vez, no último quadro.
+"""
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+sys.path.insert(0, os.path.abspath(os.path.join('games', 'TowerDefense')))
+
+from main import PATH, Enemy, Bullet, Tower, update_combat
+from targeting import EnemyRegistry
+
+BUDGET_MS = 1000 / 60
+
+
+class LegacyTower(Tower):
+    # Tower.update de antes: todos os inimigos, a cada tiro
+
+    def update(self, enemies, bullets):
+        if self.cool > 0:
+            self.cool -= 1
+            return
+
+        target = None
+        min_dist = 9999
+
+        for e in enemies:
+            dist = math.hypot(e.x - self.x, e.y - self.y)
+            if dist < min_dist and dist < self.range:
+                min_dist = dist
+                target = e
+
+        if target:
+            bullets.append(Bullet(self.x, self.y, target))
+            target.hp -= 10
+            self.cool = self.cooldown
+
+
+def legacy_combat(enemies, towers, bullets):
+    # os trechos "Inimigos", "Torres" e "Balas" do laço antigo
+    killed = escaped = 0
+    for e in enemies[:]:
+        reached_end = e.update()
+        if e.hp <= 0:
+            enemies.remove(e)
+            killed += 1
+        elif reached_end:
+            enemies.remove(e)
+            escaped += 1
+
+    for t in towers:
+        t.update(enemies, bullets)
+
+    for b in bullets[:]:
+        b.update()
+        if b.target not in enemies:
+            bullets.remove(b)
+            continue
+        if math.hypot(b.x - b.target.x, b.target.y - b.y) < 10:
+            bullets.remove(b)
+    return killed, escaped
+
+
+def tower_spots(count, rng):
+    # pontos sorteados ao longo do caminho, a até 120 px dele
+    segments = list(zip(PATH, PATH[1:]))
+    weights = [math.dist(a, b) for a, b in segments]
+    spots = []
+    for _ in range(count):
+        (ax, ay), (bx, by) = rng.choices(segments, weights)[0]
+        t = rng.random()
+        spots.append((int(ax + (bx - ax) * t + rng.uniform(-120, 120)),
+                      int(ay + (by - ay) * t + rng.uniform(-120, 120)),
+                      rng.randrange(41)))
+    return spots
+
+
+def crossing_frames(wave):
+    # quadros que um inimigo leva do começo ao fim do caminho
+    e = Enemy(wave)
+    frames = 1
+    while not e.update():
+        frames += 1
+        if frames > 100000:
+            sys.exit(f"ERRO: na wave {wave} o inimigo não chega ao fim do caminho")
+    return frames
+
+
+def spawn_plan(enemies, wave, frames):
+    # quantos inimigos entram em cada quadro para ficar uns 'enemies' no caminho
+    rate = enemies / crossing_frames(wave)
+    plan, acc = [], 0.0
+    for _ in range(frames):
+        acc += rate
+        plan.append(int(acc))
+        acc -= int(acc)
+    return plan
+
+
+def legacy_nearest(enemies, x, y, radius):
+    # a busca de LegacyTower.update, sem atirar
+    target = None
+    min_dist = 9999
+    for e in enemies:
+        dist = math.hypot(e.x - x, e.y - y)
+        if dist < min_dist and dist < radius:
+            min_dist = dist
+            target = e
+    return target
+
+
+def brute(enemies, x, y, radius, key):
+    best = None
+    for e in enemies:
+        if math.hypot(e.x - x, e.y - y) < radius and (best is None or key(e) < key(best)):
+            best = e
+    return best
+
+
+def run_case(n_towers, n_enemies, wave, frames, seed):
+    rng = random.Random(seed)
+    spots = tower_spots(n_towers, rng)
+    warmup = crossing_frames(wave)
+    plan = spawn_plan(n_enemies, wave, warmup + frames)
+
+    old_towers, new_towers = [], []
+    for x, y, cool in spots:
+        for towers, cls in ((old_towers, LegacyTower), (new_towers, Tower)):
+            t = cls(x, y)
+            t.cool = cool
+            towers.append(t)
+    old_enemies, old_bullets = [], []
+    registry, new_bullets = EnemyRegistry(), []
+
+    old_times, new_times, alive, flying = [], [], [], []
+    for frame, count in enumerate(plan):
+        for _ in range(count):
+            old_enemies.append(Enemy(wave))
+            registry.add(Enemy(wave))
+
+        start = time.perf_counter()
+        old = legacy_combat(old_enemies, old_towers, old_bullets)
+        old_time = time.perf_counter() - start
+        start = time.perf_counter()
+        new = update_combat(registry, new_towers, new_bullets)
+        new_time = time.perf_counter() - start
+
+        if old != new or len(old_bullets) != len(new_bullets) or len(old_enemies) != len(registry):
+            print(f"ERRO: {n_towers}x{n_enemies}, quadro {frame}: antiga {old}, {len(old_bullets)} balas, "
+                  f"nova {new}, {len(new_bullets)} balas")
+            sys.exit(1)
+        if frame >= warmup:
+            old_times.append(old_time)
+            new_times.append(new_time)
+            alive.append(len(registry))
+            flying.append(len(new_bullets))
+
+    state = lambda e: (e.x, e.y, e.hp)
+    if list(map(state, old_enemies)) != list(map(state, registry)):
+        print(f"ERRO: {n_towers}x{n_enemies}: os inimigos terminaram diferentes")
+        sys.exit(1)
+    for t in new_towers:
+        for method, key in (('first', lambda e: (-e.progress, e.id)), ('strongest', lambda e: (-e.hp, e.id))):
+            if getattr(registry, method)(t.x, t.y, t.range) is not brute(registry, t.x, t.y, t.range, key):
+                print(f"ERRO: {n_towers}x{n_enemies}: {method} da grade não bate com a busca completa")
+                sys.exit(1)
+
+    # só a mira: todas as torres procurando alvo no mesmo quadro
+    start = time.perf_counter()
+    old_targets = [legacy_nearest(old_enemies, t.x, t.y, t.range) for t in old_towers]
+    old_query = time.perf_counter() - start
+    start = time.perf_counter()
+    registry.moved()
+    new_targets = [registry.nearest(t.x, t.y, t.range) for t in new_towers]
+    new_query = time.perf_counter() - start
+    if [e and state(e) for e in old_targets] != [e and state(e) for e in new_targets]:
+        print(f"ERRO: {n_towers}x{n_enemies}: nearest da grade não bate com a varredura")
+        sys.exit(1)
+
+    old_times.sort()
+    new_times.sort()
+    p95 = int(len(new_times) * 0.95)
+    return (statistics.fmean(alive), statistics.fmean(flying),
+            statistics.fmean(old_times) * 1000, old_times[p95] * 1000,
+            statistics.fmean(new_times) * 1000, new_times[p95] * 1000,
+            old_query * 1000, new_query * 1000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cases', default='50x200,200x1000', help='torresxinimigos, separados por vírgula')
+    parser.add_argument('--wave', type=int, default=30)
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"wave {args.wave}, {args.frames} quadros depois de o caminho encher, orçamento {BUDGET_MS:.1f} ms")
+    print(f"{'torres':>7} {'inimigos':>9} {'balas':>7} {'antiga média (ms)':>18} {'antiga p95 (ms)':>16} "
+          f"{'nova média (ms)':>16} {'nova p95 (ms)':>14} {'mira antiga (ms)':>17} {'mira nova (ms)':>15}")
+    for case in args.cases.split(','):
+        n_towers, n_enemies = (int(v) for v in case.split('x'))
+        alive, flying, old_mean, old_p95, new_mean, new_p95, old_query, new_query = run_case(
+            n_towers, n_enemies, args.wave, args.frames, args.seed)
+        print(f"{n_towers:>7} {alive:>9.0f} {flying:>7.0f} {old_mean:>18.2f} {old_p95:>16.2f} "
+              f"{new_mean:>16.2f} {new_p95:>14.2f} {old_query:>17.2f} {new_query:>15.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -12,6 +12,11 @@ import random
 import configparser
 from pathlib import Path
 
+try:
+    from hub.projectiles import ProjectilePool
+except ImportError:
+    ProjectilePool = None  # rodando sozinho, fora do Hub: um Bullet novo por tiro
+
 # ------------------------------------------------------
 #   MAPEAMENTO DE TECLAS (igual ao SimpleMover)
 # ------------------------------------------------------
@@ -77,6 +82,10 @@ def load_conf():
     return width, height, fullscreen, mapped
 
 
+BULLET_SPEED = 300
+BULLET_POOL_SIZE = 32
+
+
 # ------------------------------------------------------
 #   CLASSES DO JOGO
 # ------------------------------------------------------
@@ -106,9 +115,15 @@ class Ship:
 
 
 class Bullet:
-    def __init__(self, pos, vel):
-        self.pos = pygame.Vector2(pos)
-        self.vel = pygame.Vector2(vel)
+    def __init__(self):
+        self.pos = pygame.Vector2()
+        self.vel = pygame.Vector2()
+        self.life = 0
+
+    def reset(self, pos, speed, angle):
+        # reaproveita os vetores do próprio tiro em vez de criar novos
+        self.pos.update(pos)
+        self.vel.from_polar((speed, angle))
         self.life = 1.5
 
     def update(self, dt, w, h):
@@ -168,6 +183,7 @@ def main():
 
     ship = Ship((width/2, height/2))
     bullets = []
+    bullet_pool = ProjectilePool(Bullet, BULLET_POOL_SIZE) if ProjectilePool else None
     asteroids = []
 
     for _ in range(5):
@@ -205,9 +221,12 @@ def main():
 
         # TIRO
         if controls["action_a"] and keys[controls["action_a"]] and cooldown <= 0:
-            rad = math.radians(ship.angle)
-            vel = pygame.Vector2(math.cos(rad), math.sin(rad)) * 300
-            bullets.append(Bullet(ship.pos, vel))
+            if bullet_pool is not None:
+                bullet = bullet_pool.acquire(ship.pos, BULLET_SPEED, ship.angle)
+            else:
+                bullet = Bullet()
+                bullet.reset(ship.pos, BULLET_SPEED, ship.angle)
+            bullets.append(bullet)
             cooldown = 0.25
         cooldown -= dt
 
@@ -218,6 +237,8 @@ def main():
             b.update(dt, width, height)
             if b.life <= 0:
                 bullets.remove(b)
+                if bullet_pool is not None:
+                    bullet_pool.release(b)
 
         for a in asteroids:
             a.update(dt, width, height)
@@ -227,6 +248,8 @@ def main():
             for a in asteroids[:]:
                 if (b.pos - a.pos).length() < a.radius:
                     bullets.remove(b)
+                    if bullet_pool is not None:
+                        bullet_pool.release(b)
                     asteroids.remove(a)
 
                     if a.size > 1:
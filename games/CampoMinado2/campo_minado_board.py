@@ -1,79 +1,105 @@
-from cell import Cell
 import random
 
+# O tabuleiro guarda cada informação num plano de bytes (índice = linha *
+# colunas + coluna): mine, adj, revealed e flagged, sem um objeto por célula.
+# A contagem de vizinhas lê o plano de minas como um inteiro grande com um byte
+# por célula e assim roda em C.
+
+MINE = 9  # valor de adj nas células com mina
+
 class Board:
     def __init__(self, rows, cols, mines):
         self.rows, self.cols, self.mines = rows, cols, mines
-        self.grid = [[Cell() for _ in range(cols)] for _ in range(rows)]
+        size = rows * cols
+        self.mine = bytearray(size)
+        self.adj = bytearray(size)
+        self.revealed = bytearray(size)
+        self.flagged = bytearray(size)
         self.first_move = True
-        self.remaining = rows * cols - mines
+        self.remaining = size - mines
         self.game_over = False
         self.victory = False
+        self.changes = 0  # sobe a cada jogada que muda alguma célula
 
     def place_mines(self, safe_r, safe_c):
-        positions = [(r,c) for r in range(self.rows) for c in range(self.cols)]
-        forbidden = {(safe_r+dr, safe_c+dc) for dr in (-1,0,1) for dc in (-1,0,1)
-                      if 0 <= safe_r+dr < self.rows and 0 <= safe_c+dc < self.cols}
-        eligible = [p for p in positions if p not in forbidden]
-        random.shuffle(eligible)
-        for i in range(self.mines):
-            r,c = eligible[i]
-            self.grid[r][c].mine = True
+        size = self.rows * self.cols
+        forbidden = {(safe_r+dr)*self.cols + safe_c+dc for dr in (-1,0,1) for dc in (-1,0,1)
+                     if 0 <= safe_r+dr < self.rows and 0 <= safe_c+dc < self.cols}
+        # sorteia algumas a mais para sobrar o suficiente fora da área segura
+        picks = random.sample(range(size), min(size, self.mines + len(forbidden)))
+        for i in [p for p in picks if p not in forbidden][:self.mines]:
+            self.mine[i] = 1
         self.calculate_adj()
 
     def calculate_adj(self):
-        for r in range(self.rows):
-            for c in range(self.cols):
-                cell = self.grid[r][c]
-                if cell.mine:
-                    cell.adj = -1
-                    continue
-                total = 0
-                for dr in (-1,0,1):
-                    for dc in (-1,0,1):
-                        if dr==0 and dc==0: continue
-                        rr,cc = r+dr, c+dc
-                        if 0<=rr<self.rows and 0<=cc<self.cols and self.grid[rr][cc].mine:
-                            total+=1
-                cell.adj = total
+        # Convolução 3x3: deslocar o inteiro 8 bits anda uma coluna e 8 * cols
+        # bits anda uma linha. Cada byte vai no máximo a 9, sem "vai um" entre
+        # células; as máscaras impedem que a vizinha dê a volta na linha.
+        rows, cols = self.rows, self.cols
+        size = rows * cols
+        full = (1 << (8 * size)) - 1
+        not_first = int.from_bytes((b'\x00' + b'\xff' * (cols - 1)) * rows, 'big')
+        not_last = int.from_bytes((b'\xff' * (cols - 1) + b'\x00') * rows, 'big')
+        m = int.from_bytes(self.mine, 'big')
+        row = m + ((m >> 8) & not_first) + ((m << 8) & not_last)
+        total = row + (row >> (8 * cols)) + ((row << (8 * cols)) & full)
+        # o 3x3 de uma mina conta ela mesma; lá adj vira MINE
+        adj = ((total - m) & ~(m * 255)) | (m * MINE)
+        self.adj[:] = adj.to_bytes(size, 'big')
 
     def reveal(self, r, c):
         if self.game_over or self.victory: return
-        cell = self.grid[r][c]
-        if cell.revealed or cell.flagged: return
+        i = r * self.cols + c
+        if self.revealed[i] or self.flagged[i]: return
         if self.first_move:
             self.place_mines(r, c)
             self.first_move = False
-        cell.revealed = True
-        if cell.mine:
+        self.changes += 1
+        if self.mine[i]:
+            self.revealed[i] = 1
             self.trigger_game_over(); return
-        self.remaining -= 1
-        if cell.adj == 0:
-            self.flood_fill(r, c)
+        if self.adj[i] == 0:
+            self.remaining -= self.flood_fill(r, c)
+        else:
+            self.revealed[i] = 1
+            self.remaining -= 1
         if self.remaining == 0:
             self.trigger_victory()
 
     def flood_fill(self, r, c):
-        for dr in (-1,0,1):
-            for dc in (-1,0,1):
-                rr,cc=r+dr,c+dc
-                if 0<=rr<self.rows and 0<=cc<self.cols:
-                    if not self.grid[rr][cc].revealed and not self.grid[rr][cc].mine:
-                        self.reveal(rr,cc)
+        # Abre a área de zeros em volta de (r, c) e a borda numerada dela,
+        # como o reveal recursivo de antes, mas com uma pilha de índices.
+        # Bandeiras ficam fechadas. Retorna quantas células abriu.
+        rows, cols = self.rows, self.cols
+        adj, revealed, flagged = self.adj, self.revealed, self.flagged
+        start = r * cols + c
+        revealed[start] = 1
+        count = 1
+        stack = [start]
+        while stack:
+            r, c = divmod(stack.pop(), cols)
+            left, right = max(0, c-1), min(cols, c+2)
+            for rr in range(max(0, r-1), min(rows, r+2)):
+                for i in range(rr*cols + left, rr*cols + right):
+                    if revealed[i] or flagged[i]: continue
+                    revealed[i] = 1
+                    count += 1
+                    if adj[i] == 0:
+                        stack.append(i)
+        return count
 
     def toggle_flag(self, r, c):
-        if not self.grid[r][c].revealed:
-            self.grid[r][c].flagged = not self.grid[r][c].flagged
+        i = r * self.cols + c
+        if not self.revealed[i]:
+            self.flagged[i] ^= 1
+            self.changes += 1
 
     def trigger_game_over(self):
         self.game_over = True
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.grid[r][c].mine:
-                    self.grid[r][c].revealed = True
+        size = len(self.mine)
+        revealed = int.from_bytes(self.revealed, 'big') | int.from_bytes(self.mine, 'big')
+        self.revealed[:] = revealed.to_bytes(size, 'big')
 
     def trigger_victory(self):
         self.victory = True
-        for r in range(self.rows):
-            for c in range(self.cols):
-                self.grid[r][c].revealed = True
+        self.revealed[:] = b'\x01' * len(self.revealed)
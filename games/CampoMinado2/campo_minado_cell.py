@@ -1,6 +0,0 @@
-class Cell:
-    def __init__(self):
-        self.mine = False
-        self.revealed = False
-        self.flagged = False
-        self.adj = 0
@@ -1,10 +1,13 @@
 import pygame
-from config import ConfigLoader
-from board import Board
-from renderer import Renderer
+from campo_minado_config import ConfigLoader
+from campo_minado_board import Board
+from campo_minado_renderer import Renderer
+
+MIN_CELL = 24   # abaixo disso o tabuleiro rola em vez de encolher
+STATUS_H = 30   # faixa do texto de status, acima do tabuleiro
 
 class Game:
-    def __init__(self, config):
+    def __init__(self, config, rows=10, cols=12, mines=15):
         pygame.init()
         width=config.getint('Display','width'); height=config.getint('Display','height')
         fullscreen=config.getboolean('Display','fullscreen')
@@ -12,14 +15,16 @@ class Game:
         self.screen=pygame.display.set_mode((width,height),flags)
 
         self.controls={k:ConfigLoader.map_key(config['Controls'][k]) for k in config['Controls']}
-        self.rows,self.cols,self.mines=10,12,15
+        self.rows,self.cols,self.mines=rows,cols,mines
         margin=20
-        self.cs=min((width-margin*2)//self.cols,(height-margin*2)//self.rows)
-        self.grid_w=self.cs*self.cols; self.grid_h=self.cs*self.rows
-        self.ox=(width-self.grid_w)//2; self.oy=(height-self.grid_h)//2
+        area_w=width-margin*2; area_h=height-margin*2-STATUS_H
+        self.cs=max(MIN_CELL,min(area_w//self.cols,area_h//self.rows))
+        view_cols=min(self.cols,area_w//self.cs); view_rows=min(self.rows,area_h//self.cs)
+        self.grid_w=self.cs*view_cols; self.grid_h=self.cs*view_rows
+        self.ox=(width-self.grid_w)//2; self.oy=STATUS_H+margin+(area_h-self.grid_h)//2
 
         self.board=Board(self.rows,self.cols,self.mines)
-        self.renderer=Renderer(self.screen,self.board,self.cs,self.ox,self.oy)
+        self.renderer=Renderer(self.screen,self.board,self.cs,self.ox,self.oy,view_rows,view_cols)
 
         self.cr=0; self.cc=0
 
@@ -48,7 +53,7 @@ class Game:
         mx,my=e.pos
         if not(self.ox<=mx<self.ox+self.grid_w): return
         if not(self.oy<=my<self.oy+self.grid_h): return
-        c=(mx-self.ox)//self.cs; r=(my-self.oy)//self.cs
+        c=self.renderer.left+(mx-self.ox)//self.cs; r=self.renderer.top+(my-self.oy)//self.cs
         self.cr,self.cc=r,c
         if e.button==1: self.board.reveal(r,c)
         elif e.button==3: self.board.toggle_flag(r,c)
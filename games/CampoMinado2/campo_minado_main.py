@@ -1,6 +1,6 @@
 import os
-from config import ConfigLoader
-from game import Game
+from campo_minado_config import ConfigLoader
+from campo_minado_game import Game
 
 if __name__ == '__main__':
     root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -1,55 +1,159 @@
 import pygame
 
+# O renderer não limpa a tela a cada quadro. Ele guarda, para cada linha
+# visível, o estado de cada célula já desenhada (0 = fechada, 1 = bandeira,
+# 2 + adj = aberta, com 11 = mina) e só repinta as células cujo estado mudou.
+# Os quadrados de cada estado, com os números, são desenhados uma vez só.
+# Quando o viewport anda, os pixels do tabuleiro rolam junto e só a faixa que
+# entrou na tela é desenhada.
+
+OPEN = 2
+STALE = 255  # estado que nenhuma célula tem: força o repinte
+SHOWN = bytes(min(v + OPEN, 254) for v in range(256))  # translate: adj -> estado aberto
+BACKGROUND = (30,30,30)
+
 class Renderer:
-    def __init__(self, screen, board, cell_size, ox, oy):
+    def __init__(self, screen, board, cell_size, ox, oy, view_rows=None, view_cols=None):
         self.screen = screen
         self.board = board
         self.cs = cell_size
         self.ox = ox
         self.oy = oy
-        self.font = pygame.font.SysFont(None, int(cell_size*0.65))
+        self.view_rows = min(board.rows, view_rows or board.rows)
+        self.view_cols = min(board.cols, view_cols or board.cols)
+        self.top = 0
+        self.left = 0
+        self.grid_rect = pygame.Rect(ox, oy, self.view_cols*cell_size, self.view_rows*cell_size)
+        self.grid = screen.subsurface(self.grid_rect)
         self.status_font = pygame.font.SysFont(None, 24)
+        self.tiles = self.make_tiles()
+        self.shown = None      # estado desenhado de cada linha visível
+        self.changes = None    # board.changes no último quadro
+        self.cursor = None
+        self.status = None
+        self.status_rect = pygame.Rect(10,10,0,0)
+
+    def make_tiles(self):
+        cs = self.cs
+        font = pygame.font.SysFont(None, int(cs*0.65))
+        hidden = pygame.Surface((cs,cs)).convert()
+        hidden.fill((100,100,100))
+        flagged = hidden.copy()
+        pygame.draw.polygon(flagged,(200,40,40),[(cs*0.25,cs*0.2),(cs*0.6,cs*0.3),(cs*0.25,cs*0.5)])
+        tiles = [hidden, flagged]
+        for adj in range(10):
+            tile = pygame.Surface((cs,cs)).convert()
+            tile.fill((200,200,200))
+            if adj == 9:
+                pygame.draw.circle(tile,(0,0,0),(cs//2,cs//2),cs//3)
+            elif adj > 0:
+                t = font.render(str(adj),True,(20,20,180))
+                tile.blit(t,t.get_rect(center=(cs//2,cs//2)))
+            tiles.append(tile)
+        for tile in tiles:
+            pygame.draw.rect(tile,(50,50,50),(0,0,cs,cs),1)
+        return tiles
+
+    def follow(self, cursor):
+        # move o viewport para o cursor não sair dele; retorna quantas
+        # linhas e colunas ele andou
+        r, c = cursor
+        top = min(max(self.top, r - self.view_rows + 1), r)
+        left = min(max(self.left, c - self.view_cols + 1), c)
+        dr, dc = top - self.top, left - self.left
+        self.top, self.left = top, left
+        return dr, dc
+
+    def scroll(self, dr, dc):
+        # rola os pixels do tabuleiro e marca como velhas as células que entraram
+        self.grid.scroll(-dc*self.cs, -dr*self.cs)
+        if dr > 0:
+            self.shown = self.shown[dr:] + [None]*dr
+        elif dr < 0:
+            self.shown = [None]*-dr + self.shown[:dr]
+        if dc:
+            stale = bytes([STALE])*abs(dc)
+            self.shown = [
+                row if row is None else (row[dc:] + stale if dc > 0 else stale + row[:dc])
+                for row in self.shown
+            ]
+
+    def row_state(self, r):
+        board = self.board
+        a = r * board.cols + self.left
+        b = a + self.view_cols
+        opened = int.from_bytes(board.revealed[a:b], 'big') * 255
+        shown = int.from_bytes(board.adj[a:b].translate(SHOWN), 'big')
+        flag = int.from_bytes(board.flagged[a:b], 'big')
+        return ((shown & opened) | (flag & ~opened)).to_bytes(b - a, 'big')
+
+    def visible(self, r, c):
+        return self.top <= r < self.top + self.view_rows and self.left <= c < self.left + self.view_cols
+
+    def cell_rect(self, r, c):
+        return pygame.Rect(self.ox + (c-self.left)*self.cs, self.oy + (r-self.top)*self.cs, self.cs, self.cs)
 
     def draw(self, cursor):
-        self.screen.fill((30,30,30))
-        for r in range(self.board.rows):
-            for c in range(self.board.cols):
-                self.draw_cell(r,c)
-        self.draw_cursor(cursor)
-        self.draw_status()
-        pygame.display.flip()
-
-    def draw_cell(self, r, c):
-        cell = self.board.grid[r][c]
-        x = self.ox + c*self.cs
-        y = self.oy + r*self.cs
-        rect = pygame.Rect(x,y,self.cs,self.cs)
-        if cell.revealed:
-            pygame.draw.rect(self.screen,(200,200,200),rect)
-            if cell.mine:
-                pygame.draw.circle(self.screen,(0,0,0),(x+self.cs//2,y+self.cs//2),self.cs//3)
-            elif cell.adj>0:
-                t=self.font.render(str(cell.adj),True,(20,20,180))
-                self.screen.blit(t,t.get_rect(center=rect.center))
-        else:
-            pygame.draw.rect(self.screen,(100,100,100),rect)
-            if cell.flagged:
-                pygame.draw.polygon(self.screen,(200,40,40),[
-                    (x+self.cs*0.25,y+self.cs*0.2),
-                    (x+self.cs*0.6, y+self.cs*0.3),
-                    (x+self.cs*0.25,y+self.cs*0.5)
-                ])
-        pygame.draw.rect(self.screen,(50,50,50),rect,1)
-
-    def draw_cursor(self,cursor):
-        r,c=cursor
-        x=self.ox+c*self.cs
-        y=self.oy+r*self.cs
-        pygame.draw.rect(self.screen,(255,255,0),(x,y,self.cs,self.cs),max(2,self.cs//12))
+        dr, dc = self.follow(cursor)
+        full = self.shown is None or abs(dr) >= self.view_rows or abs(dc) >= self.view_cols
+        rects = []
+        if full:
+            self.screen.fill(BACKGROUND)
+            self.shown = [None] * self.view_rows
+            self.cursor = None
+            self.status = None
+        elif dr or dc:
+            self.scroll(dr, dc)
+            rects.append(self.grid_rect)
+        if full or dr or dc or self.board.changes != self.changes:
+            self.changes = self.board.changes
+            rects += self.draw_cells()
+        if cursor != self.cursor:
+            rects += self.draw_cursor(cursor)
+        rects += self.draw_status()
+        if full:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+    def draw_cells(self):
+        rects = []
+        for vr in range(self.view_rows):
+            r = self.top + vr
+            state = self.row_state(r)
+            old = self.shown[vr]
+            if state == old: continue
+            for vc, s in enumerate(state):
+                if old is None or old[vc] != s:
+                    rect = self.cell_rect(r, self.left + vc)
+                    self.screen.blit(self.tiles[s], rect)
+                    rects.append(rect)
+                    if (r, self.left + vc) == self.cursor:
+                        self.cursor = None  # o contorno do cursor foi apagado junto
+            self.shown[vr] = state
+        return rects
+
+    def draw_cursor(self, cursor):
+        rects = []
+        if self.cursor is not None and self.visible(*self.cursor):
+            r, c = self.cursor
+            rect = self.cell_rect(r, c)
+            self.screen.blit(self.tiles[self.shown[r - self.top][c - self.left]], rect)
+            rects.append(rect)
+        rect = self.cell_rect(*cursor)
+        pygame.draw.rect(self.screen,(255,255,0),rect,max(2,self.cs//12))
+        rects.append(rect)
+        self.cursor = cursor
+        return rects
 
     def draw_status(self):
         if self.board.game_over: msg="Game Over — Pause para sair"
         elif self.board.victory: msg="Vitória — Pause para sair"
         else: msg=f"Restantes: {self.board.remaining} | Minas: {self.board.mines}"
+        if msg == self.status: return []
+        self.status = msg
+        old = self.status_rect
+        self.screen.fill(BACKGROUND, old)
         st=self.status_font.render(msg,True,(230,230,230))
-        self.screen.blit(st,(10,10))
+        self.status_rect = self.screen.blit(st,(10,10))
+        return [old.union(self.status_rect)]
@@ -70,11 +70,15 @@ ROWS = 9
 COLS = 9
 MINES = 10
 
+MINE = 9          # valor da mina no tabuleiro (vizinhas vão de 0 a 8)
+
 MARGIN = 20
+MIN_CELL = 20     # tabuleiros grandes rolam em vez de encolher as células
 BOARD_W = min(W, H) - 2 * MARGIN
-CELL = BOARD_W // max(COLS, ROWS)
-BOARD_W = CELL * max(COLS, ROWS)
-BOARD_ORIGIN = ((W - BOARD_W)//2, (H - BOARD_W)//2 + 10)
+CELL = max(MIN_CELL, BOARD_W // max(COLS, ROWS))
+VIEW_COLS = min(COLS, BOARD_W // CELL)
+VIEW_ROWS = min(ROWS, BOARD_W // CELL)
+BOARD_ORIGIN = ((W - VIEW_COLS*CELL)//2, (H - VIEW_ROWS*CELL)//2 + 10)
 LINE_W = max(2, CELL // 20)
 
 # cores
@@ -89,94 +93,112 @@ FLAG_COLOR = (200, 30, 30)
 TEXT_COLOR = (10, 10, 10)
 
 # estado do tabuleiro
+# board, revealed e flagged são bytearrays planos (índice = linha * COLS + coluna)
 def new_board(rows=ROWS, cols=COLS, mines=MINES):
-    # create empty
-    b = [[0 for _ in range(cols)] for _ in range(rows)]
+    b = bytearray(rows * cols)
     # place mines
-    positions = [(r, c) for r in range(rows) for c in range(cols)]
-    mines_pos = random.sample(positions, mines)
-    for (r, c) in mines_pos:
-        b[r][c] = -1
-    # fill numbers
-    for r in range(rows):
-        for c in range(cols):
-            if b[r][c] == -1:
-                continue
-            cnt = 0
-            for dr in (-1,0,1):
-                for dc in (-1,0,1):
-                    rr, cc = r+dr, c+dc
-                    if 0 <= rr < rows and 0 <= cc < cols and b[rr][cc] == -1:
-                        cnt += 1
-            b[r][c] = cnt
-    return b, [[False]*cols for _ in range(rows)], [[False]*cols for _ in range(rows)]  # board, revealed, flagged
+    mines_pos = random.sample(range(rows * cols), mines)
+    for i in mines_pos:
+        b[i] = MINE
+    # fill numbers: cada mina soma 1 nas vizinhas
+    for i in mines_pos:
+        r, c = divmod(i, cols)
+        for rr in range(max(0, r-1), min(rows, r+2)):
+            for j in range(rr*cols + max(0, c-1), rr*cols + min(cols, c+2)):
+                if b[j] != MINE:
+                    b[j] += 1
+    return b, bytearray(rows * cols), bytearray(rows * cols), mines_pos  # board, revealed, flagged, minas
 
-board, revealed, flagged = new_board()
+board, revealed, flagged, mines = new_board()
+revealed_count = 0   # células sem mina já reveladas
 cursor = [0, 0]  # col, row
+view = [0, 0]    # col, row do canto superior esquerdo visível
 game_over = False
 won = False
 
 def reset_game():
-    global board, revealed, flagged, cursor, game_over, won
-    board, revealed, flagged = new_board()
+    global board, revealed, flagged, mines, revealed_count, cursor, view, game_over, won
+    board, revealed, flagged, mines = new_board(ROWS, COLS, MINES)
+    revealed_count = 0
     cursor = [0, 0]
+    view = [0, 0]
     game_over = False
     won = False
 
-# reveal flood-fill
+# ---------- Flood-fill ----------
+# Iterativo, com uma pilha explícita no lugar da recursão: abre a área de zeros
+# que contém i e a borda numerada dela, pulando as bandeiras, e retorna quantas
+# células abriu.
+def flood(i):
+    revealed[i] = 1
+    count = 1
+    stack = [i]
+    while stack:
+        r, c = divmod(stack.pop(), COLS)
+        lo, hi = max(0, c-1), min(COLS, c+2)   # colunas vizinhas
+        for rr in range(max(0, r-1), min(ROWS, r+2)):
+            for j in range(rr*COLS + lo, rr*COLS + hi):
+                if not (revealed[j] or flagged[j]):
+                    revealed[j] = 1
+                    count += 1
+                    if board[j] == 0:
+                        stack.append(j)
+    return count
+
 def reveal_cell(r, c):
-    global game_over
-    if revealed[r][c] or flagged[r][c]:
+    global game_over, revealed_count
+    i = r*COLS + c
+    if revealed[i] or flagged[i]:
         return
-    revealed[r][c] = True
-    if board[r][c] == -1:
+    if board[i] == MINE:
         game_over = True
         # reveal all mines
-        for i in range(ROWS):
-            for j in range(COLS):
-                if board[i][j] == -1:
-                    revealed[i][j] = True
+        for m in mines:
+            revealed[m] = 1
         return
-    # if zero, flood
-    if board[r][c] == 0:
-        for dr in (-1,0,1):
-            for dc in (-1,0,1):
-                rr, cc = r+dr, c+dc
-                if 0 <= rr < ROWS and 0 <= cc < COLS and not revealed[rr][cc]:
-                    reveal_cell(rr, cc)
+    if board[i] == 0:
+        revealed_count += flood(i)
+    else:
+        revealed[i] = 1
+        revealed_count += 1
 
 def check_win():
-    for r in range(ROWS):
-        for c in range(COLS):
-            if board[r][c] != -1 and not revealed[r][c]:
-                return False
-    return True
+    return revealed_count == ROWS*COLS - MINES
 
 # ---------- Desenho ----------
 def cell_rect(col, row):
     ox, oy = BOARD_ORIGIN
-    return pygame.Rect(ox + col*CELL, oy + row*CELL, CELL, CELL)
+    return pygame.Rect(ox + (col - view[0])*CELL, oy + (row - view[1])*CELL, CELL, CELL)
+
+def follow_cursor():
+    # rola a parte visível do tabuleiro para o cursor não sair dela
+    for axis, span in ((0, VIEW_COLS), (1, VIEW_ROWS)):
+        if cursor[axis] < view[axis]:
+            view[axis] = cursor[axis]
+        elif cursor[axis] >= view[axis] + span:
+            view[axis] = cursor[axis] - span + 1
 
 def draw_board():
     screen.fill(BG)
     # quadro de fundo
     ox, oy = BOARD_ORIGIN
-    pygame.draw.rect(screen, BOARD_BG, (ox-4, oy-4, COLS*CELL+8, ROWS*CELL+8))
-    # células
-    for r in range(ROWS):
-        for c in range(COLS):
+    pygame.draw.rect(screen, BOARD_BG, (ox-4, oy-4, VIEW_COLS*CELL+8, VIEW_ROWS*CELL+8))
+    # células (só as visíveis)
+    for r in range(view[1], view[1] + VIEW_ROWS):
+        for c in range(view[0], view[0] + VIEW_COLS):
+            i = r*COLS + c
             rect = cell_rect(c, r)
             # fundo
-            if revealed[r][c]:
+            if revealed[i]:
                 pygame.draw.rect(screen, REVEALED_BG, rect)
             else:
                 pygame.draw.rect(screen, CELL_BG, rect)
             # borda
             pygame.draw.rect(screen, GRID_COLOR, rect, 1)
             # conteúdo
-            if revealed[r][c]:
-                val = board[r][c]
-                if val == -1:
+            if revealed[i]:
+                val = board[i]
+                if val == MINE:
                     # mine: desenha círculo preto
                     cx, cy = rect.center
                     radius = max(3, CELL//4)
@@ -185,7 +207,7 @@ def draw_board():
                     txt = FONT.render(str(val), True, TEXT_COLOR)
                     screen.blit(txt, txt.get_rect(center=rect.center))
             else:
-                if flagged[r][c]:
+                if flagged[i]:
                     # bandeira = pequeno triângulo/retângulo
                     px = rect.left + CELL//4
                     py = rect.top + CELL//4
@@ -204,7 +226,7 @@ def draw_board():
 
 def draw_status():
     # top-left status texts
-    flags_left = sum(1 for r in range(ROWS) for c in range(COLS) if flagged[r][c])
+    flags_left = flagged.count(1)
     mines_text = f"Mines: {MINES}  Flags: {flags_left}"
     surf = FONT.render(mines_text, True, TEXT_COLOR)
     screen.blit(surf, (10, 6))
@@ -254,11 +276,12 @@ def main():
                     cursor[0] = max(0, cursor[0] - 1); redraw = True
                 elif CONTROL_KEYS.get("right") is not None and event.key == CONTROL_KEYS["right"]:
                     cursor[0] = min(COLS-1, cursor[0] + 1); redraw = True
+                follow_cursor()
 
                 # action_a -> revelar
                 if CONTROL_KEYS.get("action_a") is not None and event.key == CONTROL_KEYS["action_a"]:
                     r, c = cursor[1], cursor[0]
-                    if not revealed[r][c] and not flagged[r][c]:
+                    if not revealed[r*COLS + c] and not flagged[r*COLS + c]:
                         reveal_cell(r, c)
                         redraw = True
                         if not game_over and check_win():
@@ -268,8 +291,9 @@ def main():
                 # action_b -> bandeira
                 if CONTROL_KEYS.get("action_b") is not None and event.key == CONTROL_KEYS["action_b"]:
                     r, c = cursor[1], cursor[0]
-                    if not revealed[r][c]:
-                        flagged[r][c] = not flagged[r][c]
+                    i = r*COLS + c
+                    if not revealed[i]:
+                        flagged[i] ^= 1
                         redraw = True
 
         if redraw:
@@ -0,0 +1,189 @@
+import random
+from collections import OrderedDict
+
+import pygame
+
+from pathing import walkable_grid
+
+# -------------------------------
+# NÍVEIS
+# Um nível guarda o mapa em bytearrays planos (índice = linha * colunas +
+# coluna): 'walkable' (1 = caminho) e 'coins' (1 = moeda). Pode vir de uma
+# lista de strings como LEVEL ou ser gerado como labirinto de qualquer tamanho.
+# -------------------------------
+
+def generate_maze(cols, rows, seed=None, loops=0.05):
+    """
+    Labirinto em lista de strings ('#' = parede) com bordas fechadas,
+    pelo backtracker recursivo (versão iterativa, com pilha). Depois abre
+    algumas paredes ao acaso ('loops') para haver mais de um caminho.
+    """
+    rng = random.Random(seed)
+    cw, ch = (cols - 1) // 2, (rows - 1) // 2
+    grid = [bytearray(b'#' * cols) for _ in range(rows)]
+    visited = bytearray(cw * ch)
+    visited[0] = 1
+    grid[1][1] = ord('.')
+    stack = [(0, 0)]
+    while stack:
+        x, y = stack[-1]
+        options = [
+            (nx, ny) for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1))
+            if 0 <= nx < cw and 0 <= ny < ch and not visited[ny * cw + nx]
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nx, ny = rng.choice(options)
+        visited[ny * cw + nx] = 1
+        grid[y + ny + 1][x + nx + 1] = ord('.')
+        grid[2 * ny + 1][2 * nx + 1] = ord('.')
+        stack.append((nx, ny))
+    for r in range(1, rows - 1):
+        for c in range(1, cols - 1):
+            if grid[r][c] == ord('#') and rng.random() < loops:
+                if (grid[r][c - 1] == grid[r][c + 1] == ord('.')) or (grid[r - 1][c] == grid[r + 1][c] == ord('.')):
+                    grid[r][c] = ord('.')
+    return [line.decode() for line in grid]
+
+
+class Level:
+    """
+    'P' marca o início do player e cada 'G' um inimigo; toda célula
+    que não é parede ganha uma moeda, menos a do player.
+    """
+
+    def __init__(self, lines):
+        self.rows = len(lines)
+        self.cols = len(lines[0])
+        self.walkable = walkable_grid(lines)
+        self.coins = bytearray(self.walkable)
+        self.player_start = None
+        self.enemy_starts = []
+        for r, line in enumerate(lines):
+            for c, ch in enumerate(line):
+                if ch == 'P':
+                    self.player_start = [c, r]
+                    self.coins[r * self.cols + c] = 0
+                elif ch == 'G':
+                    self.enemy_starts.append([c, r])
+        self.coins_left = self.coins.count(1)
+
+    @classmethod
+    def generate(cls, cols, rows, enemies=1, seed=None):
+        """
+        Labirinto novo com o player no canto (1, 1) e os inimigos
+        espalhados ao acaso, longe dele.
+        """
+        rng = random.Random(seed)
+        lines = [bytearray(line, 'ascii') for line in generate_maze(cols, rows, rng.random())]
+        lines[1][1] = ord('P')
+        far = [
+            (c, r) for r, line in enumerate(lines) for c, ch in enumerate(line)
+            if ch == ord('.') and c + r > (cols + rows) // 4
+        ]
+        for c, r in rng.sample(far, min(enemies, len(far))):
+            lines[r][c] = ord('G')
+        return cls([line.decode() for line in lines])
+
+    def is_wall(self, c, r):
+        return not self.walkable[r * self.cols + c]
+
+    def neighbors(self, c, r):
+        """Células vizinhas (4 direções) que não são parede."""
+        return [
+            (nc, nr) for nc, nr in ((c + 1, r), (c - 1, r), (c, r + 1), (c, r - 1))
+            if 0 <= nc < self.cols and 0 <= nr < self.rows and not self.is_wall(nc, nr)
+        ]
+
+    def take_coin(self, c, r):
+        """Remove a moeda de (c, r); retorna True se havia uma."""
+        i = r * self.cols + c
+        if self.coins[i]:
+            self.coins[i] = 0
+            self.coins_left -= 1
+            return True
+        return False
+
+
+class WallLayer:
+    """
+    Paredes desenhadas uma vez em superfícies de CHUNK × CHUNK tiles.
+    Só os pedaços visíveis são criados, e os menos usados saem do cache,
+    então a memória não cresce com o tamanho do labirinto.
+    """
+
+    CHUNK = 16
+
+    def __init__(self, level, tile, color, background=(0, 0, 0), max_chunks=32):
+        self.level = level
+        self.tile = tile
+        self.color = color
+        self.background = background
+        self.max_chunks = max_chunks
+        self.chunks = OrderedDict()
+
+    def chunk(self, cx, cy):
+        key = (cx, cy)
+        surface = self.chunks.get(key)
+        if surface is not None:
+            self.chunks.move_to_end(key)
+            return surface
+
+        size = self.CHUNK * self.tile
+        surface = pygame.Surface((size, size)).convert()
+        surface.fill(self.background)
+        level, tile = self.level, self.tile
+        c0, r0 = cx * self.CHUNK, cy * self.CHUNK
+        c1, r1 = min(c0 + self.CHUNK, level.cols), min(r0 + self.CHUNK, level.rows)
+        for r in range(r0, r1):
+            base = r * level.cols
+            c = c0
+            # paredes vizinhas na mesma linha viram um retângulo só
+            while c < c1:
+                if level.walkable[base + c]:
+                    c += 1
+                    continue
+                start = c
+                while c < c1 and not level.walkable[base + c]:
+                    c += 1
+                rect = ((start - c0) * tile, (r - r0) * tile, (c - start) * tile, tile)
+                pygame.draw.rect(surface, self.color, rect)
+
+        self.chunks[key] = surface
+        if len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+        return surface
+
+    def draw(self, screen, cam_x, cam_y):
+        size = self.CHUNK * self.tile
+        width, height = screen.get_size()
+        cx1 = min((cam_x + width - 1) // size, (self.level.cols - 1) // self.CHUNK)
+        cy1 = min((cam_y + height - 1) // size, (self.level.rows - 1) // self.CHUNK)
+        for cy in range(cam_y // size, cy1 + 1):
+            for cx in range(cam_x // size, cx1 + 1):
+                screen.blit(self.chunk(cx, cy), (cx * size - cam_x, cy * size - cam_y))
+
+
+def draw_coins(screen, level, tile, cam_x, cam_y, color=(255, 255, 0), radius=6):
+    """Desenha só as moedas das células visíveis."""
+    width, height = screen.get_size()
+    c0, r0 = cam_x // tile, cam_y // tile
+    c1 = min(level.cols, (cam_x + width) // tile + 1)
+    r1 = min(level.rows, (cam_y + height) // tile + 1)
+    coins = level.coins
+    half = tile // 2
+    for r in range(r0, r1):
+        base = r * level.cols
+        end = base + c1
+        i = coins.find(1, base + c0, end)
+        while i != -1:
+            pygame.draw.circle(screen, color, ((i - base) * tile + half - cam_x, r * tile + half - cam_y), radius)
+            i = coins.find(1, i + 1, end)
+
+
+def camera(center_x, center_y, level, tile, width, height):
+    """Canto superior esquerdo da câmera, centrada no ponto e presa ao mapa."""
+    cam_x = min(max(0, center_x - width // 2), max(0, level.cols * tile - width))
+    cam_y = min(max(0, center_y - height // 2), max(0, level.rows * tile - height))
+    return cam_x, cam_y
@@ -1,5 +1,9 @@
+import random
+
 import pygame
-from collections import deque
+
+from levels import Level, WallLayer, draw_coins, camera
+from pathing import FlowField
 
 # -------------------------------
 # CONFIGURAÇÕES BÁSICAS DO JOGO
@@ -33,8 +37,14 @@ LEVEL = [
     "####################",
 ]
 
-ROWS = len(LEVEL)
-COLS = len(LEVEL[0])
+# para jogar num labirinto gerado em vez do LEVEL acima, use por exemplo
+# LEVEL_SIZE = (501, 501); ENEMY_COUNT é quantos inimigos ele terá
+LEVEL_SIZE = None
+ENEMY_COUNT = 3
+
+# inimigos a mais de CHASE_RADIUS passos do player andam ao acaso; assim a BFS
+# do flow field não precisa cobrir o labirinto inteiro nos mapas grandes
+CHASE_RADIUS = 60
 
 def grid_to_px(c, r):
     """
@@ -43,59 +53,12 @@ def grid_to_px(c, r):
     """
     return c * TILE + TILE // 2, r * TILE + TILE // 2
 
-def neighbors(c, r):
-    """
-    Retorna os vizinhos caminháveis (não parede) de (c, r)
-    nas 4 direções (cima, baixo, esquerda, direita).
-    """
-    for dc, dr in ((1,0),(-1,0),(0,1),(0,-1)):
-        nc, nr = c + dc, r + dr
-        # dentro dos limites do mapa e não é parede
-        if 0 <= nc < COLS and 0 <= nr < ROWS and LEVEL[nr][nc] != '#':
-            yield nc, nr
-
-def bfs_step(start, goal):
-    """
-    Usa Busca em Largura (BFS) para encontrar um caminho
-    de 'start' até 'goal' no grid.
-    Retorna APENAS o PRÓXIMO passo a partir de 'start'.
+def load_level():
+    if LEVEL_SIZE is None:
+        return Level(LEVEL)
+    return Level.generate(*LEVEL_SIZE, enemies=ENEMY_COUNT)
 
-    start e goal são tuplas (coluna, linha).
-    """
-    if start == goal:
-        return start
-
-    q = deque([start])   # fila da BFS
-    parent = {start: None}  # guarda de onde cada célula foi alcançada
-
-    # BFS padrão
-    while q:
-        cur = q.popleft()
-        if cur == goal:
-            break
-        for nb in neighbors(*cur):
-            if nb not in parent:
-                parent[nb] = cur
-                q.append(nb)
-
-    # se goal não foi alcançado, não há caminho
-    if goal not in parent:
-        return start
-
-    # reconstrói o caminho goal -> start usando 'parent'
-    cur = goal
-    path = []
-    while cur is not None:
-        path.append(cur)
-        cur = parent[cur]
-    path.reverse()
-
-    # path[0] = start, path[1] = primeiro passo em direção ao goal
-    if len(path) >= 2:
-        return path[1]
-    return start
-
-def main():
+def main(level=None):
     # inicialização do Pygame
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
@@ -105,36 +68,24 @@ def main():
     # ---------------------------
     # CRIAÇÃO DAS ESTRUTURAS
     # ---------------------------
-    walls = []          # lista de retângulos para desenhar paredes
-    dots = set()        # conjunto de coordenadas (c, r) das moedas
-    player_pos = None   # posição do jogador no grid
-    enemy_pos = None    # posição do inimigo no grid
-
-    # varre o LEVEL e preenche as estruturas
-    for r, line in enumerate(LEVEL):
-        for c, ch in enumerate(line):
-            x, y = grid_to_px(c, r)
-
-            if ch == '#':
-                # cria um retângulo para a parede (para desenhar)
-                walls.append(pygame.Rect(c * TILE, r * TILE, TILE, TILE))
-            else:
-                # define posições iniciais de player e inimigo
-                if ch == 'P':
-                    player_pos = [c, r]
-                elif ch == 'G':
-                    enemy_pos = [c, r]
-                # qualquer célula que não seja parede ganha uma moeda,
-                # exceto a posição inicial do player
-                if ch != 'P':
-                    dots.add((c, r))
+    if level is None:
+        level = load_level()
+    player_pos = list(level.player_start)                  # posição do jogador no grid
+    enemies = [list(pos) for pos in level.enemy_starts]   # posições dos inimigos
+
+    # paredes desenhadas uma vez em superfícies (por pedaços do mapa)
+    walls = WallLayer(level, TILE, (40, 40, 200))
+    # campo de direções até o player, usado por todos os inimigos
+    flow = FlowField(level.cols, level.rows, level.walkable, max_dist=CHASE_RADIUS)
 
     font = pygame.font.SysFont("consolas", 24)
 
     running = True
     move_cooldown = 0.0    # tempo até o próximo movimento do player
-    enemy_cooldown = 0.0   # tempo até o próximo movimento do inimigo
+    enemy_cooldown = 0.0   # tempo até o próximo movimento dos inimigos
     score = 0
+    hud = None
+    hud_score = None
     game_over = False
     win = False
 
@@ -175,53 +126,58 @@ def main():
                     nc = player_pos[0] + dc
                     nr = player_pos[1] + dr
                     # só anda se não for parede
-                    if LEVEL[nr][nc] != '#':
+                    if not level.is_wall(nc, nr):
                         player_pos = [nc, nr]
                         move_cooldown = 0.12  # controla velocidade de movimento
 
-                        # se havia moeda nessa célula, remove do conjunto
-                        if (nc, nr) in dots:
-                            dots.remove((nc, nr))
+                        # se havia moeda nessa célula, ela sai do grid de moedas
+                        if level.take_coin(nc, nr):
                             score += 10
 
                             # se não há mais moedas, o jogador venceu
-                            if not dots:
+                            if level.coins_left == 0:
                                 game_over = True
                                 win = True
 
-            # 2.2) movimento do inimigo usando BFS
+            # 2.2) movimento dos inimigos pelo flow field
             if enemy_cooldown <= 0:
                 enemy_cooldown = 0.18
-                # calcula próximo passo em direção ao player
-                enemy_pos = list(bfs_step(tuple(enemy_pos), tuple(player_pos)))
-
-            # 2.3) checa se o inimigo pegou o player
-            if tuple(enemy_pos) == tuple(player_pos):
+                # a BFS reversa só roda quando o player troca de célula;
+                # o próximo passo de cada inimigo é uma consulta ao array
+                flow.update(player_pos)
+                enemies = [
+                    list(flow.next_step(*e)) if flow.distance(*e) >= 0
+                    else list(random.choice(level.neighbors(*e) or [tuple(e)]))
+                    for e in enemies
+                ]
+
+            # 2.3) checa se algum inimigo pegou o player
+            if player_pos in enemies:
                 game_over = True
                 win = False
 
-        # 3) desenho
+        # 3) desenho, com a câmera centrada no player
+        px, py = grid_to_px(*player_pos)
+        cam_x, cam_y = camera(px, py, level, TILE, WIDTH, HEIGHT)
         screen.fill((0, 0, 0))
 
-        # paredes
-        for w in walls:
-            pygame.draw.rect(screen, (40, 40, 200), w)
-
-        # moedas
-        for (c, r) in dots:
-            x, y = grid_to_px(c, r)
-            pygame.draw.circle(screen, (255, 255, 0), (x, y), 6)
+        # paredes (já prontas) e moedas visíveis
+        walls.draw(screen, cam_x, cam_y)
+        draw_coins(screen, level, TILE, cam_x, cam_y)
 
         # player (verde)
-        px, py = grid_to_px(*player_pos)
-        pygame.draw.circle(screen, (50, 255, 50), (px, py), TILE // 2 - 4)
-
-        # inimigo (vermelho)
-        ex, ey = grid_to_px(*enemy_pos)
-        pygame.draw.circle(screen, (255, 50, 50), (ex, ey), TILE // 2 - 4)
-
-        # HUD (pontuação)
-        hud = font.render(f"Pontos: {score}", True, (255, 255, 255))
+        pygame.draw.circle(screen, (50, 255, 50), (px - cam_x, py - cam_y), TILE // 2 - 4)
+
+        # inimigos (vermelho)
+        for e in enemies:
+            ex, ey = grid_to_px(*e)
+            if -TILE < ex - cam_x < WIDTH + TILE and -TILE < ey - cam_y < HEIGHT + TILE:
+                pygame.draw.circle(screen, (255, 50, 50), (ex - cam_x, ey - cam_y), TILE // 2 - 4)
+
+        # HUD (pontuação), renderizado de novo só quando muda
+        if score != hud_score:
+            hud_score = score
+            hud = font.render(f"Pontos: {score}", True, (255, 255, 255))
         screen.blit(hud, (10, 10))
 
         # mensagem de game over
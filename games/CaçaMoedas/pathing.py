@@ -0,0 +1,100 @@
+from array import array
+
+# -------------------------------
+# FLOW FIELD (CAMPO DE DIREÇÕES)
+# Em vez de uma BFS por inimigo a cada passo, uma única BFS reversa parte do
+# player e grava, para cada célula alcançável, a distância até ele e o
+# próximo passo do caminho mais curto. Os inimigos só consultam o array.
+# -------------------------------
+
+def walkable_grid(level, wall='#'):
+    """
+    Converte um mapa em lista de strings num bytearray plano
+    (índice = linha * colunas + coluna): 1 = caminho, 0 = parede.
+    """
+    return bytearray(0 if ch == wall else 1 for line in level for ch in line)
+
+
+class FlowField:
+    """
+    max_dist limita a BFS a essa distância do alvo (raio de perseguição):
+    em mapas grandes ela não precisa varrer o labirinto inteiro, e células
+    mais longe ficam sem caminho (distance = -1).
+    """
+
+    def __init__(self, cols, rows, walkable, max_dist=None):
+        self.cols = cols
+        self.rows = rows
+        self.walkable = walkable
+        self.max_dist = cols * rows if max_dist is None else max_dist
+        self.unreached = array('i', [-1]) * (cols * rows)
+        self.dist = array('i', self.unreached)
+        self.next = array('i', self.unreached)
+        self.target = None
+        self.builds = 0   # quantas BFS já foram feitas (para medir)
+
+    def update(self, target):
+        """
+        Refaz o campo só se o alvo (coluna, linha) mudou de célula.
+        Retorna True se houve BFS.
+        """
+        c, r = target
+        goal = r * self.cols + c
+        if goal == self.target:
+            return False
+        self.target = goal
+        self.builds += 1
+
+        cols = self.cols
+        size = cols * self.rows
+        walkable = self.walkable
+        max_dist = self.max_dist
+        dist = self.dist = array('i', self.unreached)
+        nxt = self.next = array('i', self.unreached)
+        dist[goal] = 0
+        nxt[goal] = goal
+
+        # a lista cresce enquanto é percorrida e faz papel de fila
+        queue = [goal]
+        for cur in queue:
+            d = dist[cur] + 1
+            if d > max_dist:
+                break   # a fila está em ordem de distância: o resto também passa
+            col = cur % cols
+            if col + 1 < cols:
+                nb = cur + 1
+                if walkable[nb] and dist[nb] < 0:
+                    dist[nb] = d
+                    nxt[nb] = cur
+                    queue.append(nb)
+            if col > 0:
+                nb = cur - 1
+                if walkable[nb] and dist[nb] < 0:
+                    dist[nb] = d
+                    nxt[nb] = cur
+                    queue.append(nb)
+            nb = cur + cols
+            if nb < size and walkable[nb] and dist[nb] < 0:
+                dist[nb] = d
+                nxt[nb] = cur
+                queue.append(nb)
+            nb = cur - cols
+            if nb >= 0 and walkable[nb] and dist[nb] < 0:
+                dist[nb] = d
+                nxt[nb] = cur
+                queue.append(nb)
+        return True
+
+    def distance(self, c, r):
+        """Passos até o alvo, ou -1 se (c, r) não alcança o alvo."""
+        return self.dist[r * self.cols + c]
+
+    def next_step(self, c, r):
+        """
+        Próxima célula (coluna, linha) no caminho mais curto até o alvo.
+        Sem caminho, fica onde está.
+        """
+        nb = self.next[r * self.cols + c]
+        if nb < 0:
+            return c, r
+        return nb % self.cols, nb // self.cols
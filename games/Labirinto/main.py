@@ -119,9 +119,29 @@ def find_tile(tile_char):
     return None
 
 
+# Fontes e textos renderizados ficam em cache: o HUD desenha sempre as mesmas
+# frases e criar a fonte/renderizar a cada quadro custa caro.
+_font_cache = {}
+_text_cache = {}
+TEXT_CACHE_SIZE = 64
+
+
+def get_font(size):
+    font = _font_cache.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _font_cache[size] = font
+    return font
+
+
 def draw_text(surface, text, size, x, y, color=(255, 255, 255), anchor="topleft"):
-    font = pygame.font.Font(None, size)
-    text_surface = font.render(text, True, color)
+    key = (text, size, color)
+    text_surface = _text_cache.get(key)
+    if text_surface is None:
+        if len(_text_cache) >= TEXT_CACHE_SIZE:
+            _text_cache.clear()
+        text_surface = get_font(size).render(text, True, color)
+        _text_cache[key] = text_surface
     text_rect = text_surface.get_rect()
 
     if anchor == "center":
@@ -0,0 +1,92 @@
+"""Placar do Pacubos mantido em memória.
+
+O ``leaderboard.json`` é lido uma vez só; depois o top 10 fica numa lista
+ordenada por pontos, mantida com ``bisect``. Cada pontuação nova é gravada por
+uma thread em segundo plano, num arquivo temporário que substitui o original
+com ``os.replace``, então uma gravação interrompida nunca deixa o JSON pela
+metade e o quadro do jogo não espera o disco.
+"""
+import bisect
+import json
+import os
+import threading
+
+
+class Leaderboard:
+    def __init__(self, path, size=10):
+        self.path = path
+        self.size = size
+        self.entries = []
+        self.keys = []       # -pontos de cada entrada, na mesma ordem (para o bisect)
+        self.version = 0     # sobe a cada pontuação que entra no placar
+        self.writes = 0      # gravações concluídas (para medir)
+
+        self.lock = threading.Lock()
+        self.pending = None
+        self.thread = None
+        self.load()
+
+    def load(self):
+        entries = []
+        try:
+            if os.path.isfile(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+        except Exception as e:
+            print(f"Erro ao ler o placar {self.path}: {e}")
+        entries.sort(key=lambda e: e['score'], reverse=True)
+        self.entries = entries[:self.size]
+        self.keys = [-e['score'] for e in self.entries]
+        self.version += 1
+
+    def add(self, name, score, elapsed):
+        """Insere a pontuação no lugar certo; retorna a posição (0 = primeiro) ou None."""
+        entry = {'name': name, 'score': int(score), 'time': int(elapsed)}
+        # depois das pontuações iguais, como o sort estável de antes
+        i = bisect.bisect_right(self.keys, -entry['score'])
+        if i >= self.size:
+            return None
+        self.entries.insert(i, entry)
+        self.keys.insert(i, -entry['score'])
+        del self.entries[self.size:], self.keys[self.size:]
+        self.version += 1
+        self.save()
+        return i
+
+    def save(self):
+        # a thread grava sempre o placar mais recente; pedidos que chegam
+        # durante uma gravação viram uma gravação só
+        snapshot = [dict(e) for e in self.entries]
+        with self.lock:
+            self.pending = snapshot
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._write_pending, name='pacubos-leaderboard', daemon=True)
+                self.thread.start()
+
+    def flush(self, timeout=2):
+        """Espera a gravação em andamento terminar (ao fechar o jogo)."""
+        with self.lock:
+            thread = self.thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _write_pending(self):
+        while True:
+            with self.lock:
+                entries, self.pending = self.pending, None
+                if entries is None:
+                    self.thread = None
+                    return
+            self._write(entries)
+
+    def _write(self, entries):
+        temp_path = self.path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            self.writes += 1
+        except Exception as e:
+            print(f"Erro ao salvar o placar {self.path}: {e}")
@@ -1,7 +1,11 @@
 import os
-import os, sys, random, time, json, math, configparser
+import os, sys, random, math, configparser
 import pygame
 
+from leaderboard import Leaderboard
+from pellets import PelletField
+from timers import GameClock, Scheduler
+
 def find_config_file():
     candidates = [
         os.path.join(os.getcwd(), 'conf', 'conf.ini'),
@@ -83,29 +87,6 @@ CONTROLS = build_controls()
 
 LEADERBOARD_FILE = os.path.join(os.path.dirname(__file__), 'leaderboard.json')
 
-def load_leaderboard():
-    try:
-        if os.path.isfile(LEADERBOARD_FILE):
-            with open(LEADERBOARD_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-    except Exception:
-        pass
-    return []
-
-def save_leaderboard(b):
-    try:
-        with open(LEADERBOARD_FILE, 'w', encoding='utf-8') as f:
-            json.dump(b, f, ensure_ascii=False, indent=2)
-    except Exception:
-        pass
-
-def add_score(name, score, elapsed):
-    board = load_leaderboard()
-    board.append({'name': name, 'score': int(score), 'time': int(elapsed)})
-    board = sorted(board, key=lambda x: x['score'], reverse=True)[:10]
-    save_leaderboard(board)
-    return board
-
 class Ghost:
     def __init__(self, x, y, color=None):
         self.x = x
@@ -167,7 +148,7 @@ class Ghost:
         self.vulnerable = False
 
 class PacubosGame:
-    def __init__(self):
+    def __init__(self, clock=None):
         pygame.init()
         flags = pygame.FULLSCREEN if FULLSCREEN else 0
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags)
@@ -183,48 +164,40 @@ class PacubosGame:
         self.flash_timer = 0.0
         self.score = 0
         self.lives = 3
-        self.pellets = []
-        for x in range(MARGIN, SCREEN_WIDTH - MARGIN, PELLET_SPACING):
-            for y in range(MARGIN, SCREEN_HEIGHT - MARGIN, PELLET_SPACING):
-                dx = x - SCREEN_WIDTH // 2
-                dy = y - SCREEN_HEIGHT // 2
-                if abs(dx) < 40 and abs(dy) < 40:
-                    continue
-                self.pellets.append((x, y))
+        self.pellets = PelletField(SCREEN_WIDTH, SCREEN_HEIGHT, PELLET_SPACING, MARGIN, PELLET_RADIUS, PELLET_COLOR, BG_COLOR)
+        self.pellets.reset()
         self.specials = []
         self.walls = []
         self.ghosts = []
         for _ in range(4):
             self.ghosts.append(Ghost(random.randint(MARGIN, SCREEN_WIDTH - MARGIN - GHOST_SIZE), random.randint(MARGIN, SCREEN_HEIGHT - MARGIN - GHOST_SIZE), GHOST_COLOR))
-        self._last_special = time.time() - (SPECIAL_SPAWN_INTERVAL / 2)
-        self._last_wall = time.time() - (WALL_SPAWN_INTERVAL / 2)
-        self._last_ghost = time.time() - (GHOST_SPAWN_INTERVAL / 2)
-        self.start_time = 0.0
+        # tempo do jogo: só anda em update(), então para no menu e nas iniciais
+        self.game_clock = clock or GameClock()
+        self.timers = Scheduler(self.game_clock)
+        self.speed_timer = None
+        self.giant_timer = None
+        self.start_time = None
         self.entering_initials = False
         self.initials = ['A', 'A', 'A']
         self.initial_index = 0
         self.game_state = 'menu'
+        self.leaderboard = Leaderboard(LEADERBOARD_FILE)
+        self.leaderboard_surf = None
+        self.leaderboard_version = None
 
     def start_game(self):
         self.score = 0
         self.lives = 3
         self.reset_positions()
-        self.pellets.clear()
-        for x in range(MARGIN, SCREEN_WIDTH - MARGIN, PELLET_SPACING):
-            for y in range(MARGIN, SCREEN_HEIGHT - MARGIN, PELLET_SPACING):
-                dx = x - SCREEN_WIDTH // 2
-                dy = y - SCREEN_HEIGHT // 2
-                if abs(dx) < 40 and abs(dy) < 40:
-                    continue
-                self.pellets.append((x, y))
+        self.pellets.reset()
         self.specials.clear()
         self.walls.clear()
-        self.start_time = time.time()
-        self._last_special = time.time() - (SPECIAL_SPAWN_INTERVAL / 2)
-        self._last_wall = time.time() - (WALL_SPAWN_INTERVAL / 2)
-        self._last_ghost = time.time() - (GHOST_SPAWN_INTERVAL / 2)
+        self.timers.clear()
+        self.speed_timer = self.giant_timer = None
+        self.start_time = self.game_clock.now
         self.spawn_special()
         self.spawn_wall()
+        self.timers.call_later(GHOST_SPAWN_INTERVAL / 2, self.spawn_ghost)
 
     def reset_positions(self):
         self.player_x = SCREEN_WIDTH // 2 - PLAYER_SIZE // 2
@@ -238,14 +211,23 @@ class PacubosGame:
         self.player_speed = PLAYER_SPEED
         self.player_size = PLAYER_SIZE
         self.flash_timer = 0.0
+        for timer in (self.speed_timer, self.giant_timer):
+            if timer is not None:
+                timer.cancel()
+        self.speed_timer = self.giant_timer = None
+
+    def elapsed(self):
+        if self.start_time is None:
+            return 0.0
+        return self.game_clock.now - self.start_time
 
     def spawn_special(self):
-        self._last_special = time.time()
+        self.timers.call_later(SPECIAL_SPAWN_INTERVAL, self.spawn_special)
         ptype = random.choice(['power', 'speed', 'giant'])
         self.specials.append({'x': random.randint(MARGIN, SCREEN_WIDTH - MARGIN), 'y': random.randint(MARGIN, SCREEN_HEIGHT - MARGIN), 'type': ptype})
 
     def spawn_wall(self):
-        self._last_wall = time.time()
+        self.timers.call_later(WALL_SPAWN_INTERVAL, self.spawn_wall)
         wtype = random.choices(['down', 'fast_down', 'side_left', 'side_right'], weights=[50, 20, 15, 15])[0]
         w = {'w': 60, 'h': 20, 'type': wtype}
         if wtype in ('down', 'fast_down'):
@@ -264,9 +246,9 @@ class PacubosGame:
             w['vy'] = 0.0
         self.walls.append(w)
 
-    def spawn_ghost_if_needed(self):
-        if time.time() - self._last_ghost > GHOST_SPAWN_INTERVAL and len(self.ghosts) < GHOST_MAX:
-            self._last_ghost = time.time()
+    def spawn_ghost(self):
+        self.timers.call_later(GHOST_SPAWN_INTERVAL, self.spawn_ghost)
+        if len(self.ghosts) < GHOST_MAX:
             self.ghosts.append(Ghost(random.randint(MARGIN, SCREEN_WIDTH - MARGIN - GHOST_SIZE), random.randint(MARGIN, SCREEN_HEIGHT - MARGIN - GHOST_SIZE), GHOST_COLOR))
 
     def handle_events(self):
@@ -283,9 +265,9 @@ class PacubosGame:
                     self.start_game()
             if self.entering_initials and event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RETURN:
-                    elapsed = time.time() - self.start_time if self.start_time else 0.0
+                    elapsed = self.elapsed()
                     total = self.score + int(elapsed)
-                    add_score(''.join(self.initials), total, elapsed)
+                    self.leaderboard.add(''.join(self.initials), total, elapsed)
                     self.entering_initials = False
                     self.game_state = 'playing'
                     self.start_game()
@@ -307,6 +289,7 @@ class PacubosGame:
     def update(self, dt):
         if self.game_state != 'playing' or self.entering_initials:
             return
+        self.game_clock.advance(dt)
         keys = pygame.key.get_pressed()
         vx = vy = 0
         if keys[CONTROLS.get('UP')]: vy = -self.player_speed
@@ -317,18 +300,9 @@ class PacubosGame:
         self.player_y += vy
         self.player_x = max(0, min(self.player_x, SCREEN_WIDTH - self.player_size))
         self.player_y = max(0, min(self.player_y, SCREEN_HEIGHT - self.player_size))
-        to_remove = []
         px1 = self.player_x + self.player_size / 2
         py1 = self.player_y + self.player_size / 2
-        for p in self.pellets:
-            dx = px1 - p[0]
-            dy = py1 - p[1]
-            if dx*dx + dy*dy < (self.player_size/2 + PELLET_RADIUS)**2:
-                to_remove.append(p)
-                self.score += 10
-        for r in to_remove:
-            if r in self.pellets:
-                self.pellets.remove(r)
+        self.score += 10 * self.pellets.eat(px1, py1, self.player_size/2 + PELLET_RADIUS)
         for s in list(self.specials):
             sx, sy = s['x'], s['y']
             if (px1 - sx)**2 + (py1 - sy)**2 < (self.player_size/2 + 12)**2:
@@ -338,26 +312,18 @@ class PacubosGame:
                         g.make_vulnerable(POWER_DURATION)
                 elif st == 'speed':
                     self.player_speed = PLAYER_SPEED * 1.8
-                    self._speed_until = time.time() + SPEED_DURATION
+                    if self.speed_timer is not None:
+                        self.speed_timer.cancel()
+                    self.speed_timer = self.timers.call_later(SPEED_DURATION, self.end_speed)
                 elif st == 'giant':
                     self.player_size = PLAYER_SIZE * 2
-                    self._giant_until = time.time() + GIANT_DURATION
+                    if self.giant_timer is not None:
+                        self.giant_timer.cancel()
+                    self.giant_timer = self.timers.call_later(GIANT_DURATION, self.end_giant)
                 try:
                     self.specials.remove(s)
                 except Exception:
                     pass
-        if hasattr(self, '_speed_until') and time.time() > self._speed_until:
-            self.player_speed = PLAYER_SPEED
-            try:
-                del self._speed_until
-            except Exception:
-                pass
-        if hasattr(self, '_giant_until') and time.time() > self._giant_until:
-            self.player_size = PLAYER_SIZE
-            try:
-                del self._giant_until
-            except Exception:
-                pass
         for w in list(self.walls):
             w['x'] += w.get('vx', 0) * dt
             w['y'] += w.get('vy', 0) * dt
@@ -401,16 +367,18 @@ class PacubosGame:
                         self.entering_initials = True
                         self.initials = ['A', 'A', 'A']
                         self.initial_index = 0
-        if time.time() - self._last_special > SPECIAL_SPAWN_INTERVAL:
-            self.spawn_special()
-        if time.time() - self._last_wall > WALL_SPAWN_INTERVAL:
-            self.spawn_wall()
-        self.spawn_ghost_if_needed()
+        self.timers.run_due()
+
+    def end_speed(self):
+        self.player_speed = PLAYER_SPEED
+        self.speed_timer = None
+
+    def end_giant(self):
+        self.player_size = PLAYER_SIZE
+        self.giant_timer = None
 
     def draw(self):
-        self.screen.fill(BG_COLOR)
-        for p in self.pellets:
-            pygame.draw.circle(self.screen, PELLET_COLOR, (int(p[0]), int(p[1])), PELLET_RADIUS)
+        self.pellets.draw(self.screen)
         for s in self.specials:
             col = (255, 255, 255)
             if s['type'] == 'power': col = (255, 180, 180)
@@ -431,10 +399,7 @@ class PacubosGame:
         lives_surf = self.font.render(f'Vidas: {self.lives}', True, (220, 220, 220))
         self.screen.blit(score_surf, (10, 10))
         self.screen.blit(lives_surf, (10, 36))
-        if self.start_time:
-            elapsed = int(time.time() - self.start_time)
-        else:
-            elapsed = 0
+        elapsed = int(self.elapsed())
         mins = elapsed // 60
         secs = elapsed % 60
         t_surf = self.font.render(f'Tempo: {mins:02d}:{secs:02d}', True, (220, 220, 220))
@@ -455,28 +420,32 @@ class PacubosGame:
                 col = (255, 255, 255) if i == self.initial_index else (180, 180, 180)
                 c_s = self.bigfont.render(ch, True, col)
                 self.screen.blit(c_s, (rect.x + 60 + i * 100, rect.y + 50))
-        board = load_leaderboard()
-        x = SCREEN_WIDTH - 220
-        y = 80
-        head = self.font.render('Top 10', True, (220, 220, 220))
-        self.screen.blit(head, (x, y))
-        y += 30
-        for i, e in enumerate(board):
-            line = self.font.render(f"{i+1}. {e['name']} {e['score']} ({e['time']}s)", True, (200, 200, 200))
-            self.screen.blit(line, (x, y))
-            y += 22
+        self.draw_leaderboard()
         pygame.display.flip()
 
+    def draw_leaderboard(self):
+        # o placar vira uma superfície só, refeita quando entra uma pontuação
+        if self.leaderboard_version != self.leaderboard.version:
+            self.leaderboard_version = self.leaderboard.version
+            entries = self.leaderboard.entries
+            lines = [self.font.render(f"{i+1}. {e['name']} {e['score']} ({e['time']}s)", True, (200, 200, 200)) for i, e in enumerate(entries)]
+            head = self.font.render('Top 10', True, (220, 220, 220))
+            width = max([head.get_width()] + [line.get_width() for line in lines])
+            self.leaderboard_surf = pygame.Surface((width, 30 + 22 * len(lines)), pygame.SRCALPHA)
+            self.leaderboard_surf.blit(head, (0, 0))
+            for i, line in enumerate(lines):
+                self.leaderboard_surf.blit(line, (0, 30 + 22 * i))
+        self.screen.blit(self.leaderboard_surf, (SCREEN_WIDTH - 220, 80))
+
 def main():
     g = PacubosGame()
     running = True
     while running:
         dt = g.clock.tick(60) / 1000.0
         running = g.handle_events()
-        if g.game_state == 'playing' and not g.entering_initials and g.start_time == 0:
-            g.start_time = time.time()
         g.update(dt)
         g.draw()
+    g.leaderboard.flush()
     pygame.quit()
 
 if __name__ == '__main__':
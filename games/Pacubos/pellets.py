@@ -0,0 +1,86 @@
+"""Pastilhas do Pacubos numa grade.
+
+As pastilhas já nascem alinhadas a ``PELLET_SPACING``, então cada uma é uma
+célula de um bytearray (1 = ainda está lá). Para comer, o player só testa as
+células sob ele, em vez de varrer todas as pastilhas. O desenho também não
+passa por elas: as que restam ficam pintadas numa camada de fundo do tamanho
+da tela, e comer uma só apaga aquele quadradinho da camada.
+"""
+import math
+
+import pygame
+
+
+class PelletField:
+    def __init__(self, width, height, spacing, margin, radius, color, background):
+        self.width = width
+        self.height = height
+        self.spacing = spacing
+        self.margin = margin
+        self.radius = radius
+        self.color = color
+        self.background = background
+        self.cols = len(range(margin, width - margin, spacing))
+        self.rows = len(range(margin, height - margin, spacing))
+        self.cells = bytearray(self.cols * self.rows)
+        self.count = 0
+        self.layer = pygame.Surface((width, height)).convert()
+        # uma pastilha desenhada uma vez, carimbada na camada
+        size = 2 * radius + 1
+        self.sprite = pygame.Surface((size, size)).convert()
+        self.sprite.fill(background)
+        pygame.draw.circle(self.sprite, color, (radius, radius), radius)
+
+    def __len__(self):
+        return self.count
+
+    def center(self, c, r):
+        return self.margin + c * self.spacing, self.margin + r * self.spacing
+
+    def reset(self, hole=40):
+        """Enche a grade de novo, sem as pastilhas a menos de 'hole' px do centro da tela."""
+        self.cells[:] = b'\x01' * len(self.cells)
+        cols = [c for c in range(self.cols) if abs(self.center(c, 0)[0] - self.width // 2) < hole]
+        rows = [r for r in range(self.rows) if abs(self.center(0, r)[1] - self.height // 2) < hole]
+        for r in rows:
+            for c in cols:
+                self.cells[r * self.cols + c] = 0
+        self.count = self.cells.count(1)
+        self.bake()
+
+    def bake(self):
+        self.layer.fill(self.background)
+        self.layer.blits([
+            (self.sprite, (x - self.radius, y - self.radius))
+            for x, y in (self.center(i % self.cols, i // self.cols) for i in range(len(self.cells)) if self.cells[i])
+        ], doreturn=False)
+
+    def eat(self, x, y, reach):
+        """
+        Come as pastilhas cujo centro está a menos de 'reach' de (x, y);
+        retorna quantas foram comidas.
+        """
+        s, m = self.spacing, self.margin
+        c0 = max(0, math.ceil((x - reach - m) / s))
+        c1 = min(self.cols - 1, math.floor((x + reach - m) / s))
+        r0 = max(0, math.ceil((y - reach - m) / s))
+        r1 = min(self.rows - 1, math.floor((y + reach - m) / s))
+        reach_sq = reach * reach
+        size = 2 * self.radius + 1
+        eaten = 0
+        for r in range(r0, r1 + 1):
+            py = m + r * s
+            base = r * self.cols
+            for c in range(c0, c1 + 1):
+                if not self.cells[base + c]:
+                    continue
+                px = m + c * s
+                if (x - px) ** 2 + (y - py) ** 2 < reach_sq:
+                    self.cells[base + c] = 0
+                    self.layer.fill(self.background, (px - self.radius, py - self.radius, size, size))
+                    eaten += 1
+        self.count -= eaten
+        return eaten
+
+    def draw(self, surf):
+        surf.blit(self.layer, (0, 0))
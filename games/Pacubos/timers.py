@@ -0,0 +1,65 @@
+"""Relógio do jogo e agenda de eventos do Pacubos.
+
+O ``GameClock`` não lê a hora do sistema: ele só anda quando o laço chama
+``advance(dt)``, com o dt do ``pygame.time.Clock`` (monotônico). Assim o tempo
+do jogo para junto com ele (menu, iniciais), não pula quando o relógio do
+sistema muda e, sem janela, pode andar mais rápido que o tempo real.
+
+O ``Scheduler`` guarda os eventos num heap de (prazo, ordem, timer) e, a cada
+quadro, só tira do heap os que já venceram, em vez de conferir cada timer.
+"""
+import heapq
+import itertools
+
+
+class GameClock:
+    def __init__(self, max_step=0.25):
+        self.now = 0.0
+        self.max_step = max_step   # um quadro travado não faz o jogo pular mais que isso
+
+    def advance(self, dt):
+        self.now += min(max(0.0, dt), self.max_step)
+        return self.now
+
+
+class Timer:
+    __slots__ = ('deadline', 'callback', 'cancelled')
+
+    def __init__(self, deadline, callback):
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Scheduler:
+    def __init__(self, clock):
+        self.clock = clock
+        self.heap = []
+        self.order = itertools.count()   # desempate: mesmo prazo, ordem de chegada
+
+    def __len__(self):
+        return len(self.heap)
+
+    def call_later(self, delay, callback):
+        """Agenda callback() para daqui a 'delay' segundos do jogo; retorna o Timer."""
+        timer = Timer(self.clock.now + delay, callback)
+        heapq.heappush(self.heap, (timer.deadline, next(self.order), timer))
+        return timer
+
+    def run_due(self):
+        """Chama os eventos vencidos, em ordem de prazo; retorna quantos rodaram."""
+        heap = self.heap
+        now = self.clock.now
+        fired = 0
+        while heap and heap[0][0] <= now:
+            timer = heapq.heappop(heap)[2]
+            if not timer.cancelled:
+                timer.callback()
+                fired += 1
+        return fired
+
+    def clear(self):
+        self.heap.clear()
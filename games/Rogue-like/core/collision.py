@@ -0,0 +1,27 @@
+def hits(rect, projectiles, attr='rect'):
+    # tiros de um ProjectileManager cujo retângulo (attr) encosta em rect
+    shots = projectiles.items
+    return [shots[i] for i in rect.collidelistall([getattr(p, attr) for p in shots])]
+
+def hit_enemies(projectiles, enemies):
+    # Cada tiro acerta no máximo um inimigo e some; o inimigo perde 1 de vida
+    # por tiro. Os mortos saem da lista só no fim, sem mexer nas listas
+    # durante o laço. Devolve quantos inimigos morreram.
+    shots = projectiles.items
+    rects = [p.rect for p in shots]
+    spent = set()
+    alive = []
+    for e in enemies:
+        for i in e.rect.collidelistall(rects):
+            if i in spent:
+                continue
+            spent.add(i)
+            e.hp -= 1
+            if e.hp <= 0:
+                break
+        if e.hp > 0:
+            alive.append(e)
+    killed = len(enemies) - len(alive)
+    enemies[:] = alive
+    projectiles.kill_many({shots[i] for i in spent})
+    return killed
@@ -2,12 +2,36 @@ import pygame
 from settings import *
 
 class Engine:
-    def __init__(self):
+    """Janela e relógio de passo fixo.
+
+    A simulação anda em passos de ``dt = 1 / tick_rate`` segundos; o tempo real
+    de cada quadro (vezes ``time_scale``) vai para um acumulador e ``steps()``
+    entrega quantos passos couberem nele. O que sobra vira ``alpha`` (0 a 1),
+    usado para desenhar as entidades entre a posição anterior e a atual::
+
+        for dt in game.steps():
+            atualiza(dt)
+        desenha(game.alpha)
+        game.update()
+    """
+
+    def __init__(self, tick_rate=TICK_RATE, time_scale=TIME_SCALE):
         pygame.init()
         self.window = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("rouge-like")
         self.clock = pygame.time.Clock()
+        self.dt = 1 / tick_rate
+        self.time_scale = time_scale
+        self.accumulator = self.dt  # o primeiro quadro já simula um passo
+        self.alpha = 0.0
+
+    def steps(self):
+        while self.accumulator >= self.dt:
+            self.accumulator -= self.dt
+            yield self.dt
+        self.alpha = self.accumulator / self.dt
 
     def update(self):
         pygame.display.update()
-        self.clock.tick(FPS)
+        elapsed = self.clock.tick(FPS) / 1000
+        self.accumulator += min(elapsed, MAX_FRAME_TIME) * self.time_scale
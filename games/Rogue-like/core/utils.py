@@ -2,3 +2,14 @@ import math
 
 def distance(obj1, obj2):
     return math.hypot(obj1.x - obj2.x, obj1.y - obj2.y)
+
+def lerp(a, b, t):
+    return a + (b - a) * t
+
+# somar e subtrair dt acumula erro de ponto flutuante: um timer abaixo disso já acabou
+TIME_EPSILON = 1e-6
+
+def countdown(timer, dt):
+    # desconta dt de um timer em segundos; devolve 0 quando ele acaba
+    timer -= dt
+    return timer if timer > TIME_EPSILON else 0.0
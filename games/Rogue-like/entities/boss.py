@@ -1,6 +1,6 @@
 import pygame
 from settings import *
-from entities.projectile import bossProjectile
+from core.utils import countdown
 import math
 
 class Boss:
@@ -9,19 +9,20 @@ class Boss:
         self.y = 100
         self.size = 100
         self.hp = BOSS_HP
+        self.rect = pygame.Rect(self.x, self.y, self.size, self.size)
 
         # Controle de tiros
-        self.last_shot = pygame.time.get_ticks()
-        self.shot_delay = 1000  # 1 segundo entre ataques
+        self.shot_delay = BOSS_SHOT_DELAY  # segundos entre ataques
+        self.shot_timer = self.shot_delay
 
     def draw(self, win):
         pygame.draw.rect(win, (200, 0, 200), (self.x, self.y, self.size, self.size))
 
-    def shoot(self, boss_projectiles):
-        now = pygame.time.get_ticks()
-        if now - self.last_shot >= self.shot_delay:
-            self.last_shot = now
-            speed = 2
+    def shoot(self, boss_projectiles, dt):
+        self.shot_timer = countdown(self.shot_timer, dt)
+        if self.shot_timer == 0:
+            self.shot_timer = self.shot_delay
+            speed = BOSS_PROJECTILE_SPEED
 
             # Bullet-hell: cria projéteis em círculo
             num_bullets = 8
@@ -30,14 +31,13 @@ class Boss:
                 dir_x = math.cos(angle)
                 dir_y = math.sin(angle)
 
-                proj = bossProjectile(
+                boss_projectiles.spawn(
                     self.x + self.size // 2,
                     self.y + self.size // 2,
                     dir_x=dir_x,
                     dir_y=dir_y,
                     speed=speed
                 )
-                boss_projectiles.append(proj)
 
     def take_damage(self, amount):
         self.hp -= amount
@@ -1,7 +1,7 @@
 import pygame
 import random
 from settings import *
-from entities.projectile import Projectile
+from core.utils import lerp, countdown
 
 class Enemy:
     def __init__(self):
@@ -10,21 +10,27 @@ class Enemy:
         self.hp = ENEMY_HP
         self.speed = ENEMY_SPEED
         self.size = 35
-        self.shoot_cd = 60
+        self.shoot_cd = ENEMY_FIRST_SHOT
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.rect = pygame.Rect(self.x, self.y, self.size, self.size)
 
-    def draw(self, win):
-        pygame.draw.rect(win, (255, 50, 50), (self.x, self.y, self.size, self.size))
+    def draw(self, win, alpha=1.0):
+        x, y = lerp(self.prev_x, self.x, alpha), lerp(self.prev_y, self.y, alpha)
+        pygame.draw.rect(win, (255, 50, 50), (x, y, self.size, self.size))
 
-    def follow(self, player):
-        if player.x > self.x: self.x += self.speed
-        if player.x < self.x: self.x -= self.speed
-        if player.y > self.y: self.y += self.speed
-        if player.y < self.y: self.y -= self.speed
+    def follow(self, player, dt):
+        self.prev_x, self.prev_y = self.x, self.y
+        step = self.speed * dt
+        if player.x > self.x: self.x += step
+        if player.x < self.x: self.x -= step
+        if player.y > self.y: self.y += step
+        if player.y < self.y: self.y -= step
+        self.rect.topleft = (self.x, self.y)
 
-    def shoot(self, player, projectiles):
+    def shoot(self, player, projectiles, dt):
         if self.shoot_cd == 0:
-            proj = Projectile(self.x, self.y, (player.x, player.y))
-            projectiles.append(proj)
-            self.shoot_cd = 90
+            projectiles.spawn(self.x, self.y, (player.x, player.y))
+            self.shoot_cd = ENEMY_SHOT_COOLDOWN
         else:
-            self.shoot_cd -= 1
+            self.shoot_cd = countdown(self.shoot_cd, dt)
@@ -1,6 +1,6 @@
 import pygame
 from settings import *
-from entities.projectile import Projectile
+from core.utils import lerp, countdown
 
 class Player:
     def __init__(self, x, y):
@@ -12,26 +12,33 @@ class Player:
         self.size = 40
         self.cooldown = 0  # delay entre tiros
         self.damage_timer = 0
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.rect = pygame.Rect(self.x, self.y, self.size, self.size)
 
         # --- habilidades ---
         self.ability_active = False
         self.ability_on_cooldown = False
-        self.ability_duration = 10000
-        self.ability_cooldown_time = 60000
-        self.ability_cooldown_start_time = 0
-        self.ability_start_time = 0
+        self.ability_duration = 10.0  # segundos
+        self.ability_cooldown_time = 60.0
+        self.ability_timer = 0
+        self.ability_cooldown_timer = 0
 
-    def draw(self, win):
-        pygame.draw.rect(win, (0, 150, 255), (self.x, self.y, self.size, self.size))
+    def draw(self, win, alpha=1.0):
+        x, y = lerp(self.prev_x, self.x, alpha), lerp(self.prev_y, self.y, alpha)
+        pygame.draw.rect(win, (0, 150, 255), (x, y, self.size, self.size))
 
-    def move(self, keys):
-        if keys[pygame.K_a]: self.x -= self.speed
-        if keys[pygame.K_d]: self.x += self.speed
-        if keys[pygame.K_w]: self.y -= self.speed
-        if keys[pygame.K_s]: self.y += self.speed
+    def move(self, keys, dt):
+        self.prev_x, self.prev_y = self.x, self.y
+        step = self.speed * dt
+        if keys[pygame.K_a]: self.x -= step
+        if keys[pygame.K_d]: self.x += step
+        if keys[pygame.K_w]: self.y -= step
+        if keys[pygame.K_s]: self.y += step
 
         self.x = max(0, min(self.x, WIDTH - self.size))
         self.y = max(0, min(self.y, HEIGHT - self.size))
+        self.rect.topleft = (self.x, self.y)
 
     def auto_shoot(self, projectiles, enemies, boss):
         if self.cooldown > 0:
@@ -58,34 +65,31 @@ class Player:
         )
 
     # Atira exatamente como o shoot normal
-        proj = Projectile(self.x + self.size // 2, self.y + self.size // 2, target_pos)
-        projectiles.append(proj)
-        self.cooldown = 15  # recarrega
+        projectiles.spawn(self.x + self.size // 2, self.y + self.size // 2, target_pos)
+        self.cooldown = PLAYER_SHOT_COOLDOWN  # recarrega
 
 
-    def update_cooldown(self):
-        if self.cooldown > 0:
-            self.cooldown -= 1
-    def handly_ability(self, keys):
-        now = pygame.time.get_ticks()
-
+    def update_cooldown(self, dt):
+        self.cooldown = countdown(self.cooldown, dt)
+    def handly_ability(self, keys, dt):
         if (keys[pygame.K_o]) and not self.ability_active and not self.ability_on_cooldown:
             self.ability_active = True
             self.speed = self.speed_normal * 2
-            self.ability_start_time = now
+            self.ability_timer = self.ability_duration
         
         if self.ability_active:
-            if now - self.ability_start_time >= self.ability_duration:
+            self.ability_timer = countdown(self.ability_timer, dt)
+            if self.ability_timer == 0:
                 self.ability_active = False
                 self.speed = self.speed_normal
                 self.ability_on_cooldown = True
-                self.cooldown_start_time = now
+                self.ability_cooldown_timer = self.ability_cooldown_time
 
         if self.ability_on_cooldown:
-            if now - self.cooldown_start_time >= self.ability_cooldown_time:
+            self.ability_cooldown_timer = countdown(self.ability_cooldown_timer, dt)
+            if self.ability_cooldown_timer == 0:
                 self.ability_on_cooldown = False
                 
-    def update_damage_timer(self):
-        if self.damage_timer > 0:
-            self.damage_timer -= 1
+    def update_damage_timer(self, dt):
+        self.damage_timer = countdown(self.damage_timer, dt)
 
@@ -1,12 +1,26 @@
 import pygame
 import math
-from settings import PROJECTILE_SPEED
+from settings import (
+    WIDTH, HEIGHT, PROJECTILE_SPEED, PROJECTILE_POOL_SIZE, BOSS_PROJECTILE_POOL_SIZE,
+    PROJECTILE_CULL_MARGIN,
+)
+from core.utils import lerp
+try:
+    from hub.projectiles import ProjectilePool
+except ImportError:
+    ProjectilePool = None
 
 class Projectile:
-    def __init__(self, x, y, target_pos):
+    def __init__(self, x=0, y=0, target_pos=(0, 0)):
+        self.reset(x, y, target_pos)
+
+    def reset(self, x, y, target_pos):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.radius = 6
+        self.age = 0
         
         dx = target_pos[0] - x
         dy = target_pos[1] - y
@@ -18,17 +32,31 @@ class Projectile:
         self.dx = (dx / dist) * PROJECTILE_SPEED
         self.dy = (dy / dist) * PROJECTILE_SPEED
 
-    def move(self):
-        self.x += self.dx
-        self.y += self.dy
+        # rect: acerto nos inimigos e no jogador; bounds: caixa do círculo, acerto no boss
+        self.rect = pygame.Rect(x, y, 6, 6)
+        self.bounds = pygame.Rect(x - self.radius, y - self.radius, self.radius * 2, self.radius * 2)
+
+    def move(self, dt):
+        self.prev_x, self.prev_y = self.x, self.y
+        self.x += self.dx * dt
+        self.y += self.dy * dt
+        self.rect.topleft = (self.x, self.y)
+        self.bounds.topleft = (self.x - self.radius, self.y - self.radius)
 
-    def draw(self, win):
-        pygame.draw.circle(win, (255, 255, 0), (int(self.x), int(self.y)), self.radius)
+    def draw(self, win, alpha=1.0):
+        pos = (int(lerp(self.prev_x, self.x, alpha)), int(lerp(self.prev_y, self.y, alpha)))
+        pygame.draw.circle(win, (255, 255, 0), pos, self.radius)
 
 class bossProjectile:
-    def __init__(self, x, y, amplitude=20, frequency=0.1, dir_x=0, dir_y=5 , speed=1.5):
+    # amplitude e speed em pixels por segundo, frequency em radianos por segundo
+    def __init__(self, x=0, y=0, amplitude=1200, frequency=3.0, dir_x=0, dir_y=5 , speed=90):
+        self.reset(x, y, amplitude, frequency, dir_x, dir_y, speed)
+
+    def reset(self, x, y, amplitude=1200, frequency=3.0, dir_x=0, dir_y=5 , speed=90):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.size = 8
         self.dir_x = dir_x
         self.dir_y = dir_y
@@ -39,11 +67,96 @@ class bossProjectile:
         self.speed = speed
         self.base_y = y
         self.time = 0
+        self.age = 0
+        self.rect = pygame.Rect(x - self.size, y - self.size, self.size * 2, self.size * 2)
+
+    def move(self, dt):
+        self.prev_x, self.prev_y = self.x, self.y
+        self.x += self.dir_x * self.speed * dt
+        self.y += (self.dir_y * self.speed + self.amplitude * math.sin(self.frequency * self.time)) * dt
+        self.time += dt
+        self.rect.topleft = (self.x - self.size, self.y - self.size)
+
+    def draw(self, win, alpha=1.0):
+        pos = (int(lerp(self.prev_x, self.x, alpha)), int(lerp(self.prev_y, self.y, alpha)))
+        pygame.draw.circle(win, (255, 50, 50), pos, self.size)
+
+# --- pools: os tiros são reaproveitados em vez de criados a cada disparo ---
+# Rodando sozinho (sem o pacote hub) não há pool: os pools ficam None e cada
+# tiro é criado direto pela classe.
+if ProjectilePool:
+    projectile_pool = ProjectilePool(Projectile, PROJECTILE_POOL_SIZE)
+    boss_projectile_pool = ProjectilePool(bossProjectile, BOSS_PROJECTILE_POOL_SIZE)
+else:
+    projectile_pool = boss_projectile_pool = None
+
+
+class ProjectileManager:
+    """Tiros vivos de um tipo. Cria pelo pool, move e devolve ao pool os que
+    saem da tela (mais a margem) ou passam de ``ttl`` segundos. Sem pool
+    (``pool`` None), cria cada tiro com ``kind``."""
+
+    def __init__(self, pool, ttl, margin=PROJECTILE_CULL_MARGIN, kind=None):
+        self.pool = pool
+        self.kind = kind
+        self.ttl = ttl
+        self.margin = margin
+        self.items = []
+        self.culled = 0
+        self.expired = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        # itera sobre uma cópia: dá para chamar kill() dentro do laço
+        return iter(self.items[:])
+
+    def spawn(self, *args, **kwargs):
+        if self.pool is not None:
+            projectile = self.pool.acquire(*args, **kwargs)
+        else:
+            projectile = self.kind(*args, **kwargs)
+        self.items.append(projectile)
+        return projectile
+
+    def kill(self, projectile):
+        if projectile in self.items:
+            self.items.remove(projectile)
+            if self.pool is not None:
+                self.pool.release(projectile)
+
+    def kill_many(self, spent):
+        # spent: conjunto de tiros que acertaram algo neste quadro
+        if spent:
+            self.items = [p for p in self.items if p not in spent]
+            if self.pool is not None:
+                self.pool.release_all(spent)
+
+    def clear(self):
+        if self.pool is not None:
+            self.pool.release_all(self.items)
+        self.items = []
 
-    def move(self):
-        self.x += self.dir_x * self.speed
-        self.y += self.dir_y * self.speed + self.amplitude * math.sin(self.frequency * self.time)
-        self.time += 0.5
+    def update(self, dt):
+        left, top = -self.margin, -self.margin
+        right, bottom = WIDTH + self.margin, HEIGHT + self.margin
+        alive = []
+        for p in self.items:
+            p.move(dt)
+            p.age += dt
+            if p.age > self.ttl:
+                self.expired += 1
+                if self.pool is not None:
+                    self.pool.release(p)
+            elif not (left <= p.x <= right and top <= p.y <= bottom):
+                self.culled += 1
+                if self.pool is not None:
+                    self.pool.release(p)
+            else:
+                alive.append(p)
+        self.items = alive
 
-    def draw(self, win):
-        pygame.draw.circle(win, (255, 50, 50), (int(self.x), int(self.y)), self.size)
+    def draw(self, win, alpha=1.0):
+        for p in self.items:
+            p.draw(win, alpha)
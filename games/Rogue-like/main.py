@@ -48,22 +48,36 @@ from core.engine import Engine
 from entities.player import Player
 from entities.enemy import Enemy
 from entities.boss import Boss
+from entities.projectile import Projectile, bossProjectile, projectile_pool, boss_projectile_pool, ProjectileManager
+from core.collision import hits, hit_enemies
 from ui.game_over import GameOverScreen
+from ui.hud import Hud
 from sounds import *
+
+try:
+    from hub.perf import active_monitor
+    perf = active_monitor()
+except ImportError:
+    perf = None
 # --- usado para arazenar pontuação ---
 global_score = 0
 # --- main ---
 # cria objetos das classes
 def main():
+    # tiros que sobraram da partida anterior voltam para os pools
+    if projectile_pool is not None:
+        projectile_pool.release_all()
+        boss_projectile_pool.release_all()
     game = Engine()
     player = Player(400, 500)
     enemies = [Enemy() for _ in range(10)]
-    projectiles = []
-    enemy_projectiles = []
-    boss_projectiles = []
+    projectiles = ProjectileManager(projectile_pool, PROJECTILE_TTL, kind=Projectile)
+    enemy_projectiles = ProjectileManager(projectile_pool, PROJECTILE_TTL, kind=Projectile)
+    boss_projectiles = ProjectileManager(boss_projectile_pool, BOSS_PROJECTILE_TTL, kind=bossProjectile)
     boss = None
     game_over = False
     go_screen = GameOverScreen()
+    hud = Hud()
     global global_score
     pygame.mixer.music.play(-1)
 
@@ -87,125 +101,88 @@ def main():
                     return
 
         if not game_over:
-            # MOVE PLAYER
             keys = pygame.key.get_pressed()
-            player.handly_ability(keys)
-            player.auto_shoot(projectiles, enemies, boss)
-            player.move(keys)
-            player.update_damage_timer()
-            player.update_cooldown()
-            player.draw(game.window)
-
-
-            # ENEMIES
-            for e in enemies:
-                e.follow(player)
-                e.shoot(player, enemy_projectiles)
-                e.draw(game.window)
+            # simulação: passos fixos de dt segundos (Engine.steps)
+            for dt in game.steps():
+                # MOVE PLAYER
+                player.handly_ability(keys, dt)
+                player.auto_shoot(projectiles, enemies, boss)
+                player.move(keys, dt)
+                player.update_damage_timer(dt)
+                player.update_cooldown(dt)
+
+                # ENEMIES
+                for e in enemies:
+                    e.follow(player, dt)
+                    e.shoot(player, enemy_projectiles, dt)
+
+                    if not hasattr(player, 'damager_timer'):
+                        player.damage_timer = 0
+
+                    if player.damage_timer == 0 and e.rect.colliderect(player.rect):
+                        if player.damage_timer == 0:
+                            player.hp -= 1
+                            player.damage_timer = PLAYER_INVINCIBILITY
 
-                if not hasattr(player, 'damager_timer'):
-                    player.damage_timer = 0
-
-                if player.damage_timer == 0 and pygame.Rect(e.x,e.y,35, 35).colliderect(pygame.Rect(player.x,player.y,40,40)):
-                    if player.damage_timer == 0:
-                        player.hp -= 1
-                        player.damage_timer = 100 # invencibilidade por 1 segundo
-
-                
                 # jogador tiros vs inimigos
-                for p in projectiles:
-                    if pygame.Rect(p.x,p.y,6,6).colliderect(
-                            pygame.Rect(e.x,e.y,35,35)):
-                        e.hp -= 1
-                        projectiles.remove(p)
-                        if e.hp <= 0:
-                            enemies.remove(e)
-                            global_score += 1
-
-            # spawn do boss
-            if len(enemies) == 0 and boss is None:
-                boss = Boss()
-
+                global_score += hit_enemies(projectiles, enemies)
+
+                # spawn do boss
+                if len(enemies) == 0 and boss is None:
+                    boss = Boss()
+
+                if boss:
+                    boss.shoot(boss_projectiles, dt)
+
+                    spent = hits(boss.rect, projectiles, 'bounds')
+                    boss.take_damage(len(spent))
+                    projectiles.kill_many(set(spent))
+
+                    # --- volta para o main e reinicializa o jogo ---
+                    # --- sujeito a mudanças caso seja criado outras fases ---
+                    if boss.hp <= 0:
+                        global_score += 10
+                        return main()
+
+                # tiros
+                projectiles.update(dt)
+                enemy_projectiles.update(dt)
+                boss_projectiles.update(dt)
+
+                spent = hits(player.rect, enemy_projectiles)
+                player.hp -= len(spent)
+                enemy_projectiles.kill_many(set(spent))
+                spent = hits(player.rect, boss_projectiles)
+                player.hp -= len(spent)
+                boss_projectiles.kill_many(set(spent))
+
+                # # --- para a musica e reinicializa os pontos
+                if player.hp <= 0:
+                    global_score = 0
+                    pygame.mixer.music.stop()
+                    game_over = True
+                    break
+
+            # desenho: posições interpoladas entre o último passo e o atual
+            alpha = game.alpha
+            player.draw(game.window, alpha)
+            for e in enemies:
+                e.draw(game.window, alpha)
             # desenhas o boss é o bossProjectile da classe bossProjectile
             if boss:
                 boss.draw(game.window)
-                boss.shoot(boss_projectiles)
-
-                
-                PLAYER_PROJECTILE_RADIUS = 6  # igual ao p.radius
-
-                for p in projectiles[:]:
-                    proj_rect = pygame.Rect(
-                        p.x - p.radius,
-                        p.y - p.radius,
-                        p.radius * 2,
-                        p.radius * 2
-                    )
-
-                    boss_rect = pygame.Rect(boss.x, boss.y, boss.size, boss.size)
-
-                    if boss_rect.colliderect(proj_rect):
-                        boss.take_damage(1)
-                        projectiles.remove(p)
-
-
-
-                # --- volta para o main e reinicializa o jogo ---
-                # --- sujeito a mudanças caso seja criado outras fases ---
-                if boss.hp <= 0:
-                    global_score += 10
-                    return main()
-
-            # tiros jogador
-            for p in projectiles:
-                p.move()
-                p.draw(game.window)
-
-            # tiros inimigos
-            for ep in enemy_projectiles:
-                ep.move()
-                ep.draw(game.window)
-
-                if pygame.Rect(ep.x,ep.y,6,6).colliderect(
-                        pygame.Rect(player.x,player.y,40,40)):
-                    player.hp -= 1
-                    enemy_projectiles.remove(ep)
+            projectiles.draw(game.window, alpha)
+            enemy_projectiles.draw(game.window, alpha)
             #escrever na tela
-            font = pygame.font.SysFont('arial', 24)
-            life_text = font.render(f'vida : {player.hp}', True, (255, 0, 0))
-            text = font.render(f'pontos : {global_score}', True, (255, 255, 0))
-            using = font.render(f'use O para acelerar', True, (0, 0, 255))
-            game.window.blit(life_text, (10, 10))
-            game.window.blit(text, (10, 40))
-            game.window.blit(using, (WIDTH // 2, 10))
-            # tiros boss
-            for bp in boss_projectiles:
-                bp.move()
-                bp.draw(game.window)
-
-                proj_rect = pygame.Rect(
-                    bp.x - bp.size,
-                    bp.y - bp.size,
-                    bp.size * 2,
-                    bp.size * 2
-                )
-
-                player_rect = pygame.Rect(player.x, player.y, 40, 40)
-
-                if proj_rect.colliderect(player_rect):
-                    player.hp -= 1
-                    boss_projectiles.remove(bp)
-
-
-            # # --- para a musica e reinicializa os pontos
-            if player.hp <= 0:
-                global_score = 0
-                pygame.mixer.music.stop()
-                game_over = True
+            hud.draw(game.window, player.hp, global_score)
+            boss_projectiles.draw(game.window, alpha)
 
         else:
             go_screen.draw(game.window)
 
+        if perf:
+            perf.count('inimigos', len(enemies))
+            perf.count('projeteis', len(projectiles) + len(enemy_projectiles) + len(boss_projectiles))
         game.update()
 
 if __name__ == "__main__":
@@ -2,10 +2,32 @@ WIDTH = 1280
 HEIGHT = 720
 FPS = 60
 
-PLAYER_SPEED = 5
-PROJECTILE_SPEED = 10
-ENEMY_SPEED = 2
+# simulação em passo fixo: TICK_RATE passos por segundo, independente do FPS do desenho.
+# Em máquinas fracas dá para baixar TICK_RATE; TIME_SCALE > 1 acelera o jogo (testes sem janela).
+TICK_RATE = 60
+TIME_SCALE = 1.0
+MAX_FRAME_TIME = 0.25  # segundos: um quadro travado não vira uma avalanche de passos
+
+# velocidades em pixels por segundo, tempos em segundos
+PLAYER_SPEED = 300
+PROJECTILE_SPEED = 600
+ENEMY_SPEED = 120
+BOSS_PROJECTILE_SPEED = 120
+
+PLAYER_SHOT_COOLDOWN = 0.25
+PLAYER_INVINCIBILITY = 5 / 3
+ENEMY_FIRST_SHOT = 1.0
+ENEMY_SHOT_COOLDOWN = 1.5
+BOSS_SHOT_DELAY = 1.0
 
 PLAYER_MAX_HP = 10
 ENEMY_HP = 3
 BOSS_HP = 40
+
+PROJECTILE_POOL_SIZE = 128
+BOSS_PROJECTILE_POOL_SIZE = 256
+
+# tiros saem de cena ao passar da margem da tela ou do tempo de vida (em segundos)
+PROJECTILE_CULL_MARGIN = 50
+PROJECTILE_TTL = 3.0
+BOSS_PROJECTILE_TTL = 8.0
@@ -1,16 +1,17 @@
 import pygame
+from ui.fonts import get_font
 
 class Button:
     def __init__(self, x, y, w, h, text):
         self.rect = pygame.Rect(x, y, w, h)
         self.text = text
-        self.font = pygame.font.SysFont("arial", 32)
+        self.font = get_font("arial", 32)
         self.color = (200, 200, 200)
+        self.label = self.font.render(self.text, True, (0,0,0))
 
     def draw(self, win):
         pygame.draw.rect(win, self.color, self.rect)
-        label = self.font.render(self.text, True, (0,0,0))
-        win.blit(label, (self.rect.x + 10, self.rect.y + 10))
+        win.blit(self.label, (self.rect.x + 10, self.rect.y + 10))
 
     def is_clicked(self, pos):
         return self.rect.collidepoint(pos)
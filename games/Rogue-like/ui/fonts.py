@@ -0,0 +1,10 @@
+import pygame
+
+# SysFont procura a fonte no sistema a cada chamada; cada (nome, tamanho) é criado uma vez só
+_fonts = {}
+
+def get_font(name, size):
+    key = (name, size)
+    if key not in _fonts:
+        _fonts[key] = pygame.font.SysFont(name, size)
+    return _fonts[key]
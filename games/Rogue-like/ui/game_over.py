@@ -1,14 +1,15 @@
 import pygame
 from ui.button import Button
+from ui.fonts import get_font
 
 class GameOverScreen:
     def __init__(self):
-        self.font = pygame.font.SysFont("arial", 50)
+        self.font = get_font("arial", 50)
+        self.text = self.font.render("GAME OVER", True, (255, 0, 0))
         self.btn_restart = Button(280, 300, 240, 60, "JOGAR NOVAMENTE")
         self.btn_exit = Button(280, 400, 240, 60, "FECHAR")
 
     def draw(self, win):
-        text = self.font.render("GAME OVER", True, (255, 0, 0))
-        win.blit(text, (260, 150))
+        win.blit(self.text, (260, 150))
         self.btn_restart.draw(win)
         self.btn_exit.draw(win)
@@ -0,0 +1,23 @@
+from settings import WIDTH
+from ui.fonts import get_font
+
+class Hud:
+    # vida e pontos só são renderizados de novo quando mudam
+    def __init__(self):
+        self.font = get_font('arial', 24)
+        self.using = self.font.render('use O para acelerar', True, (0, 0, 255))
+        self.hp = None
+        self.score = None
+        self.life_text = None
+        self.score_text = None
+
+    def draw(self, win, hp, score):
+        if hp != self.hp:
+            self.hp = hp
+            self.life_text = self.font.render(f'vida : {hp}', True, (255, 0, 0))
+        if score != self.score:
+            self.score = score
+            self.score_text = self.font.render(f'pontos : {score}', True, (255, 255, 0))
+        win.blit(self.life_text, (10, 10))
+        win.blit(self.score_text, (10, 40))
+        win.blit(self.using, (WIDTH // 2, 10))
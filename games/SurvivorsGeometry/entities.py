@@ -0,0 +1,237 @@
+# Armazenamento das balas e minions em colunas (struct-of-arrays).
+#
+# Cada campo é um array pré-alocado com uma posição por entidade; os índices
+# livres ficam numa free-list e são reaproveitados. O movimento e o tempo de
+# vida são integrados de uma vez por tick: com NumPy em operações vetoriais,
+# sem NumPy num laço sobre os arrays do módulo array.
+
+import math
+import random
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def float_column(size):
+    if np is not None:
+        return np.zeros(size)
+    return array('d', bytes(8 * size))
+
+
+def flag_column(size):
+    if np is not None:
+        return np.zeros(size, dtype=bool)
+    return bytearray(size)
+
+
+def to_list(column):
+    if isinstance(column, bytearray):
+        return [bool(v) for v in column]
+    return column.tolist()
+
+
+class Store:
+    FLOATS = ()
+    FLAGS = ()
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.active = flag_column(capacity)
+        for name in self.FLOATS:
+            setattr(self, name, float_column(capacity))
+        for name in self.FLAGS:
+            setattr(self, name, flag_column(capacity))
+        self.free = list(range(capacity - 1, -1, -1))
+        self.count = 0
+        self.high_water = 0
+        self.acquired = 0
+        self.overflow = 0
+
+    def __len__(self):
+        return self.count
+
+    def acquire(self):
+        # Sem índice livre o spawn é recusado (conta em overflow): a capacidade
+        # é o limite de entidades do jogo.
+        if not self.free:
+            self.overflow += 1
+            return None
+        i = self.free.pop()
+        self.active[i] = True
+        self.count += 1
+        self.acquired += 1
+        if self.count > self.high_water:
+            self.high_water = self.count
+        return i
+
+    def release(self, i):
+        if self.active[i]:
+            self.active[i] = False
+            self.free.append(i)
+            self.count -= 1
+
+    def release_all(self, slots):
+        for i in slots:
+            self.release(i)
+
+    def clear(self):
+        for i in self.slots():
+            self.release(i)
+
+    def slots(self):
+        if np is not None:
+            return np.flatnonzero(self.active).tolist()
+        return [i for i, on in enumerate(self.active) if on]
+
+    def release_where(self, mask):
+        # Só para o caminho NumPy: libera de uma vez os índices ativos da máscara.
+        dead = np.flatnonzero(mask & self.active).tolist()
+        for i in dead:
+            self.active[i] = False
+        self.free.extend(dead)
+        self.count -= len(dead)
+
+    def stats(self):
+        # Mesmas chaves de hub.projectiles.ProjectilePool.stats().
+        return {
+            'capacity': self.capacity,
+            'in_use': self.count,
+            'free': len(self.free),
+            'high_water': self.high_water,
+            'acquired': self.acquired,
+            'overflow': self.overflow,
+        }
+
+    def nbytes(self):
+        columns = ('active',) + self.FLOATS + self.FLAGS
+        if np is not None:
+            return sum(getattr(self, name).nbytes for name in columns)
+        return sum(len(getattr(self, name)) * getattr(getattr(self, name), 'itemsize', 1) for name in columns)
+
+
+class BulletStore(Store):
+    FLOATS = ('x', 'y', 'vx', 'vy', 'dx', 'dy', 'life', 'radius', 'damage', 'beam_length')
+    FLAGS = ('friendly', 'piercing', 'laser', 'hit_done')
+
+    def spawn(self, x, y, dirv, speed=640, life=2.0, friendly=True, damage=14, radius=5):
+        # Devolve o índice da bala, ou None se o limite de balas foi atingido.
+        i = self.acquire()
+        if i is None:
+            return None
+        self.x[i] = x
+        self.y[i] = y
+        self.dx[i] = dirv[0]
+        self.dy[i] = dirv[1]
+        self.vx[i] = dirv[0] * speed
+        self.vy[i] = dirv[1] * speed
+        self.life[i] = life
+        self.radius[i] = radius
+        self.damage[i] = damage
+        self.beam_length[i] = 0
+        self.friendly[i] = friendly
+        self.piercing[i] = False
+        self.laser[i] = False
+        self.hit_done[i] = False
+        return i
+
+    def integrate(self, dt, width, height, margin=40):
+        # Move, envelhece e libera as balas que expiraram ou saíram da tela.
+        # Lasers têm velocidade zero e ficam parados onde foram criados.
+        left, top = -margin, -margin
+        right, bottom = width + margin, height + margin
+        if np is not None:
+            self.x += self.vx * dt
+            self.y += self.vy * dt
+            self.life -= dt
+            x, y = self.x, self.y
+            self.release_where((self.life <= 0) | (x < left) | (x > right) | (y < top) | (y > bottom))
+            return
+        xs, ys, vxs, vys, life = self.x, self.y, self.vx, self.vy, self.life
+        for i in self.slots():
+            x = xs[i] + vxs[i] * dt
+            y = ys[i] + vys[i] * dt
+            xs[i] = x
+            ys[i] = y
+            life[i] -= dt
+            if life[i] <= 0 or not (left <= x <= right and top <= y <= bottom):
+                self.release(i)
+
+    def pending_lasers(self):
+        return [i for i in self.slots() if self.laser[i] and self.friendly[i] and not self.hit_done[i]]
+
+    def draw_view(self):
+        # Listas simples para o desenho: círculos (x, y, amiga) e feixes de laser.
+        xs, ys = to_list(self.x), to_list(self.y)
+        friendly, laser = to_list(self.friendly), to_list(self.laser)
+        circles = []
+        beams = []
+        for i in self.slots():
+            if laser[i]:
+                length = self.beam_length[i]
+                beams.append((xs[i], ys[i], xs[i] + self.dx[i] * length, ys[i] + self.dy[i] * length))
+            else:
+                circles.append((int(xs[i]), int(ys[i]), friendly[i]))
+        return circles, beams
+
+
+class MinionStore(Store):
+    FLOATS = ('x', 'y', 'size', 'speed', 'hp', 'phase')
+
+    def spawn(self, x, y, phase=1):
+        i = self.acquire()
+        if i is None:
+            return None
+        self.x[i] = x
+        self.y[i] = y
+        self.size[i] = 14 + int(phase*0.8)
+        self.speed[i] = random.uniform(70 + phase*4, 140 + phase*6)
+        self.hp[i] = 18 + phase*4
+        self.phase[i] = phase
+        return i
+
+    def update(self, dt, px, py):
+        # Todos os minions andam em direção ao jogador.
+        if np is not None:
+            dx = px - self.x
+            dy = py - self.y
+            dist = np.hypot(dx, dy)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                step = np.where(dist > 0, self.speed * dt / dist, 0.0)
+            step *= self.active
+            self.x += dx * step
+            self.y += dy * step
+            return
+        xs, ys, speed = self.x, self.y, self.speed
+        for i in self.slots():
+            dx = px - xs[i]
+            dy = py - ys[i]
+            dist = math.hypot(dx, dy)
+            if dist > 0:
+                step = speed[i] * dt / dist
+                xs[i] += dx * step
+                ys[i] += dy * step
+
+    def touching(self, px, py, radius):
+        xs, ys, sizes = to_list(self.x), to_list(self.y), to_list(self.size)
+        hits = []
+        for i in self.slots():
+            reach = sizes[i] + radius
+            dx, dy = xs[i] - px, ys[i] - py
+            if dx*dx + dy*dy < reach*reach:
+                hits.append(i)
+        return hits
+
+    def outside(self, left, top, right, bottom):
+        return [
+            i for i in self.slots()
+            if not (left <= self.x[i] <= right and top <= self.y[i] <= bottom)
+        ]
+
+    def draw_view(self):
+        # (x, y, tamanho, hp, hp máximo) de cada minion ativo.
+        xs, ys, sizes = to_list(self.x), to_list(self.y), to_list(self.size)
+        hp, phase = to_list(self.hp), to_list(self.phase)
+        return [(xs[i], ys[i], sizes[i], hp[i], 18 + phase[i]*4) for i in self.slots()]
@@ -0,0 +1,72 @@
+# Teste de acerto dos lasers contra todos os alvos de uma vez. Com NumPy as
+# posições ficam em arrays (x, y, alcance) e a distância ao segmento é calculada
+# para todos os alvos numa só passada; sem NumPy cai no laço em Python puro.
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class LaserTargets:
+    def __init__(self, xs, ys, sizes, pad, use_numpy=True):
+        self.use_numpy = use_numpy and np is not None
+        if self.use_numpy:
+            self.x = np.asarray(xs, dtype=float)
+            self.y = np.asarray(ys, dtype=float)
+            reach = np.asarray(sizes, dtype=float) + pad
+            self.reach_sq = reach * reach
+            self.damage = np.zeros(len(xs), dtype=np.int64)
+        else:
+            self.x = list(xs)
+            self.y = list(ys)
+            self.reach_sq = [(size + pad) ** 2 for size in sizes]
+            self.damage = [0] * len(xs)
+
+    def hit_mask(self, x1, y1, x2, y2):
+        vx, vy = x2 - x1, y2 - y1
+        c2 = vx*vx + vy*vy
+        wx = self.x - x1
+        wy = self.y - y1
+        if c2 > 0:
+            t = np.clip((wx*vx + wy*vy) / c2, 0.0, 1.0)
+        else:
+            t = np.zeros_like(wx)
+        dx = wx - t*vx
+        dy = wy - t*vy
+        return dx*dx + dy*dy <= self.reach_sq
+
+    def hits(self, x1, y1, x2, y2):
+        if self.use_numpy:
+            return np.flatnonzero(self.hit_mask(x1, y1, x2, y2)).tolist()
+        vx, vy = x2 - x1, y2 - y1
+        c2 = vx*vx + vy*vy
+        inv = 1.0 / c2 if c2 > 0 else 0.0
+        hits = []
+        for i, (x, y, reach_sq) in enumerate(zip(self.x, self.y, self.reach_sq)):
+            wx = x - x1
+            wy = y - y1
+            t = (wx*vx + wy*vy) * inv
+            if t < 0.0:
+                t = 0.0
+            elif t > 1.0:
+                t = 1.0
+            dx = wx - t*vx
+            dy = wy - t*vy
+            if dx*dx + dy*dy <= reach_sq:
+                hits.append(i)
+        return hits
+
+    def apply(self, x1, y1, x2, y2, damage):
+        # O dano de todos os lasers do tick se acumula por alvo (com NumPy, por
+        # máscara) e sai de uma vez em damage_dealt().
+        if self.use_numpy:
+            self.damage[self.hit_mask(x1, y1, x2, y2)] += damage
+            return
+        for i in self.hits(x1, y1, x2, y2):
+            self.damage[i] += damage
+
+    def damage_dealt(self):
+        if self.use_numpy:
+            return [(i, int(self.damage[i])) for i in np.flatnonzero(self.damage).tolist()]
+        return [(i, damage) for i, damage in enumerate(self.damage) if damage]
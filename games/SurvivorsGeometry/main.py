@@ -6,8 +6,18 @@ import time
 import configparser
 import os
 
+from entities import BulletStore, MinionStore, to_list
+from laser import LaserTargets
+from spatial import SpatialHash
+
 pygame.init()
 
+try:
+    from hub.perf import active_monitor
+    perf = active_monitor()
+except ImportError:
+    perf = None
+
 
 
 CONFIG_FILE = os.path.join("conf", "conf.ini")
@@ -87,6 +97,8 @@ BIG = pygame.font.SysFont("Arial", 36)
 MAX_ENEMIES = 60
 MAX_MINIONS_PER_BOSS = 20
 MAX_BULLETS = 300
+BULLET_RADIUS = 5
+LASER_PAD = 6
 
 DEFAULT_TIME_TO_BOSS = 40.0
 
@@ -109,20 +121,6 @@ def normalize(v):
 def clamp(x, a, b):
     return max(a, min(b, x))
 
-def point_line_distance(px, py, x1, y1, x2, y2):
-    vx, vy = x2 - x1, y2 - y1
-    wx, wy = px - x1, py - y1
-    c1 = vx*wx + vy*wy
-    if c1 <= 0:
-        return math.hypot(px-x1, py-y1), 0
-    c2 = vx*vx + vy*vy
-    if c2 <= c1:
-        return math.hypot(px-x2, py-y2), 1
-    b = c1 / c2
-    bx = x1 + b*vx
-    by = y1 + b*vy
-    return math.hypot(px-bx, py-by), b
-
 
 KEY_MAP = {
     "a": pygame.K_a,
@@ -329,11 +327,10 @@ class Player:
         self._burst_shots_left = shots
         self._burst_timer = 0.0
 
-    def shoot(self, target_pos):
+    def shoot(self, target_pos, bullets):
         if not self.can_shoot():
-            return []
+            return
         self.reload = self.reload_time
-        bullets = []
         dirv_center = normalize((target_pos[0]-self.x, target_pos[1]-self.y))
         base_speed = 640
         base_damage = 16 * self.damage_mult
@@ -341,16 +338,14 @@ class Player:
             for i in range(12):
                 ang = i * (math.tau / 12) + random.uniform(-0.1, 0.1)
                 d = (math.cos(ang), math.sin(ang))
-                b = Bullet(self.x + d[0]*(self.r+6), self.y + d[1]*(self.r+6), d, speed=420, life=1.6, friendly=True)
-                b.damage = int(base_damage * 0.6)
-                b.piercing = True
-                bullets.append(b)
+                b = bullets.spawn(self.x + d[0]*(self.r+6), self.y + d[1]*(self.r+6), d, speed=420, life=1.6, friendly=True, damage=int(base_damage * 0.6))
+                if b is not None:
+                    bullets.piercing[b] = True
         n = max(1, self.bullets_per_shot)
         if n == 1:
-            b = Bullet(self.x + dirv_center[0]*self.r, self.y + dirv_center[1]*self.r, dirv_center, speed=base_speed, life=2.0, friendly=True)
-            b.damage = int(base_damage)
-            b.piercing = self.piercing
-            bullets.append(b)
+            b = bullets.spawn(self.x + dirv_center[0]*self.r, self.y + dirv_center[1]*self.r, dirv_center, speed=base_speed, life=2.0, friendly=True, damage=int(base_damage))
+            if b is not None:
+                bullets.piercing[b] = self.piercing
         else:
             spread_total = 0.28
             for i in range(n):
@@ -359,88 +354,43 @@ class Player:
                 base_ang = math.atan2(dirv_center[1], dirv_center[0])
                 ang = base_ang + ang_offset
                 d = (math.cos(ang), math.sin(ang))
-                b = Bullet(self.x + d[0]*self.r, self.y + d[1]*self.r, d, speed=base_speed, life=2.0, friendly=True)
-                b.damage = int(base_damage)
-                b.piercing = self.piercing
-                bullets.append(b)
+                b = bullets.spawn(self.x + d[0]*self.r, self.y + d[1]*self.r, d, speed=base_speed, life=2.0, friendly=True, damage=int(base_damage))
+                if b is not None:
+                    bullets.piercing[b] = self.piercing
         if self.auto_burst:
             self.start_burst(shots=2)
-        return bullets
 
-    def use_special(self):
+    def use_special(self, bullets):
         if not self.special_ready or self.kills < SPECIAL_COST:
-            return []
-        bullets = []
+            return
         mx, my = pygame.mouse.get_pos()
         dirv = normalize((mx - self.x, my - self.y))
         if dirv == (0,0):
             dirv = (1,0)
-        laser = Bullet(self.x, self.y, dirv, speed=0, life=0.40, friendly=True)
-        laser.laser = True
-        laser.damage = 120
-        laser.beam_length = max(W, H) * 1.5
-        laser.hit_done = False
-        bullets.append(laser)
+        laser = bullets.spawn(self.x, self.y, dirv, speed=0, life=0.40, friendly=True, damage=120)
+        if laser is not None:
+            bullets.laser[laser] = True
+            bullets.beam_length[laser] = max(W, H) * 1.5
         self.kills = max(0, self.kills - SPECIAL_COST)
         self.special_ready = (self.kills >= SPECIAL_KILLS)
-        return bullets
-
-class Bullet:
-    def __init__(self, x, y, dirv, speed=640, life=2.0, friendly=True):
-        self.x = x
-        self.y = y
-        self.dirv = dirv
-        self.speed = speed
-        self.life = life
-        self.radius = 5
-        self.friendly = friendly
-        self.piercing = False
-        self.damage = 14
-        self.laser = getattr(self, "laser", False)
-        self.beam_length = getattr(self, "beam_length", 0)
-        self.hit_done = getattr(self, "hit_done", False)
 
-    def update(self, dt):
-        if not getattr(self, "laser", False):
-            self.x += self.dirv[0]*self.speed*dt
-            self.y += self.dirv[1]*self.speed*dt
-        self.life -= dt
-
-    def draw(self, surf):
-        if getattr(self, "laser", False):
-            x2 = self.x + self.dirv[0] * self.beam_length
-            y2 = self.y + self.dirv[1] * self.beam_length
-            pygame.draw.line(surf, LASER_COL, (int(self.x), int(self.y)), (int(x2), int(y2)), 6)
-            pygame.draw.circle(surf, LASER_COL, (int(self.x), int(self.y)), 6)
-            return
-        color = (200, 220, 100) if self.friendly else (220, 120, 140)
-        pygame.draw.circle(surf, color, (int(self.x), int(self.y)), self.radius)
-
-    def alive(self):
-        return self.life > 0 and (-40 <= self.x <= W+40 and -40 <= self.y <= H+40)
-
-class Minion:
-    def __init__(self, x, y, phase=1):
-        self.x = x
-        self.y = y
-        self.size = 14 + int(phase*0.8)
-        self.speed = random.uniform(70 + phase*4, 140 + phase*6)
-        self.hp = 18 + phase*4
-        self.phase = phase
-
-    def update(self, dt, player):
-        dirv = normalize((player.x - self.x, player.y - self.y))
-        self.x += dirv[0]*self.speed*dt
-        self.y += dirv[1]*self.speed*dt
-
-    def draw(self, surf):
-        pts = [(self.x, self.y - self.size), (self.x - self.size, self.y + self.size), (self.x + self.size, self.y + self.size)]
+def draw_bullets(surf, bullets):
+    circles, beams = bullets.draw_view()
+    for x1, y1, x2, y2 in beams:
+        pygame.draw.line(surf, LASER_COL, (int(x1), int(y1)), (int(x2), int(y2)), 6)
+        pygame.draw.circle(surf, LASER_COL, (int(x1), int(y1)), 6)
+    for x, y, friendly in circles:
+        color = (200, 220, 100) if friendly else (220, 120, 140)
+        pygame.draw.circle(surf, color, (x, y), BULLET_RADIUS)
+
+def draw_minions(surf, minions):
+    for x, y, size, hp, maxhp in minions.draw_view():
+        pts = [(x, y - size), (x - size, y + size), (x + size, y + size)]
         pygame.draw.polygon(surf, ENEMY_COL, pts)
-        maxhp = 18 + self.phase*4
-        if self.hp < maxhp:
-            ratio = clamp(self.hp / maxhp, 0, 1)
-            pygame.draw.rect(surf, (50,50,50), (self.x - self.size, self.y + self.size + 4, self.size*2, 4))
-            pygame.draw.rect(surf, (200,70,70), (self.x - self.size, self.y + self.size + 4, int(self.size*2*ratio), 4))
+        if hp < maxhp:
+            ratio = clamp(hp / maxhp, 0, 1)
+            pygame.draw.rect(surf, (50,50,50), (x - size, y + size + 4, size*2, 4))
+            pygame.draw.rect(surf, (200,70,70), (x - size, y + size + 4, int(size*2*ratio), 4))
 
 class Boss:
     POWERS = ['FLASHEE', 'REI DOS MINIONS', 'CASCUDO', 'laser', 'TP TP', 'meio a meio']
@@ -457,7 +407,7 @@ class Boss:
         self.speed = 80 + phase*10
         self.power = random.choice(Boss.POWERS)
         self.power_cd = 0
-        self.minions = []
+        self.minions = MinionStore(MAX_MINIONS_PER_BOSS)
         self.shield = False
         self.shield_timer = 0
         self.laser_timer = 0
@@ -484,8 +434,7 @@ class Boss:
                 spawn_count = random.randint(1, 2 + self.phase//2)
                 for _ in range(spawn_count):
                     if len(self.minions) < MAX_MINIONS_PER_BOSS:
-                        m = Minion(self.x + random.randint(-50,50), self.y + random.randint(-40,40), phase=self.phase)
-                        self.minions.append(m)
+                        self.minions.spawn(self.x + random.randint(-50,50), self.y + random.randint(-40,40), phase=self.phase)
         elif self.power == 'CASCUDO':
             if self.shield_timer > 0:
                 self.shield_timer -= dt
@@ -505,13 +454,10 @@ class Boss:
                 for i in range(burst):
                     jitter = random.uniform(-0.06, 0.06)
                     d = normalize((dirv[0] + jitter, dirv[1] + jitter))
-                    b = Bullet(self.x + d[0]*(self.size+8), self.y + d[1]*(self.size+8), d, speed=0, life=0.6, friendly=False)
-                    b.damage = 10 + self.phase*2
-                    b.laser = True
-                    b.beam_length = max(W, H) * 1.2
-                    b.hit_done = False
-                    if len(bullets) < MAX_BULLETS:
-                        bullets.append(b)
+                    b = bullets.spawn(self.x + d[0]*(self.size+8), self.y + d[1]*(self.size+8), d, speed=0, life=0.6, friendly=False, damage=10 + self.phase*2)
+                    if b is not None:
+                        bullets.laser[b] = True
+                        bullets.beam_length[b] = max(W, H) * 1.2
         elif self.power == 'TP TP':
             self.teleport_cd -= dt
             if self.teleport_cd <= 0:
@@ -521,9 +467,7 @@ class Boss:
                 for i in range(5):
                     ang = random.uniform(0, math.tau)
                     d = (math.cos(ang), math.sin(ang))
-                    b = Bullet(self.x + d[0]*(self.size+6), self.y + d[1]*(self.size+6), d, speed=300 + self.phase*10, life=2.0, friendly=False)
-                    if len(bullets) < MAX_BULLETS:
-                        bullets.append(b)
+                    bullets.spawn(self.x + d[0]*(self.size+6), self.y + d[1]*(self.size+6), d, speed=300 + self.phase*10, life=2.0, friendly=False)
         elif self.power == 'meio a meio':
             if self.hp < self.base_hp * 0.5 and not self.split_done:
                 self.split_done = True
@@ -536,20 +480,14 @@ class Boss:
                     nb.y = self.y + random.randint(-40,40)
                     entities['bosses'].append(nb)
                 self.hp = 0
-        for m in list(self.minions):
-            m.update(dt, player)
+        minions = self.minions
+        minions.update(dt, player.x, player.y)
+        for i in minions.slots():
             if random.random() < 0.02 + 0.01*self.phase:
-                dirv = normalize((player.x - m.x, player.y - m.y))
-                b = Bullet(m.x + dirv[0]*10, m.y + dirv[1]*10, dirv, speed=300 + self.phase*10, life=2.0, friendly=False)
-                if len(bullets) < MAX_BULLETS:
-                    bullets.append(b)
-            if m.x < -40 or m.x > W+40 or m.y < -40 or m.y > H+40:
-                try:
-                    self.minions.remove(m)
-                except:
-                    pass
-        if len(self.minions) > MAX_MINIONS_PER_BOSS:
-            self.minions = self.minions[:MAX_MINIONS_PER_BOSS]
+                mx, my = float(minions.x[i]), float(minions.y[i])
+                dirv = normalize((player.x - mx, player.y - my))
+                bullets.spawn(mx + dirv[0]*10, my + dirv[1]*10, dirv, speed=300 + self.phase*10, life=2.0, friendly=False)
+        minions.release_all(minions.outside(-40, -40, W+40, H+40))
         
         
        
@@ -564,14 +502,14 @@ class Boss:
         pygame.draw.rect(surf, (200,60,60), (self.x-self.size, self.y - self.size - 10, max(0, hpw), 6))
         if self.shield:
             pygame.draw.circle(surf, SHIELD_COL, (int(self.x), int(self.y)), int(self.size*1.2), 3)
-        for m in self.minions:
-            m.draw(surf)
+        draw_minions(surf, self.minions)
 
 class Game:
     def __init__(self):
         self.player = Player()
-        self.bullets = []
-        self.enemies = []
+        self.bullets = BulletStore(MAX_BULLETS)
+        self.bullet_grid = SpatialHash()
+        self.enemies = MinionStore(MAX_ENEMIES)
         self.entities = {'bosses': []}
         self.phase = 1
         self.spawn_timer = 0.6
@@ -604,8 +542,68 @@ class Game:
             return
         x = random.uniform(W*0.6, W-30)
         y = random.uniform(30, H-30)
-        e = Minion(x, y, phase=self.phase)
-        self.enemies.append(e)
+        self.enemies.spawn(x, y, phase=self.phase)
+
+    def index_bullets(self):
+        # Reconstrói a grade com as balas do jogador que ainda colidem. Balas
+        # gastas entram no conjunto devolvido e só são liberadas no fim do
+        # update, de uma vez, sem mexer no armazenamento no meio das colisões.
+        bullets = self.bullets
+        self.bullet_x = to_list(bullets.x)
+        self.bullet_y = to_list(bullets.y)
+        self.bullet_radius = to_list(bullets.radius)
+        friendly = to_list(bullets.friendly)
+        laser = to_list(bullets.laser)
+        self.bullet_grid.clear()
+        for i in bullets.slots():
+            if friendly[i] and not laser[i]:
+                self.bullet_grid.insert(i, self.bullet_x[i], self.bullet_y[i])
+        return set()
+
+    def bullet_hits(self, x, y, size, spent):
+        xs, ys, radius = self.bullet_x, self.bullet_y, self.bullet_radius
+        for i in self.bullet_grid.query(x, y, size + BULLET_RADIUS):
+            if i in spent:
+                continue
+            reach = size + radius[i]
+            dx, dy = xs[i] - x, ys[i] - y
+            if dx*dx + dy*dy < reach*reach:
+                yield i
+
+    def hit_targets(self, targets, spent):
+        bullets = self.bullets
+        xs, ys, sizes = to_list(targets.x), to_list(targets.y), to_list(targets.size)
+        for t in targets.slots():
+            damage = 0
+            for i in self.bullet_hits(xs[t], ys[t], sizes[t], spent):
+                damage += int(bullets.damage[i])
+                if not bullets.piercing[i]:
+                    spent.add(i)
+            if damage:
+                targets.hp[t] -= damage
+            if targets.hp[t] <= 0:
+                targets.release(t)
+                self.player.kills += 1
+                self.score += 6
+                if self.player.kills >= SPECIAL_KILLS:
+                    self.player.special_ready = True
+
+    def laser_targets(self):
+        # Alvos dos lasers em listas paralelas, com o dono de cada posição.
+        xs, ys, sizes, owners = [], [], [], []
+        bosses = self.entities['bosses']
+        for store in [self.enemies] + [boss.minions for boss in bosses]:
+            for i in store.slots():
+                xs.append(float(store.x[i]))
+                ys.append(float(store.y[i]))
+                sizes.append(float(store.size[i]))
+                owners.append((store, i))
+        for boss in bosses:
+            xs.append(boss.x)
+            ys.append(boss.y)
+            sizes.append(boss.size)
+            owners.append((boss, None))
+        return xs, ys, sizes, owners
 
     def update(self, dt, keys, mouse, mouse_pressed):
         if self.game_over:
@@ -615,33 +613,24 @@ class Game:
         want_shoot = mouse_pressed[0]
         if want_shoot:
             if self.player.can_shoot() or self.player._burst_shots_left > 0:
-                new_bullets = self.player.shoot((mx, my))
-                for nb in new_bullets:
-                    if len(self.bullets) < MAX_BULLETS:
-                        self.bullets.append(nb)
-        for b in list(self.bullets):
-            b.update(dt)
-            if not b.alive():
-                try: self.bullets.remove(b)
-                except: pass
-        for b in list(self.bullets):
-            if getattr(b, "laser", False) and b.friendly and (not getattr(b, "hit_done", False)):
-                ex = b.x + b.dirv[0] * b.beam_length
-                ey = b.y + b.dirv[1] * b.beam_length
-                for e in list(self.enemies):
-                    dist, t = point_line_distance(e.x, e.y, b.x, b.y, ex, ey)
-                    if dist <= e.size + 6 and 0.0 <= t <= 1.0:
-                        e.hp -= int(b.damage)
-                for boss in list(self.entities['bosses']):
-                    for m in list(boss.minions):
-                        dist, t = point_line_distance(m.x, m.y, b.x, b.y, ex, ey)
-                        if dist <= m.size + 6 and 0.0 <= t <= 1.0:
-                            m.hp -= int(b.damage)
-                for boss in list(self.entities['bosses']):
-                    dist, t = point_line_distance(boss.x, boss.y, b.x, b.y, ex, ey)
-                    if dist <= boss.size + 6 and 0.0 <= t <= 1.0:
-                        boss.hp -= int(b.damage)
-                b.hit_done = True
+                self.player.shoot((mx, my), self.bullets)
+        bullets = self.bullets
+        bullets.integrate(dt, W, H)
+        lasers = bullets.pending_lasers()
+        if lasers:
+            xs, ys, sizes, owners = self.laser_targets()
+            field = LaserTargets(xs, ys, sizes, LASER_PAD)
+            for b in lasers:
+                x, y = float(bullets.x[b]), float(bullets.y[b])
+                length = float(bullets.beam_length[b])
+                field.apply(x, y, x + bullets.dx[b] * length, y + bullets.dy[b] * length, int(bullets.damage[b]))
+                bullets.hit_done[b] = True
+            for target, damage in field.damage_dealt():
+                owner, slot = owners[target]
+                if slot is None:
+                    owner.hp -= damage
+                else:
+                    owner.hp[slot] -= damage
         if not self.in_boss_phase:
             self.spawn_timer -= dt
             if self.spawn_timer <= 0:
@@ -659,41 +648,25 @@ class Game:
                 self.spawn_timer = max(0.6 - 0.02*self.phase, 0.2)
                 if random.random() < 0.45:
                     self.spawn_enemy()
-        for e in list(self.enemies):
-            e.update(dt, self.player)
-            if math.hypot(e.x - self.player.x, e.y - self.player.y) < e.size + self.player.r:
-                self.player.hp -= 8
-                try: self.enemies.remove(e)
-                except: pass
+        px, py = self.player.x, self.player.y
+        self.enemies.update(dt, px, py)
+        touching = self.enemies.touching(px, py, self.player.r)
+        self.player.hp -= 8 * len(touching)
+        self.enemies.release_all(touching)
+        spent = self.index_bullets()
         for boss in list(self.entities['bosses']):
             boss.update(dt, self.player, self.bullets, self.entities)
-            for m in list(boss.minions):
-                if math.hypot(m.x - self.player.x, m.y - self.player.y) < m.size + self.player.r:
-                    self.player.hp -= 6
-                    m.hp = 0
-            for b in list(self.bullets):
-                if b.friendly and (not getattr(b, "laser", False)) and math.hypot(b.x - boss.x, b.y - boss.y) < boss.size + b.radius:
-                    if boss.shield:
-                        boss.hp -= max(1, int(b.damage * 0.3))
-                    else:
-                        boss.hp -= int(b.damage)
-                    if not b.piercing:
-                        try: self.bullets.remove(b)
-                        except: pass
-            for m in list(boss.minions):
-                for b in list(self.bullets):
-                    if (not getattr(b, "laser", False)) and b.friendly and math.hypot(b.x - m.x, b.y - m.y) < m.size + b.radius:
-                        m.hp -= int(b.damage)
-                        if not b.piercing:
-                            try: self.bullets.remove(b)
-                            except: pass
-                if m.hp <= 0:
-                    try: boss.minions.remove(m)
-                    except: pass
-                    self.player.kills += 1
-                    self.score += 6
-                    if self.player.kills >= SPECIAL_KILLS:
-                        self.player.special_ready = True
+            for i in boss.minions.touching(px, py, self.player.r):
+                self.player.hp -= 6
+                boss.minions.hp[i] = 0
+            for i in self.bullet_hits(boss.x, boss.y, boss.size, spent):
+                if boss.shield:
+                    boss.hp -= max(1, int(bullets.damage[i] * 0.3))
+                else:
+                    boss.hp -= int(bullets.damage[i])
+                if not bullets.piercing[i]:
+                    spent.add(i)
+            self.hit_targets(boss.minions, spent)
             if boss.hp <= 0:
                 try: self.entities['bosses'].remove(boss)
                 except: pass
@@ -706,27 +679,17 @@ class Game:
                 self.in_boss_phase = False
                 self.time_to_boss = DEFAULT_TIME_TO_BOSS + 10 * (self.phase-1)
                 self.player.hp = min(self.player.max_hp, self.player.hp + 30)
-        for b in list(self.bullets):
-            if not b.friendly and math.hypot(b.x - self.player.x, b.y - self.player.y) < b.radius + self.player.r:
-                self.player.hp -= 10
-                try: self.bullets.remove(b)
-                except: pass
-        for e in list(self.enemies):
-            for b in list(self.bullets):
-                if (not getattr(b, "laser", False)) and b.friendly and math.hypot(b.x - e.x, b.y - e.y) < e.size + b.radius:
-                    e.hp -= int(b.damage)
-                    if not b.piercing:
-                        try: self.bullets.remove(b)
-                        except: pass
-            if e.hp <= 0:
-                try: self.enemies.remove(e)
-                except: pass
-                self.player.kills += 1
-                self.score += 6
-                if self.player.kills >= SPECIAL_KILLS:
-                    self.player.special_ready = True
-        if len(self.bullets) > MAX_BULLETS:
-            self.bullets = self.bullets[-MAX_BULLETS:]
+        xs, ys = to_list(bullets.x), to_list(bullets.y)
+        friendly, radius = to_list(bullets.friendly), to_list(bullets.radius)
+        for i in bullets.slots():
+            if not friendly[i]:
+                reach = radius[i] + self.player.r
+                dx, dy = xs[i] - px, ys[i] - py
+                if dx*dx + dy*dy < reach*reach:
+                    self.player.hp -= 10
+                    spent.add(i)
+        self.hit_targets(self.enemies, spent)
+        bullets.release_all(spent)
         self.player.update_weapon()
         if self.player.hp <= 0:
             self.game_over = True
@@ -757,10 +720,8 @@ class Game:
             surf.blit(wave_text, (W//2 - wave_text.get_width()//2, 12))
         mx, my = pygame.mouse.get_pos()
         pygame.draw.line(surf, (180,180,180), (self.player.x, self.player.y), (mx, my), 1)
-        for b in self.bullets:
-            b.draw(surf)
-        for e in self.enemies:
-            e.draw(surf)
+        draw_bullets(surf, self.bullets)
+        draw_minions(surf, self.enemies)
         for boss in self.entities['bosses']:
             boss.draw(surf)
         self.player.draw(surf)
@@ -793,16 +754,19 @@ def main():
                     running = False
         
         if keys[CTRL_A] and game.player.special_ready and not game.game_over:
-            special_bullets = game.player.use_special()
-            for sb in special_bullets:
-                if len(game.bullets) < MAX_BULLETS:
-                    game.bullets.append(sb)
+            game.player.use_special(game.bullets)
         game.update(dt, keys, mouse, mouse_pressed)
+        if perf:
+            perf.mark('update')
+            perf.count('inimigos', len(game.enemies))
+            perf.count('balas', len(game.bullets))
         SCREEN.fill(BG)
         game.draw(SCREEN)
         if game.level_boss:
             pinfo = FONT.render(f"Boss Power: {game.level_boss.power}", True, HUD_COL)
             SCREEN.blit(pinfo, (W - pinfo.get_width() - 16, 12))
+        if perf:
+            perf.mark('draw')
         pygame.display.flip()
     pygame.quit()
     sys.exit()
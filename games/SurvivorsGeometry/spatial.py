@@ -0,0 +1,39 @@
+# Grade uniforme (spatial hash) para achar as balas próximas de um alvo sem
+# testar todas as balas contra todos os inimigos.
+
+CELL_SIZE = 64
+
+
+class SpatialHash:
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def insert(self, item, x, y):
+        key = (int(x // self.cell_size), int(y // self.cell_size))
+        cell = self.cells.get(key)
+        if cell is None:
+            self.cells[key] = [item]
+        else:
+            cell.append(item)
+
+    def query(self, x, y, radius):
+        # Itens das células que cobrem o quadrado de lado 2*radius em (x, y).
+        # A grade só reduz os candidatos; o teste de distância fica com quem chama.
+        size = self.cell_size
+        cells = self.cells
+        x0 = int((x - radius) // size)
+        x1 = int((x + radius) // size)
+        y0 = int((y - radius) // size)
+        y1 = int((y + radius) // size)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    yield from cell
+
+    def __len__(self):
+        return sum(len(cell) for cell in self.cells.values())
@@ -3,8 +3,17 @@ import math
 import time
 import subprocess
 
+from road import Road
+from targeting import EnemyRegistry
+
 pygame.init()
 
+try:
+    from hub.perf import active_monitor
+    perf = active_monitor()
+except ImportError:
+    perf = None
+
 # -------------------------
 # RESOLUÇÃO
 # -------------------------
@@ -27,7 +36,6 @@ TOWER_COST = 50
 TOWER_SELL_VALUE = 30
 
 PLAYER_MAX_HP = 10
-player_hp = PLAYER_MAX_HP
 
 # -------------------------
 # PATH (LABIRINTO SIMPLES SEM VOLTAS)
@@ -43,6 +51,10 @@ PATH = [
     (1000, 200),    # sobe um pouco
     (1280 + 40, 200)   # saída direita
 ]
+ROAD = Road(PATH)
+
+# grama e estrada, pintadas uma vez
+BACKGROUND = ROAD.bake((width, height), (30, 80, 30))
 
 # -------------------------
 # CLASSES
@@ -64,9 +76,8 @@ class Player:
 
 
 class Enemy:
-    def __init__(self, wave):
-        self.path_index = 0
-        self.x, self.y = PATH[0]
+    def __init__(self, wave, road=ROAD):
+        self.road = road
 
         # Velocidade aumenta por wave
         self.speed = 1.2 + (wave * 0.25)
@@ -74,21 +85,32 @@ class Enemy:
         self.hp = 40 + (wave * 5)
         self.max_hp = self.hp
 
-    def update(self):
-        if self.path_index >= len(PATH) - 1:
-            return True
+        # distância andada pelo caminho: a posição sai dela
+        self.path_index = 0
+        self.place(0.0)
 
-        tx, ty = PATH[self.path_index + 1]
-        dx = tx - self.x
-        dy = ty - self.y
-        dist = math.hypot(dx, dy)
+        # preenchidos pelo EnemyRegistry
+        self.id = None
+        self.alive = False
+
+    def place(self, progress):
+        self.progress = progress
+        self.path_index = self.road.find(progress, self.path_index)
+        self.seg_end, self.x0, self.dx, self.y0, self.dy = self.road.lines[self.path_index]
+        self.x = self.x0 + self.dx * progress
+        self.y = self.y0 + self.dy * progress
 
-        if dist < 2:
-            self.path_index += 1
+    def update(self):
+        self.progress += self.speed
+        if self.progress >= self.seg_end:
+            if self.progress >= self.road.length:
+                self.x, self.y = self.road.points[-1]
+                return True
+            self.place(self.progress)
             return False
 
-        self.x += (dx / dist) * self.speed
-        self.y += (dy / dist) * self.speed
+        self.x = self.x0 + self.dx * self.progress
+        self.y = self.y0 + self.dy * self.progress
         return False
 
     def draw(self):
@@ -130,23 +152,17 @@ class Tower:
         self.range = 150
         self.cooldown = 40
         self.cool = 0
+        self.targeting = 'nearest'  # ou 'first' / 'strongest' (métodos do EnemyRegistry)
 
     def draw(self):
         pygame.draw.circle(SCREEN, (0, 200, 0), (self.x, self.y), 18)
 
-    def update(self, enemies, bullets):
+    def update(self, registry, bullets):
         if self.cool > 0:
             self.cool -= 1
             return
 
-        target = None
-        min_dist = 9999
-
-        for e in enemies:
-            dist = math.hypot(e.x - self.x, e.y - self.y)
-            if dist < min_dist and dist < self.range:
-                min_dist = dist
-                target = e
+        target = getattr(registry, self.targeting)(self.x, self.y, self.range)
 
         if target:
             bullets.append(Bullet(self.x, self.y, target))
@@ -154,137 +170,159 @@ class Tower:
             self.cool = self.cooldown
 
 
-# -------------------------
-# INITIAL DATA
-# -------------------------
-player = Player()
-towers = []
-enemies = []
-bullets = []
-spawn_timer = 0
-money = 200
-
-font = pygame.font.SysFont(None, 28)
-big_font = pygame.font.SysFont(None, 80)
-
-# WAVES
-wave = 1
-enemies_to_spawn = 5 + wave * 2
-spawned = 0
-
-# -------------------------
-# GAME LOOP
-# -------------------------
-running = True
-while running:
-    CLOCK.tick(60)
-
-    # Tecla espaço -> volta ao hub
-    keys = pygame.key.get_pressed()
-    if keys[pygame.K_SPACE]:
-        subprocess.Popen(["python", "hub_de_jogos.py"])
-        break
-
-    # Game Over
-    if player_hp <= 0:
-        SCREEN.fill((0, 0, 0))
-        text = big_font.render("GAME OVER", True, (255, 0, 0))
-        SCREEN.blit(text, (430, 300))
-        pygame.display.update()
-        time.sleep(5)
-        subprocess.Popen(["python", "hub_de_jogos.py"])
-        break
-
-    SCREEN.fill((30, 80, 30))
-
-    # Estrada do labirinto
-    for i in range(len(PATH)-1):
-        pygame.draw.line(SCREEN, (120, 120, 120), PATH[i], PATH[i+1], 50)
-        pygame.draw.line(SCREEN, (255, 255, 0), PATH[i], PATH[i+1], 4)
-
-    # Eventos
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-    # Movimentação
-    player.move(keys)
-
-    # Construir torre
-    if keys[pygame.K_o]:
-        if money >= TOWER_COST:
-            towers.append(Tower(player.x + 10, player.y + 10))
-            money -= TOWER_COST
-            pygame.time.wait(150)
-
-    # Vender torre
-    if keys[pygame.K_p]:
-        for t in towers:
-            if math.hypot(player.x - t.x, player.y - t.y) < 40:
-                towers.remove(t)
-                money += TOWER_SELL_VALUE
-                break
-        pygame.time.wait(150)
-
-    # -------------------------
-    # WAVES
-    # -------------------------
-    spawn_timer += 1
-
-    if spawned < enemies_to_spawn:
-        if spawn_timer > 60:
-            enemies.append(Enemy(wave))
-            spawned += 1
-            spawn_timer = 0
-
-    # Próxima wave
-    if spawned == enemies_to_spawn and len(enemies) == 0:
-        wave += 1
-        spawned = 0
-        enemies_to_spawn = 5 + wave * 2
+def update_combat(registry, towers, bullets):
+    """Um quadro de inimigos, torres e balas; retorna (mortos, que chegaram ao fim)."""
+    killed = escaped = 0
 
     # Inimigos
-    for e in enemies[:]:
+    for e in list(registry):
         reached_end = e.update()
         if e.hp <= 0:
-            enemies.remove(e)
-            money += 10
+            registry.remove(e)
+            killed += 1
         elif reached_end:
-            enemies.remove(e)
-            player_hp -= 1
+            registry.remove(e)
+            escaped += 1
+    registry.moved()
 
     # Torres
     for t in towers:
-        t.update(enemies, bullets)
+        t.update(registry, bullets)
 
-    # Balas
-    for b in bullets[:]:
+    # Balas: somem quando o alvo morre ou quando chegam nele
+    flying = []
+    for b in bullets:
         b.update()
-        if b.target not in enemies:
-            bullets.remove(b)
-            continue
-        if math.hypot(b.x - b.target.x, b.target.y - b.y) < 10:
-            bullets.remove(b)
+        if b.target.alive and math.hypot(b.x - b.target.x, b.target.y - b.y) >= 10:
+            flying.append(b)
+    bullets[:] = flying
+    return killed, escaped
+
 
+def main():
     # -------------------------
-    # DRAW
+    # INITIAL DATA
     # -------------------------
-    player.draw()
+    player = Player()
+    towers = []
+    enemies = EnemyRegistry()
+    bullets = []
+    spawn_timer = 0
+    money = 200
+    player_hp = PLAYER_MAX_HP
 
-    for t in towers:
-        t.draw()
+    font = pygame.font.SysFont(None, 28)
+    big_font = pygame.font.SysFont(None, 80)
 
-    for e in enemies:
-        e.draw()
+    # WAVES
+    wave = 1
+    enemies_to_spawn = 5 + wave * 2
+    spawned = 0
 
-    for b in bullets:
-        b.draw()
+    # -------------------------
+    # GAME LOOP
+    # -------------------------
+    running = True
+    while running:
+        CLOCK.tick(60)
+
+        # Tecla espaço -> volta ao hub
+        keys = pygame.key.get_pressed()
+        if keys[pygame.K_SPACE]:
+            subprocess.Popen(["python", "hub_de_jogos.py"])
+            break
+
+        # Game Over
+        if player_hp <= 0:
+            SCREEN.fill((0, 0, 0))
+            text = big_font.render("GAME OVER", True, (255, 0, 0))
+            SCREEN.blit(text, (430, 300))
+            pygame.display.update()
+            time.sleep(5)
+            subprocess.Popen(["python", "hub_de_jogos.py"])
+            break
+
+        # Grama e estrada do labirinto
+        SCREEN.blit(BACKGROUND, (0, 0))
+        if perf:
+            perf.mark('draw')
+
+        # Eventos
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+
+        # Movimentação
+        player.move(keys)
+
+        # Construir torre
+        if keys[pygame.K_o]:
+            if money >= TOWER_COST:
+                towers.append(Tower(player.x + 10, player.y + 10))
+                money -= TOWER_COST
+                pygame.time.wait(150)
+
+        # Vender torre
+        if keys[pygame.K_p]:
+            for t in towers:
+                if math.hypot(player.x - t.x, player.y - t.y) < 40:
+                    towers.remove(t)
+                    money += TOWER_SELL_VALUE
+                    break
+            pygame.time.wait(150)
+
+        # -------------------------
+        # WAVES
+        # -------------------------
+        spawn_timer += 1
+
+        if spawned < enemies_to_spawn:
+            if spawn_timer > 60:
+                enemies.add(Enemy(wave))
+                spawned += 1
+                spawn_timer = 0
+
+        # Próxima wave
+        if spawned == enemies_to_spawn and len(enemies) == 0:
+            wave += 1
+            spawned = 0
+            enemies_to_spawn = 5 + wave * 2
+
+        killed, escaped = update_combat(enemies, towers, bullets)
+        money += 10 * killed
+        player_hp -= escaped
+
+        if perf:
+            perf.mark('update')
+            perf.count('torres', len(towers))
+            perf.count('inimigos', len(enemies))
+            perf.count('balas', len(bullets))
+
+        # -------------------------
+        # DRAW
+        # -------------------------
+        player.draw()
 
-    SCREEN.blit(font.render(f"Dinheiro: {money}", True, (255, 255, 255)), (10, 10))
-    SCREEN.blit(font.render(f"Vida: {player_hp}", True, (255, 100, 100)), (10, 40))
+        for t in towers:
+            t.draw()
+
+        for e in enemies:
+            e.draw()
+
+        for b in bullets:
+            b.draw()
+
+        SCREEN.blit(font.render(f"Dinheiro: {money}", True, (255, 255, 255)), (10, 10))
+        SCREEN.blit(font.render(f"Vida: {player_hp}", True, (255, 100, 100)), (10, 40))
+
+        SCREEN.blit(font.render(f"Wave: {wave}", True, (255,255,255)), (width - 150, 10))
+
+        if perf:
+            perf.mark('draw')
+        pygame.display.update()
 
-    SCREEN.blit(font.render(f"Wave: {wave}", True, (255,255,255)), (width - 150, 10))
+    pygame.quit()
 
-    pygame.display.update()
 
-pygame.quit()
\ No newline at end of file
+if __name__ == '__main__':
+    main()
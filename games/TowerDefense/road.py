@@ -0,0 +1,53 @@
+# Caminho dos inimigos parametrizado pela distância andada.
+#
+# A tabela guarda, para cada trecho do PATH, a distância acumulada no fim dele
+# e a reta do trecho escrita em função da distância: x = x0 + dx * progress
+# (idem para y). A posição de um inimigo sai só do 'progress', sem hypot por
+# quadro; como ele só cresce, o inimigo guarda a reta do trecho atual e só
+# volta à tabela quando passa do fim dela. A estrada é desenhada uma vez numa
+# superfície de fundo.
+
+import pygame
+
+ROAD_COLOR = (120, 120, 120)
+LINE_COLOR = (255, 255, 0)
+ROAD_WIDTH = 50
+LINE_WIDTH = 4
+
+
+class Road:
+    def __init__(self, points):
+        self.points = [tuple(p) for p in points]
+        self.starts = []     # distância acumulada no começo de cada trecho
+        self.lines = []      # (fim, x0, dx, y0, dy) de cada trecho
+        length = 0.0
+        for (ax, ay), (bx, by) in zip(self.points, self.points[1:]):
+            seg = ((bx - ax) ** 2 + (by - ay) ** 2) ** 0.5
+            dx, dy = ((bx - ax) / seg, (by - ay) / seg) if seg else (0.0, 0.0)
+            self.starts.append(length)
+            self.lines.append((length + seg, ax - dx * length, dx, ay - dy * length, dy))
+            length += seg
+        self.length = length
+
+    def find(self, progress, seg=0):
+        """Trecho em que está 'progress', procurando a partir de 'seg'."""
+        last = len(self.lines) - 1
+        lines = self.lines
+        while seg < last and progress >= lines[seg][0]:
+            seg += 1
+        return seg
+
+    def position(self, progress, seg=0):
+        """(x, y, trecho) a 'progress' do começo."""
+        seg = self.find(progress, seg)
+        _, x0, dx, y0, dy = self.lines[seg]
+        return x0 + dx * progress, y0 + dy * progress, seg
+
+    def bake(self, size, background):
+        """Fundo do tamanho 'size' com a estrada já pintada."""
+        surf = pygame.Surface(size).convert()
+        surf.fill(background)
+        for a, b in zip(self.points, self.points[1:]):
+            pygame.draw.line(surf, ROAD_COLOR, a, b, ROAD_WIDTH)
+            pygame.draw.line(surf, LINE_COLOR, a, b, LINE_WIDTH)
+        return surf
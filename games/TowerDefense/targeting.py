@@ -0,0 +1,115 @@
+# Registro dos inimigos vivos e grade para as torres acharem alvos.
+#
+# Cada inimigo ganha um id ao entrar e um flag 'alive', que vira False quando
+# ele sai; a bala confere o flag em vez de procurar o alvo na lista. A grade
+# (spatial hash) é refeita só quando alguma torre pergunta depois que os
+# inimigos andaram, e cada pergunta olha só as células que o alcance da torre
+# toca. Como as torres não andam, essas células ficam guardadas por posição,
+# da mais perto para a mais longe: o mais próximo para de procurar quando a
+# próxima célula já está mais longe que o melhor achado.
+
+import math
+
+CELL_SIZE = 50
+
+
+class EnemyRegistry:
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.enemies = {}    # id -> inimigo, na ordem em que entraram
+        self.next_id = 1
+        self.cells = None    # None = os inimigos andaram desde a última grade
+        self.reach = {}      # (x, y, raio) -> [(distância, célula)] que o círculo toca
+
+    def __len__(self):
+        return len(self.enemies)
+
+    def __iter__(self):
+        return iter(self.enemies.values())
+
+    def get(self, enemy_id):
+        return self.enemies.get(enemy_id)
+
+    def add(self, enemy):
+        enemy.id = self.next_id
+        enemy.alive = True
+        self.next_id += 1
+        self.enemies[enemy.id] = enemy
+        self.cells = None
+        return enemy
+
+    def remove(self, enemy):
+        enemy.alive = False
+        del self.enemies[enemy.id]
+        self.cells = None
+
+    def moved(self):
+        self.cells = None
+
+    def build(self):
+        size = self.cell_size
+        cells = {}
+        for e in self.enemies.values():
+            key = (int(e.x // size), int(e.y // size))
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [e]
+            else:
+                cell.append(e)
+        self.cells = cells
+
+    def cells_in_range(self, x, y, radius):
+        keys = self.reach.get((x, y, radius))
+        if keys is None:
+            size = self.cell_size
+            keys = []
+            for cx in range(int((x - radius) // size), int((x + radius) // size) + 1):
+                for cy in range(int((y - radius) // size), int((y + radius) // size) + 1):
+                    # ponto da célula mais perto do centro
+                    nx = min(max(x, cx * size), (cx + 1) * size)
+                    ny = min(max(y, cy * size), (cy + 1) * size)
+                    reach = math.hypot(nx - x, ny - y)
+                    if reach <= radius:
+                        keys.append((reach, (cx, cy)))
+            keys.sort()
+            self.reach[(x, y, radius)] = keys
+        return keys
+
+    def in_range(self, x, y, radius):
+        # (inimigo, distância) para cada inimigo a menos de 'radius' de (x, y)
+        if self.cells is None:
+            self.build()
+        cells = self.cells
+        hypot = math.hypot
+        for _, key in self.cells_in_range(x, y, radius):
+            for e in cells.get(key, ()):
+                dist = hypot(e.x - x, e.y - y)
+                if dist < radius:
+                    yield e, dist
+
+    # Empate: o que entrou primeiro (menor id), como o laço antigo pela lista.
+
+    def nearest(self, x, y, radius):
+        if self.cells is None:
+            self.build()
+        cells = self.cells
+        hypot = math.hypot
+        best = None
+        best_key = (radius, 0)
+        for reach, key in self.cells_in_range(x, y, radius):
+            if reach > best_key[0]:
+                break
+            for e in cells.get(key, ()):
+                k = (hypot(e.x - x, e.y - y), e.id)
+                if k < best_key:
+                    best, best_key = e, k
+        return best
+
+    def first(self, x, y, radius):
+        # o que já andou mais pelo caminho
+        best = min(self.in_range(x, y, radius), key=lambda p: (-p[0].progress, p[0].id), default=None)
+        return best and best[0]
+
+    def strongest(self, x, y, radius):
+        best = min(self.in_range(x, y, radius), key=lambda p: (-p[0].hp, p[0].id), default=None)
+        return best and best[0]
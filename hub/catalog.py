@@ -0,0 +1,144 @@
+"""Índice persistente do catálogo de jogos de ``games/``.
+
+O índice (por padrão ``conf/catalog.json``) guarda, para cada pasta, o mtime da
+pasta, o mtime/tamanho e o hash do ``data.inf`` e os dados já lidos do jogo. Numa
+nova varredura só as pastas cujos metadados mudaram voltam a ser lidas.
+"""
+import configparser
+import hashlib
+import json
+import os
+
+INDEX_VERSION = 1
+
+
+def parse_game_info(folder_name, content):
+    game_config = configparser.ConfigParser()
+    game_config.read_string(content.decode('utf-8'))
+
+    return {
+        'folder': folder_name,
+        'name': game_config.get('Game', 'nome', fallback=folder_name),
+        'authors': game_config.get('Game', 'autores', fallback='Autor Desconhecido')
+    }
+
+
+class GameCatalog:
+    def __init__(self, games_dir, index_path):
+        self.games_dir = games_dir
+        self.index_path = index_path
+        self.index = None
+        self.dirty = False
+
+    def load(self):
+        self.index = {}
+        if not os.path.exists(self.index_path):
+            return
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as index_file:
+                data = json.load(index_file)
+            if data.get('version') == INDEX_VERSION:
+                self.index = data['folders']
+        except Exception as e:
+            print(f"Erro ao ler o índice do catálogo {self.index_path}: {e}")
+
+    def save(self):
+        index_directory = os.path.dirname(self.index_path)
+        if index_directory:
+            os.makedirs(index_directory, exist_ok=True)
+
+        temp_path = self.index_path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as index_file:
+                json.dump({'version': INDEX_VERSION, 'folders': self.index}, index_file, ensure_ascii=False)
+            os.replace(temp_path, self.index_path)
+            self.dirty = False
+        except Exception as e:
+            print(f"Erro ao salvar o índice do catálogo {self.index_path}: {e}")
+
+    def _read_folder(self, folder_name, folder_path, folder_mtime, cached):
+        data_inf_path = os.path.join(folder_path, 'data.inf')
+
+        try:
+            data_stat = os.stat(data_inf_path)
+        except OSError:
+            data_stat = None
+
+        if data_stat is None or not os.path.exists(os.path.join(folder_path, 'main.py')):
+            if cached is None or cached['game'] is not None:
+                print(f"Ignorando pasta {folder_name}: arquivos 'main.py' ou 'data.inf' ausentes.")
+            return {'mtime': folder_mtime, 'data_stat': None, 'data_hash': None, 'game': None}
+
+        stat_key = [data_stat.st_mtime_ns, data_stat.st_size]
+        if cached is not None and cached['game'] is not None and cached['data_stat'] == stat_key:
+            if cached['mtime'] != folder_mtime:
+                cached = dict(cached, mtime=folder_mtime)
+            return cached
+
+        try:
+            with open(data_inf_path, 'rb') as data_inf:
+                content = data_inf.read()
+        except OSError:
+            # Como o configparser.read, um data.inf ilegível vale como vazio.
+            content = b''
+        data_hash = hashlib.sha1(content).hexdigest()
+
+        if cached is not None and cached['game'] is not None and cached['data_hash'] == data_hash:
+            return dict(cached, mtime=folder_mtime, data_stat=stat_key)
+
+        try:
+            game_data = parse_game_info(folder_name, content)
+        except Exception as e:
+            print(f"Erro ao ler data.inf em {folder_name}: {e}")
+            game_data = {'folder': folder_name, 'name': folder_name, 'authors': 'Erro ao ler data.inf'}
+
+        return {'mtime': folder_mtime, 'data_stat': stat_key, 'data_hash': data_hash, 'game': game_data}
+
+    def _is_fresh(self, cached, folder_path, folder_mtime):
+        if cached is None or cached['mtime'] != folder_mtime:
+            return False
+        if cached['data_stat'] is None:
+            return True
+
+        try:
+            data_stat = os.stat(os.path.join(folder_path, 'data.inf'))
+        except OSError:
+            return False
+        return cached['data_stat'] == [data_stat.st_mtime_ns, data_stat.st_size]
+
+    def scan(self):
+        if self.index is None:
+            self.load()
+
+        game_list = []
+        seen = set()
+
+        with os.scandir(self.games_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+
+                folder_name = entry.name
+                folder_mtime = entry.stat().st_mtime_ns
+                cached = self.index.get(folder_name)
+                seen.add(folder_name)
+
+                if not self._is_fresh(cached, entry.path, folder_mtime):
+                    record = self._read_folder(folder_name, entry.path, folder_mtime, cached)
+                    if record != cached:
+                        self.index[folder_name] = record
+                        self.dirty = True
+                    cached = record
+
+                if cached['game'] is not None:
+                    game_list.append(cached['game'])
+
+        for folder_name in set(self.index) - seen:
+            del self.index[folder_name]
+            self.dirty = True
+
+        if self.dirty:
+            self.save()
+
+        return game_list
@@ -0,0 +1,157 @@
+"""Execução de jogos dentro do processo do PyGaming Hub.
+
+Cada jogo roda num namespace novo, como se fosse ``python games/<pasta>/main.py``:
+a pasta do jogo fica em ``sys.path[0]`` e o diretório de trabalho continua sendo a
+raiz do Hub (os jogos leem ``conf/conf.ini`` a partir dela). Tudo o que o jogo
+altera no interpretador é desfeito ao final, e o display do Hub não é destruído.
+"""
+import os
+import runpy
+import sys
+import time
+import traceback
+
+import pygame
+
+from hub import perf
+
+
+class StopGame(BaseException):
+    """Interrompe o jogo em execução sem passar pelos ``except Exception`` dele."""
+
+
+def _module_in_dir(module, game_dir):
+    paths = []
+    module_file = getattr(module, '__file__', None)
+    if module_file:
+        paths.append(module_file)
+    paths.extend(getattr(module, '__path__', None) or [])
+
+    for path in paths:
+        path = os.path.abspath(path)
+        if path == game_dir or path.startswith(game_dir + os.sep):
+            return True
+    return False
+
+
+def run_game(game_dir, on_first_frame=None, stop_on_first_frame=False, on_frame=None, perf_overlay=False):
+    """Executa o ``main.py`` de ``game_dir`` e devolve as medições da sessão.
+
+    O retorno é um dicionário com ``first_frame`` (segundos entre o início e o
+    primeiro ``flip``/``update`` do jogo, ou ``None``), ``duration`` e ``error``.
+    ``on_frame``, se informado, é chamado depois de todo ``flip``/``update`` e
+    pode levantar ``StopGame`` para encerrar o jogo. Com ``perf_overlay`` o
+    monitor de ``hub.perf`` é instalado antes do jogo começar.
+    """
+    game_dir = os.path.abspath(game_dir)
+    main_py = os.path.join(game_dir, 'main.py')
+
+    result = {'first_frame': None, 'duration': 0.0, 'error': None}
+
+    saved_argv = sys.argv[:]
+    saved_path = sys.path[:]
+    saved_cwd = os.getcwd()
+    saved_modules = set(sys.modules)
+
+    original_quit = pygame.quit
+    original_flip = pygame.display.flip
+    original_update = pygame.display.update
+    original_get = pygame.event.get
+    original_clock = pygame.time.Clock
+    original_set_timer = pygame.time.set_timer
+    timers = set()
+
+    if perf_overlay:
+        perf.get_monitor().install()
+    game_flip = pygame.display.flip
+    game_update = pygame.display.update
+
+    start = time.perf_counter()
+
+    def mark_frame():
+        if result['first_frame'] is None:
+            result['first_frame'] = time.perf_counter() - start
+            if on_frame is None:
+                # Sem on_frame, as funções originais voltam ao lugar após o
+                # primeiro quadro e o jogo não paga nada pela medição. Se o
+                # jogo instalou algo por cima (ex.: hub.perf), fica como está.
+                if pygame.display.flip is probe_flip:
+                    pygame.display.flip = game_flip
+                if pygame.display.update is probe_update:
+                    pygame.display.update = game_update
+            if on_first_frame is not None:
+                on_first_frame(result['first_frame'])
+            if stop_on_first_frame:
+                raise StopGame()
+
+        if on_frame is not None:
+            on_frame()
+
+    def probe_flip():
+        game_flip()
+        mark_frame()
+
+    def probe_update(*args):
+        game_update(*args)
+        mark_frame()
+
+    def tracked_set_timer(event, millis, *args, **kwargs):
+        timers.add(event)
+        return original_set_timer(event, millis, *args, **kwargs)
+
+    pygame.quit = lambda: None
+    pygame.display.flip = probe_flip
+    pygame.display.update = probe_update
+    pygame.time.set_timer = tracked_set_timer
+
+    sys.argv = [main_py]
+    sys.path.insert(0, game_dir)
+
+    try:
+        runpy.run_path(main_py, run_name='__main__')
+    except SystemExit:
+        pass
+    except StopGame:
+        pass
+    except Exception as e:
+        result['error'] = e
+        print(f"O jogo falhou ao executar: {e}")
+        traceback.print_exc()
+    finally:
+        result['duration'] = time.perf_counter() - start
+
+        perf.release()
+
+        pygame.quit = original_quit
+        pygame.display.flip = original_flip
+        pygame.display.update = original_update
+        pygame.event.get = original_get
+        pygame.time.Clock = original_clock
+        pygame.time.set_timer = original_set_timer
+
+        for event in timers:
+            try:
+                original_set_timer(event, 0)
+            except pygame.error:
+                pass
+
+        if pygame.mixer.get_init():
+            pygame.mixer.music.stop()
+            pygame.mixer.stop()
+
+        if pygame.display.get_init():
+            pygame.key.set_repeat()
+            pygame.mouse.set_visible(True)
+            pygame.event.set_grab(False)
+            pygame.event.set_allowed(None)
+            pygame.event.clear()
+
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        os.chdir(saved_cwd)
+
+        for name in set(sys.modules) - saved_modules:
+            if _module_in_dir(sys.modules[name], game_dir):
+                del sys.modules[name]
+
+    return result
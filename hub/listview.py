@@ -0,0 +1,135 @@
+"""Lista virtualizada e rolável para as telas do Hub.
+
+Só as linhas que cabem na área visível são desenhadas, então o custo por quadro
+não depende do tamanho da lista. A rolagem é suave (a posição persegue um alvo),
+a seleção é mantida visível, há salto por página e busca incremental por
+prefixo sobre as chaves ordenadas dos itens.
+"""
+import bisect
+import math
+import time
+
+SCROLL_SPEED = 12.0
+SEARCH_TIMEOUT = 1.0
+MAX_STEP = 1 / 30
+
+
+class ListView:
+    def __init__(self, rect, row_height, draw_row):
+        self.rect = rect
+        self.row_height = row_height
+        self.draw_row = draw_row
+
+        self.items = []
+        self.keys = []
+        self.selected = 0
+
+        self.offset = 0.0
+        self.target_offset = 0.0
+        self.last_step = None
+
+        self.search = ''
+        self.search_time = 0.0
+
+    def set_items(self, items, keys=None):
+        """Troca os itens; ``keys`` (em ordem crescente) habilita a busca."""
+        self.items = items
+        self.keys = keys or []
+        self.selected = max(0, min(self.selected, len(items) - 1))
+        self.target_offset = min(self.target_offset, self.max_offset())
+        self.offset = min(self.offset, self.max_offset())
+        self.keep_selected_visible()
+
+    def page_size(self):
+        return max(1, self.rect.height // self.row_height)
+
+    def max_offset(self):
+        return max(0, len(self.items) * self.row_height - self.rect.height)
+
+    def visible_range(self):
+        first = int(self.offset // self.row_height)
+        last = int(math.ceil((self.offset + self.rect.height) / self.row_height))
+        return max(0, first), min(len(self.items), last)
+
+    def row_rect(self, i):
+        top = self.rect.top + round(i * self.row_height - self.offset)
+        return self.rect.clip((self.rect.left, top, self.rect.width, self.row_height))
+
+    def keep_selected_visible(self):
+        top = self.selected * self.row_height
+        if top < self.target_offset:
+            self.target_offset = top
+        elif top + self.row_height > self.target_offset + self.rect.height:
+            self.target_offset = top + self.row_height - self.rect.height
+        self.target_offset = max(0, min(self.target_offset, self.max_offset()))
+
+    def select(self, index, instant=False):
+        if not self.items:
+            return
+        self.selected = max(0, min(index, len(self.items) - 1))
+        self.keep_selected_visible()
+        if instant:
+            self.offset = self.target_offset
+
+    def move(self, delta):
+        if self.items:
+            self.select((self.selected + delta) % len(self.items))
+
+    def page(self, direction):
+        self.select(self.selected + direction * self.page_size())
+
+    def scroll_rows(self, rows):
+        self.target_offset = max(0, min(self.target_offset + rows * self.row_height, self.max_offset()))
+
+    def is_scrolling(self):
+        return self.offset != self.target_offset
+
+    def step(self, now=None):
+        """Avança a rolagem suave; devolve True se a posição mudou."""
+        now = time.perf_counter() if now is None else now
+        # Limita o passo para que a primeira rolagem depois de um tempo parado
+        # também seja suave.
+        dt = 0.0 if self.last_step is None else min(now - self.last_step, MAX_STEP)
+        self.last_step = now
+
+        if not self.is_scrolling():
+            return False
+
+        distance = self.target_offset - self.offset
+        if abs(distance) < 0.5:
+            self.offset = self.target_offset
+        else:
+            self.offset += distance * min(1.0, dt * SCROLL_SPEED)
+        return True
+
+    def is_searching(self, now=None):
+        now = time.perf_counter() if now is None else now
+        return bool(self.search) and now - self.search_time < SEARCH_TIMEOUT
+
+    def type_char(self, char, now=None):
+        now = time.perf_counter() if now is None else now
+        if not self.is_searching(now):
+            self.search = ''
+        self.search += char.lower()
+        self.search_time = now
+
+        i = bisect.bisect_left(self.keys, self.search)
+        if i < len(self.keys) and self.keys[i].startswith(self.search):
+            self.select(i)
+            return True
+        return False
+
+    def erase_char(self, now=None):
+        self.search = self.search[:-1]
+        self.search_time = time.perf_counter() if now is None else now
+
+    def draw(self, surface):
+        previous_clip = surface.get_clip()
+        surface.set_clip(self.rect.clip(previous_clip))
+
+        first, last = self.visible_range()
+        for i in range(first, last):
+            top = self.rect.top + round(i * self.row_height - self.offset)
+            self.draw_row(surface, self.items[i], i, top, i == self.selected)
+
+        surface.set_clip(previous_clip)
@@ -0,0 +1,352 @@
+"""Overlay de desempenho e perfilador para os jogos do Hub.
+
+O monitor se instala sobre ``pygame.display.flip``/``update`` e
+``pygame.event.get``: cada ``flip`` fecha um quadro, o tempo em ``event.get``
+conta como fase ``eventos``, o próprio ``flip`` como fase ``flip`` e a espera
+de ``Clock.tick`` (para relógios criados depois da instalação) como ``espera``. Quem
+instala é o Hub, antes de o jogo começar e só com ``[Perf] overlay = True``; um
+jogo que queira mais detalhe pega o monitor já instalado (``None`` se não
+houver) e marca as fases e as contagens de entidades::
+
+    try:
+        from hub.perf import active_monitor
+        perf = active_monitor()
+    except ImportError:
+        perf = None
+
+    ...
+    if perf:
+        perf.mark('update')        # tempo desde a última marca vai para 'update'
+        perf.count('inimigos', len(enemies))
+
+O tempo do quadro que nenhuma marca cobriu aparece como ``jogo``. A tecla
+``toggle_key`` mostra/esconde o overlay e ``profile_key`` grava um perfil do
+cProfile dos próximos ``profile_frames`` quadros em ``profile_dir``.
+"""
+import configparser
+import cProfile
+import io
+import os
+import pstats
+import sys
+import time
+from collections import deque
+
+import pygame
+
+CONFIG_FILE = os.path.join('conf', 'conf.ini')
+
+HISTORY_SIZE = 120
+TEXT_REFRESH = 0.25
+SMOOTHING = 0.1
+HISTOGRAM_HEIGHT = 40
+HISTOGRAM_SCALE_MS = 33.3
+PANEL_WIDTH = 260
+
+
+def load_perf_config():
+    config = configparser.ConfigParser()
+    config.read(CONFIG_FILE, encoding='utf-8')
+    return {
+        'overlay': config.getboolean('Perf', 'overlay', fallback=False),
+        'toggle_key': config.get('Perf', 'toggle_key', fallback='f3'),
+        'profile_key': config.get('Perf', 'profile_key', fallback='f4'),
+        'profile_frames': config.getint('Perf', 'profile_frames', fallback=300),
+        'profile_dir': config.get('Perf', 'profile_dir', fallback='profiles'),
+    }
+
+
+class TimedClock:
+    """``pygame.time.Clock`` que conta o tempo de ``tick`` como fase ``espera``."""
+
+    def __init__(self, monitor, clock):
+        self.monitor = monitor
+        self.clock = clock
+
+    def _timed(self, tick, framerate):
+        self.monitor.mark('jogo')
+        elapsed = tick(framerate)
+        self.monitor.mark('espera')
+        return elapsed
+
+    def tick(self, framerate=0):
+        return self._timed(self.clock.tick, framerate)
+
+    def tick_busy_loop(self, framerate=0):
+        return self._timed(self.clock.tick_busy_loop, framerate)
+
+    def __getattr__(self, name):
+        return getattr(self.clock, name)
+
+
+class PerfMonitor:
+    def __init__(self, toggle_key='f3', profile_key='f4', profile_frames=300, profile_dir='profiles', visible=False):
+        self.toggle_key = pygame.key.key_code(toggle_key)
+        self.profile_key = pygame.key.key_code(profile_key)
+        self.profile_frames = profile_frames
+        self.profile_dir = profile_dir
+        self.visible = visible
+
+        self.frame_times = deque(maxlen=HISTORY_SIZE)
+        self.phases = {}
+        self.frame_phases = {}
+        self.counts = {}
+
+        self.frame_start = None
+        self.checkpoint = None
+
+        self.profiler = None
+        self.profile_remaining = 0
+        self.profile_requested = False
+
+        self.lines = []
+        self.lines_time = 0.0
+        self.font = None
+
+        self.installed = False
+        self.original_flip = None
+        self.original_update = None
+        self.original_get = None
+        self.original_clock = None
+
+    # --- instalação -------------------------------------------------------
+
+    # Instalado é o flag, não ``pygame.display.flip is self._flip``: cada
+    # acesso a ``self._flip`` cria um método ligado novo e o ``is`` nunca vale.
+
+    def is_installed(self):
+        return self.installed
+
+    def install(self):
+        if self.installed:
+            return
+        self.reset()
+        self.original_flip = pygame.display.flip
+        self.original_update = pygame.display.update
+        self.original_get = pygame.event.get
+        self.original_clock = pygame.time.Clock
+        pygame.display.flip = self._flip
+        pygame.display.update = self._update
+        pygame.event.get = self._get
+        pygame.time.Clock = self._clock
+        self.installed = True
+
+    def uninstall(self):
+        if not self.installed:
+            return
+        pygame.display.flip = self.original_flip
+        pygame.display.update = self.original_update
+        pygame.event.get = self.original_get
+        pygame.time.Clock = self.original_clock
+        self.installed = False
+        self._stop_profile()
+
+    def reset(self):
+        self.frame_times.clear()
+        self.phases = {}
+        self.frame_phases = {}
+        self.counts = {}
+        self.frame_start = None
+        self.checkpoint = None
+        self.lines = []
+        self.lines_time = 0.0
+
+    # --- medição ------------------------------------------------------------
+
+    def _add(self, name, seconds):
+        self.frame_phases[name] = self.frame_phases.get(name, 0.0) + seconds
+
+    def mark(self, name):
+        """Atribui a ``name`` o tempo desde a última marca (ou início do quadro)."""
+        now = time.perf_counter()
+        if self.checkpoint is not None:
+            self._add(name, now - self.checkpoint)
+        self.checkpoint = now
+
+    def count(self, name, value):
+        self.counts[name] = value
+
+    def _clock(self):
+        return TimedClock(self, self.original_clock())
+
+    def _get(self, *args, **kwargs):
+        start = time.perf_counter()
+        if self.checkpoint is not None:
+            self._add('jogo', start - self.checkpoint)
+
+        events = self.original_get(*args, **kwargs)
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                if event.key == self.toggle_key:
+                    self.visible = not self.visible
+                elif event.key == self.profile_key and self.profiler is None:
+                    self.profile_requested = True
+
+        self.checkpoint = time.perf_counter()
+        self._add('eventos', self.checkpoint - start)
+        return events
+
+    def _flip(self):
+        self._present(self.original_flip)
+
+    def _update(self, *args):
+        if self.visible and args:
+            self._present(lambda: self.original_update(*args) or self.original_update(self.panel_rect()))
+        else:
+            self._present(lambda: self.original_update(*args))
+
+    def _present(self, present):
+        start = time.perf_counter()
+        if self.checkpoint is not None:
+            self._add('jogo', start - self.checkpoint)
+
+        if self.visible:
+            surface = pygame.display.get_surface()
+            if surface is not None:
+                self.draw(surface)
+
+        flip_start = time.perf_counter()
+        present()
+        end = time.perf_counter()
+        self._add('flip', end - flip_start)
+
+        self._end_frame(end)
+
+    def _end_frame(self, now):
+        if self.frame_start is not None:
+            self.frame_times.append(now - self.frame_start)
+            for name, seconds in self.frame_phases.items():
+                previous = self.phases.get(name, seconds)
+                self.phases[name] = previous + (seconds - previous) * SMOOTHING
+
+        self.frame_phases = {}
+        self.frame_start = now
+        self.checkpoint = now
+
+        if self.profiler is not None:
+            self.profile_remaining -= 1
+            if self.profile_remaining <= 0:
+                self._stop_profile()
+        elif self.profile_requested:
+            self.profile_requested = False
+            self.start_profile()
+
+    # --- perfil -------------------------------------------------------------
+
+    def start_profile(self, frames=None):
+        self.profile_remaining = frames or self.profile_frames
+        self.profiler = cProfile.Profile()
+        self.profiler.enable()
+        print(f"Perfilando {self.profile_remaining} quadros...")
+
+    def _stop_profile(self):
+        if self.profiler is None:
+            return
+        self.profiler.disable()
+        profiler = self.profiler
+        self.profiler = None
+
+        game_name = os.path.basename(os.path.dirname(os.path.abspath(sys.argv[0]))) or 'jogo'
+        os.makedirs(self.profile_dir, exist_ok=True)
+        base_path = os.path.join(self.profile_dir, f"{game_name}-{time.strftime('%Y%m%d-%H%M%S')}")
+
+        profiler.dump_stats(base_path + '.prof')
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats('cumulative').print_stats(40)
+        with open(base_path + '.txt', 'w', encoding='utf-8') as report_file:
+            report_file.write(report.getvalue())
+        print(f"Perfil salvo em {base_path}.prof")
+
+    # --- overlay ------------------------------------------------------------
+
+    def stats(self):
+        times = sorted(self.frame_times)
+        if not times:
+            return None
+        average = sum(times) / len(times)
+        return {
+            'fps': 1 / average if average else 0.0,
+            'frame_ms': average * 1000,
+            'p95_ms': times[min(len(times) - 1, int(0.95 * len(times)))] * 1000,
+        }
+
+    def _text_lines(self):
+        stats = self.stats()
+        if stats is None:
+            return ['medindo...']
+
+        lines = [
+            f"FPS: {stats['fps']:.1f}",
+            f"quadro: {stats['frame_ms']:.2f} ms (p95 {stats['p95_ms']:.2f})",
+        ]
+        for name, seconds in sorted(self.phases.items()):
+            lines.append(f"  {name}: {seconds * 1000:.2f} ms")
+        for name, value in sorted(self.counts.items()):
+            lines.append(f"{name}: {value}")
+        if self.profiler is not None:
+            lines.append(f"perfilando ({self.profile_remaining})")
+        return lines
+
+    def panel_rect(self):
+        return pygame.Rect(8, 8, PANEL_WIDTH, 16 + HISTOGRAM_HEIGHT + 16 * max(1, len(self.lines)))
+
+    def draw(self, surface):
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+
+        now = time.perf_counter()
+        if now - self.lines_time > TEXT_REFRESH:
+            self.lines = [self.font.render(line, True, (230, 230, 230)) for line in self._text_lines()]
+            self.lines_time = now
+
+        rect = self.panel_rect()
+        panel = pygame.Surface(rect.size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+
+        y = 6
+        for line in self.lines:
+            panel.blit(line, (6, y))
+            y += 16
+
+        bottom = rect.height - 6
+        bar_width = max(1, (PANEL_WIDTH - 12) // HISTORY_SIZE)
+        for i, seconds in enumerate(self.frame_times):
+            milliseconds = seconds * 1000
+            height = min(HISTOGRAM_HEIGHT, int(milliseconds / HISTOGRAM_SCALE_MS * HISTOGRAM_HEIGHT))
+            color = (90, 220, 90) if milliseconds <= 1000 / 60 else (240, 200, 60) if milliseconds <= HISTOGRAM_SCALE_MS else (240, 80, 80)
+            pygame.draw.rect(panel, color, (6 + i * bar_width, bottom - height, bar_width, height))
+        budget_y = bottom - int((1000 / 60) / HISTOGRAM_SCALE_MS * HISTOGRAM_HEIGHT)
+        pygame.draw.line(panel, (200, 200, 200), (6, budget_y), (PANEL_WIDTH - 6, budget_y))
+
+        surface.blit(panel, rect.topleft)
+
+
+_monitor = None
+
+
+def get_monitor():
+    """Monitor compartilhado do processo, criado com a seção ``[Perf]`` do conf.ini."""
+    global _monitor
+    if _monitor is None:
+        settings = load_perf_config()
+        _monitor = PerfMonitor(
+            settings['toggle_key'],
+            settings['profile_key'],
+            settings['profile_frames'],
+            settings['profile_dir'],
+        )
+    return _monitor
+
+
+def active_monitor():
+    """Monitor instalado pelo Hub para o jogo atual, ou ``None``."""
+    if _monitor is not None and _monitor.installed:
+        return _monitor
+    return None
+
+
+def release():
+    """Desinstala o monitor (se houver) e encerra um perfil em andamento."""
+    if _monitor is not None:
+        _monitor.uninstall()
+        _monitor._stop_profile()
@@ -0,0 +1,106 @@
+"""Pool de processos de jogo pré-aquecidos (veja ``hub/worker.py``).
+
+Os processos ficam com o interpretador iniciado e o Pygame importado e
+inicializado antes de algum jogo ser escolhido. Ao lançar um jogo, um processo
+pronto assume a pasta do jogo e um novo reserva é iniciado em segundo plano.
+"""
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from hub.worker import MARKER
+
+
+class Worker:
+    def __init__(self, args=()):
+        env = dict(os.environ, PYTHONUNBUFFERED='1')
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'hub.worker', *args],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            env=env,
+        )
+        self.ready = threading.Event()
+        self.first_frame = threading.Event()
+        self.launched_at = None
+        self.first_frame_latency = None
+
+        self.reader = threading.Thread(target=self._read_output, daemon=True)
+        self.reader.start()
+
+    def _read_output(self):
+        for line in self.process.stdout:
+            if not line.startswith(MARKER):
+                print(line, end='')
+                continue
+
+            message = line[len(MARKER):].strip()
+            if message == 'ready':
+                self.ready.set()
+            elif message.startswith('frame') and self.launched_at is not None:
+                self.first_frame_latency = time.perf_counter() - self.launched_at
+                self.first_frame.set()
+
+        # O processo terminou: ninguém deve ficar esperando por ele.
+        self.ready.set()
+        self.first_frame.set()
+
+    def is_running(self):
+        return self.process.poll() is None
+
+    def run(self, game_dir, launched_at=None):
+        # 'launched_at' vem de fora quando o cronômetro começou antes do processo.
+        # Fica gravado antes de enviar a pasta: a thread de leitura o usa.
+        self.launched_at = time.perf_counter() if launched_at is None else launched_at
+        try:
+            self.process.stdin.write(game_dir + '\n')
+            self.process.stdin.flush()
+        except OSError as e:
+            print(f"O processo do jogo terminou antes de iniciar: {e}")
+
+    def close(self):
+        if self.is_running():
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+class WorkerPool:
+    def __init__(self, size, worker_args=()):
+        self.size = max(1, size)
+        self.worker_args = tuple(worker_args)
+        self.spares = [Worker(self.worker_args) for _ in range(self.size)]
+
+    def _take_spare(self):
+        # Processos que morreram antes de serem usados são substituídos.
+        for worker in list(self.spares):
+            if not worker.is_running():
+                self.spares.remove(worker)
+                self.spares.append(Worker(self.worker_args))
+
+        for worker in self.spares:
+            if worker.ready.is_set():
+                self.spares.remove(worker)
+                return worker
+
+        worker = self.spares.pop(0)
+        worker.ready.wait()
+        return worker
+
+    def launch(self, game_dir):
+        worker = self._take_spare()
+        worker.run(game_dir)
+        self.spares.append(Worker(self.worker_args))
+        return worker
+
+    def close(self):
+        for worker in self.spares:
+            worker.close()
+        self.spares = []
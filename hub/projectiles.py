@@ -0,0 +1,71 @@
+"""Pool de projéteis reutilizáveis para os jogos do Hub.
+
+Jogos com muitos tiros por segundo criam e descartam um objeto por disparo, o
+que pressiona o alocador e o coletor de lixo. O pool guarda até ``capacity``
+objetos livres e os reaproveita::
+
+    from hub.projectiles import ProjectilePool
+
+    bullet_pool = ProjectilePool(Bullet, 256)
+    b = bullet_pool.acquire(x, y, target)   # chama b.reset(x, y, target)
+    ...
+    bullet_pool.release(b)
+
+A classe do projétil precisa poder ser criada sem argumentos e ter um método
+``reset(*args, **kwargs)`` que reinicializa todos os campos. Se os objetos
+livres acabarem, ``acquire`` cria um novo (contado em ``overflow``) em vez de
+negar o tiro; quando o pool já tem ``capacity`` objetos livres, os que voltam
+a mais são descartados. ``stats()`` mostra o uso e o pico (``high_water``) para
+ajustar a capacidade.
+"""
+
+
+class ProjectilePool:
+    def __init__(self, factory, capacity):
+        self.factory = factory
+        self.capacity = capacity
+        self.free = [factory() for _ in range(capacity)]
+        self.active = set()
+        self.high_water = 0
+        self.acquired = 0
+        self.overflow = 0
+
+    def __len__(self):
+        return len(self.active)
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            projectile = self.free.pop()
+        else:
+            projectile = self.factory()
+            self.overflow += 1
+        projectile.reset(*args, **kwargs)
+
+        self.active.add(projectile)
+        self.acquired += 1
+        if len(self.active) > self.high_water:
+            self.high_water = len(self.active)
+        return projectile
+
+    def release(self, projectile):
+        # Devolver duas vezes o mesmo objeto não tem efeito.
+        if projectile not in self.active:
+            return
+        self.active.discard(projectile)
+        if len(self.free) < self.capacity:
+            self.free.append(projectile)
+
+    def release_all(self, projectiles=None):
+        """Devolve ``projectiles`` (ou todos os que estão em uso) ao pool."""
+        for projectile in list(self.active if projectiles is None else projectiles):
+            self.release(projectile)
+
+    def stats(self):
+        return {
+            'capacity': self.capacity,
+            'in_use': len(self.active),
+            'free': len(self.free),
+            'high_water': self.high_water,
+            'acquired': self.acquired,
+            'overflow': self.overflow,
+        }
@@ -0,0 +1,97 @@
+"""Renderização de texto com cache para as telas do Hub.
+
+``pygame.font.Font`` é caro de criar e ``Font.render`` é caro de chamar; as telas
+do Hub desenham quase sempre os mesmos textos a cada quadro. O ``TextCache``
+guarda as fontes por (face, tamanho) e as superfícies já renderizadas por
+(face, texto, tamanho, cor, antialias), ambos em LRU, com um limite de memória
+para as superfícies.
+"""
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    def __init__(self, max_fonts=16, max_bytes=8 * 1024 * 1024):
+        self.max_fonts = max_fonts
+        self.max_bytes = max_bytes
+
+        self.fonts = OrderedDict()
+        self.surfaces = OrderedDict()
+        self.surface_bytes = 0
+
+        self.font_hits = 0
+        self.font_misses = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, face, size):
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is not None:
+            self.fonts.move_to_end(key)
+            self.font_hits += 1
+            return font
+
+        self.font_misses += 1
+        font = pygame.font.Font(face, size)
+        self.fonts[key] = font
+        if len(self.fonts) > self.max_fonts:
+            self.fonts.popitem(last=False)
+        return font
+
+    def render(self, text, size, color, antialias=True, face=None):
+        key = (face, text, size, tuple(color), antialias)
+        text_surface = self.surfaces.get(key)
+        if text_surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return text_surface
+
+        self.misses += 1
+        text_surface = self.get_font(face, size).render(text, antialias, color)
+
+        surface_bytes = text_surface.get_pitch() * text_surface.get_height()
+        if surface_bytes > self.max_bytes:
+            return text_surface
+
+        self.surfaces[key] = text_surface
+        self.surface_bytes += surface_bytes
+        while self.surface_bytes > self.max_bytes:
+            _, evicted = self.surfaces.popitem(last=False)
+            self.surface_bytes -= evicted.get_pitch() * evicted.get_height()
+        return text_surface
+
+    def clear(self):
+        self.fonts.clear()
+        self.surfaces.clear()
+        self.surface_bytes = 0
+
+    def stats(self):
+        return {
+            'fonts': len(self.fonts),
+            'font_hits': self.font_hits,
+            'font_misses': self.font_misses,
+            'surfaces': len(self.surfaces),
+            'surface_bytes': self.surface_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+text_cache = TextCache()
+
+
+def draw_text(surface, text, size, x, y, color=(255, 255, 255), anchor="topleft"):
+    text_surface = text_cache.render(text, size, color)
+    text_rect = text_surface.get_rect()
+
+    if anchor == "center":
+        text_rect.center = (x, y)
+    elif anchor == "topleft":
+        text_rect.topleft = (x, y)
+    elif anchor == "midtop":
+        text_rect.midtop = (x, y)
+
+    surface.blit(text_surface, text_rect)
+    return text_rect
@@ -0,0 +1,170 @@
+"""Observação de ``games/`` em segundo plano.
+
+Uma thread acompanha a pasta de jogos (inotify no Linux, via ctypes; nos outros
+sistemas, consulta periódica dos mtimes) e, quando algo muda, atualiza o
+``GameCatalog`` e envia ao loop principal um evento ``CATALOG_CHANGED`` com os
+jogos adicionados, removidos e atualizados. Toda a E/S fica nessa thread.
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import threading
+
+import pygame
+
+CATALOG_CHANGED = pygame.event.custom_type()
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_ONLYDIR = 0x01000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_ONLYDIR)
+
+# Espera por mais eventos antes de reler o catálogo, para agrupar uma cópia de
+# pasta inteira numa única atualização.
+SETTLE_TIME = 0.2
+
+
+class Inotify:
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+
+        self.fd = libc.inotify_init()
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init falhou')
+
+    def add_watch(self, path):
+        # Repetir o watch de uma pasta já observada não tem efeito colateral.
+        self._add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+
+    def wait(self, timeout):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+
+        # Qualquer evento leva a uma releitura incremental do catálogo, então
+        # basta esvaziar o buffer.
+        os.read(self.fd, 64 * 1024)
+        return True
+
+    def close(self):
+        os.close(self.fd)
+
+
+def diff_games(old, new):
+    added = [game for folder, game in new.items() if folder not in old]
+    removed = [folder for folder in old if folder not in new]
+    updated = [game for folder, game in new.items() if folder in old and old[folder] != game]
+    return added, removed, updated
+
+
+class CatalogWatcher:
+    def __init__(self, catalog, poll_interval=1.0, backend='auto'):
+        self.catalog = catalog
+        self.poll_interval = poll_interval
+        self.backend = backend
+
+        self.lock = threading.Lock()
+        self.current = {}
+        self.published = {}
+        self.paused = False
+
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self, games):
+        self.current = {game['folder']: game for game in games}
+        self.published = dict(self.current)
+        self.thread = threading.Thread(target=self._run, name='catalog-watcher', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+
+    def pause(self):
+        with self.lock:
+            self.paused = True
+
+    def resume(self):
+        with self.lock:
+            self.paused = False
+        self._publish()
+
+    def _refresh(self):
+        try:
+            games = {game['folder']: game for game in self.catalog.scan()}
+        except Exception as e:
+            print(f"Erro ao ler o diretório de jogos: {e}")
+            return
+
+        with self.lock:
+            self.current = games
+        self._publish()
+
+    def _publish(self):
+        with self.lock:
+            if self.paused:
+                return
+            added, removed, updated = diff_games(self.published, self.current)
+            if not (added or removed or updated):
+                return
+            self.published = dict(self.current)
+
+        try:
+            pygame.event.post(pygame.event.Event(CATALOG_CHANGED, added=added, removed=removed, updated=updated))
+        except pygame.error as e:
+            print(f"Erro ao enviar a atualização do catálogo: {e}")
+
+    def _use_inotify(self):
+        if self.backend == 'poll':
+            return False
+        return sys.platform.startswith('linux')
+
+    def _run(self):
+        if self._use_inotify():
+            try:
+                self._run_inotify()
+                return
+            except (OSError, AttributeError) as e:
+                print(f"inotify indisponível ({e}), consultando a pasta de jogos a cada {self.poll_interval}s.")
+        self._run_polling()
+
+    def _watch_folders(self, inotify):
+        games_dir = self.catalog.games_dir
+        inotify.add_watch(games_dir)
+        with os.scandir(games_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    inotify.add_watch(entry.path)
+
+    def _run_inotify(self):
+        inotify = Inotify()
+        try:
+            self._watch_folders(inotify)
+            while not self.stop_event.is_set():
+                if not inotify.wait(0.5):
+                    continue
+                while inotify.wait(SETTLE_TIME):
+                    pass
+
+                self._watch_folders(inotify)
+                self._refresh()
+        finally:
+            inotify.close()
+
+    def _run_polling(self):
+        while not self.stop_event.wait(self.poll_interval):
+            self._refresh()
@@ -0,0 +1,46 @@
+"""Processo de jogo pré-aquecido do pool de lançamento.
+
+Iniciado pelo Hub com ``python -m hub.worker``: importa e inicializa o Pygame,
+avisa que está pronto e espera no stdin a pasta do jogo que deve executar. As
+mensagens para o Hub saem no stdout com o prefixo ``MARKER``; o resto da saída
+é do próprio jogo.
+"""
+import os
+import sys
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+from hub.launcher import run_game
+from hub.perf import load_perf_config
+
+MARKER = '@@hub'
+
+
+def send(message):
+    print(f"{MARKER} {message}", flush=True)
+
+
+def main():
+    stop_on_first_frame = '--stop-on-first-frame' in sys.argv[1:]
+
+    pygame.init()
+    send('ready')
+
+    game_dir = sys.stdin.readline().strip()
+    if not game_dir:
+        return
+
+    run_game(
+        game_dir,
+        on_first_frame=lambda elapsed: send(f'frame {elapsed:.6f}'),
+        stop_on_first_frame=stop_on_first_frame,
+        perf_overlay=load_perf_config()['overlay'],
+    )
+    send('done')
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
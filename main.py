@@ -1,11 +1,22 @@
 import pygame
 import sys
 import os
+import atexit
 import configparser
 import subprocess
+import time
+
+from hub.catalog import GameCatalog
+from hub.launcher import run_game
+from hub.listview import ListView
+from hub.perf import load_perf_config
+from hub.pool import WorkerPool
+from hub.text import draw_text
+from hub.watcher import CATALOG_CHANGED, CatalogWatcher
 
 CONF_DIR = 'conf'
 CONFIG_FILE = os.path.join(CONF_DIR, 'conf.ini')
+CATALOG_FILE = os.path.join(CONF_DIR, 'catalog.json')
 
 def create_default_config(config):
     config['Display'] = {
@@ -25,6 +36,21 @@ def create_default_config(config):
     config['Info'] = {
         'authors': 'Wilson Cosmo'
     }
+    config['Launcher'] = {
+        'mode': 'inprocess',
+        'pool_size': '2'
+    }
+    config['Catalog'] = {
+        'backend': 'auto',
+        'poll_interval': '1.0'
+    }
+    config['Perf'] = {
+        'overlay': 'False',
+        'toggle_key': 'f3',
+        'profile_key': 'f4',
+        'profile_frames': '300',
+        'profile_dir': 'profiles'
+    }
     save_config(config)
 
 def load_config():
@@ -71,88 +97,165 @@ CONTROLS = {
 
 AUTHORS = config.get('Info', 'authors')
 
+LAUNCH_MODE = config.get('Launcher', 'mode', fallback='inprocess')
+POOL_SIZE = config.getint('Launcher', 'pool_size', fallback=2)
+
+worker_pool = None
+
+CATALOG_BACKEND = config.get('Catalog', 'backend', fallback='auto')
+CATALOG_POLL_INTERVAL = config.getfloat('Catalog', 'poll_interval', fallback=1.0)
 
-def draw_text(surface, text, size, x, y, color=(255, 255, 255), anchor="topleft"):
-    font = pygame.font.Font(None, size)
-    text_surface = font.render(text, True, color)
-    text_rect = text_surface.get_rect()
+PERF_OVERLAY = load_perf_config()['overlay']
 
-    if anchor == "center":
-        text_rect.center = (x, y)
-    elif anchor == "topleft":
-        text_rect.topleft = (x, y)
-    elif anchor == "midtop":
-        text_rect.midtop = (x, y)
+game_catalog = GameCatalog('games', CATALOG_FILE)
+catalog_watcher = None
+
+return_started_at = None
+
+IDLE_TIMEOUT_MS = 500
 
-    surface.blit(text_surface, text_rect)
-    return text_rect
 
 def scan_game_directory():
     games_dir = 'games'
-    game_list = []
 
     if not os.path.exists(games_dir):
         os.makedirs(games_dir)
         return []
 
     try:
-        for folder_name in os.listdir(games_dir):
-            game_folder_path = os.path.join(games_dir, folder_name)
+        return game_catalog.scan()
 
-            if os.path.isdir(game_folder_path):
-                main_py_path = os.path.join(game_folder_path, 'main.py')
-                data_inf_path = os.path.join(game_folder_path, 'data.inf')
+    except Exception as e:
+        print(f"Erro ao ler o diretório de jogos: {e}")
+        return []
 
-                if os.path.exists(main_py_path) and os.path.exists(data_inf_path):
-                    try:
-                        game_config = configparser.ConfigParser()
-                        game_config.read(data_inf_path, encoding='utf-8')
+def apply_catalog_delta(games, event):
+    removed = set(event.removed)
+    updated = {game['folder']: game for game in event.updated}
 
-                        game_name = game_config.get('Game', 'nome', fallback=folder_name)
-                        game_authors = game_config.get('Game', 'autores', fallback='Autor Desconhecido')
+    games = [updated.get(game['folder'], game) for game in games if game['folder'] not in removed]
+    games.extend(event.added)
+    return games
 
-                        game_data = {
-                            'folder': folder_name,
-                            'name': game_name,
-                            'authors': game_authors
-                        }
-                        game_list.append(game_data)
+def create_display():
+    display_flags = 0
+    if FULLSCREEN:
+        display_flags = pygame.FULLSCREEN | pygame.SCALED
 
-                    except Exception as e:
-                        print(f"Erro ao ler data.inf em {folder_name}: {e}")
-                        game_list.append({'folder': folder_name, 'name': folder_name, 'authors': 'Erro ao ler data.inf'})
-                else:
-                    print(f"Ignorando pasta {folder_name}: arquivos 'main.py' ou 'data.inf' ausentes.")
+    display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), display_flags)
+    pygame.display.set_caption("PyGaming Hub")
+    return display
 
-        return game_list
+def restore_display():
+    global screen
 
-    except Exception as e:
-        print(f"Erro ao ler o diretório de jogos: {e}")
-        return []
+    screen = create_display()
+    for state in (main_menu_screen, game_library_screen, help_screen, settings_screen, about_screen):
+        state.screen = screen
+        state.invalidate()
 
 def launch_game(game_folder_name):
+    global return_started_at
+
     print(f"Tentando iniciar o jogo da pasta: {game_folder_name}")
-    game_path = os.path.join('games', game_folder_name, 'main.py')
+    game_dir = os.path.join('games', game_folder_name)
+    game_path = os.path.join(game_dir, 'main.py')
+
+    if not os.path.exists(game_path):
+        print(f"Erro: 'main.py' não encontrado para o jogo na pasta '{game_folder_name}'")
+        return
+
+    catalog_watcher.pause()
 
-    if os.path.exists(game_path):
-        pygame.quit()
+    if LAUNCH_MODE == 'subprocess':
+        pygame.display.quit()
 
         try:
-            subprocess.run([sys.executable, game_path], check=True)
+            # a raiz do Hub vai no PYTHONPATH para os jogos poderem importar hub.*
+            env = dict(os.environ)
+            env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.path.abspath('.'), env.get('PYTHONPATH')]))
+            subprocess.run([sys.executable, game_path], check=True, env=env)
         except subprocess.CalledProcessError as e:
             print(f"O jogo falhou ao executar: {e}")
         except Exception as e:
             print(f"Um erro inesperado ocorreu: {e}")
 
-        main()
+        pygame.display.init()
+    elif LAUNCH_MODE == 'pool':
+        worker = worker_pool.launch(game_dir)
 
+        while worker.is_running():
+            pygame.event.pump()
+            pygame.time.wait(30)
+
+        if worker.first_frame_latency is not None:
+            print(f"Latência até o primeiro quadro: {worker.first_frame_latency * 1000:.1f} ms")
+        pygame.event.clear()
     else:
-        print(f"Erro: 'main.py' não encontrado para o jogo na pasta '{game_folder_name}'")
+        result = run_game(game_dir, perf_overlay=PERF_OVERLAY)
+        if result['first_frame'] is not None:
+            print(f"Latência até o primeiro quadro: {result['first_frame'] * 1000:.1f} ms")
+
+    return_started_at = time.perf_counter()
+    restore_display()
+    catalog_watcher.resume()
 
 
-class MainMenu:
+class Screen:
     def __init__(self, screen):
         self.screen = screen
+        self.full_redraw = True
+        self.dirty_rects = []
+        self.list_view = None
+
+    def on_enter(self):
+        self.invalidate()
+
+    def update(self):
+        if self.list_view is not None and self.list_view.step():
+            self.invalidate(self.list_view.rect)
+
+    def invalidate(self, rect=None):
+        if rect is None:
+            self.full_redraw = True
+        else:
+            self.dirty_rects.append(pygame.Rect(rect))
+
+    def is_dirty(self):
+        if self.list_view is not None and self.list_view.is_scrolling():
+            return True
+        return self.full_redraw or bool(self.dirty_rects)
+
+    def invalidate_selection(self, previous):
+        if self.list_view.is_scrolling():
+            self.invalidate(self.list_view.rect)
+        elif self.list_view.selected != previous:
+            self.invalidate(self.list_view.row_rect(previous))
+            self.invalidate(self.list_view.row_rect(self.list_view.selected))
+
+    def render(self):
+        if self.full_redraw:
+            rects = [self.screen.get_rect()]
+        else:
+            rects = [rect.clip(self.screen.get_rect()) for rect in self.dirty_rects]
+
+        # O draw() completo roda recortado em cada área suja: o que está fora
+        # do recorte não é pintado e só essas áreas são enviadas ao display.
+        for rect in rects:
+            self.screen.set_clip(rect)
+            self.draw()
+        self.screen.set_clip(None)
+
+        self.full_redraw = False
+        self.dirty_rects = []
+        return rects
+
+    def row_rect(self, y_center, height):
+        return pygame.Rect(0, y_center - height // 2, SCREEN_WIDTH, height)
+
+class MainMenu(Screen):
+    def __init__(self, screen):
+        super().__init__(screen)
         self.options = ['Biblioteca de Jogos', 'Ajuda', 'Configuração', 'Sobre', 'Sair']
         self.selected_option = 0
         self.title_font_size = 74
@@ -164,6 +267,7 @@ class MainMenu:
         if event.type == pygame.KEYDOWN:
             key_name = pygame.key.name(event.key)
 
+            previous_option = self.selected_option
             if key_name == CONTROLS['DOWN']:
                 self.selected_option = (self.selected_option + 1) % len(self.options)
             elif key_name == CONTROLS['UP']:
@@ -183,12 +287,22 @@ class MainMenu:
                     pygame.quit()
                     sys.exit()
 
+            if self.selected_option != previous_option:
+                self.invalidate(self.option_rect(previous_option))
+                self.invalidate(self.option_rect(self.selected_option))
+
+    def option_y(self, i):
+        return 250 + i * (self.option_font_size + 15)
+
+    def option_rect(self, i):
+        return self.row_rect(self.option_y(i), self.option_font_size + 15)
+
     def draw(self):
         self.screen.fill((20, 20, 40))
         draw_text(self.screen, "PyGaming Hub", self.title_font_size, SCREEN_WIDTH // 2, 100, color=(255, 200, 0), anchor="center")
 
         for i, option in enumerate(self.options):
-            y_pos = 250 + i * (self.option_font_size + 15)
+            y_pos = self.option_y(i)
 
             if i == self.selected_option:
                 color = (255, 255, 0)
@@ -197,23 +311,66 @@ class MainMenu:
                 color = (255, 255, 255)
                 draw_text(self.screen, option, self.option_font_size, SCREEN_WIDTH // 2, y_pos, color=color, anchor="center")
 
-class GameLibrary:
+class GameLibrary(Screen):
     def __init__(self, screen):
-        self.screen = screen
+        super().__init__(screen)
         self.games = []
-        self.selected_game = 0
         self.title_font_size = 60
         self.option_font_size = 40
         self.message = ""
 
+        list_rect = pygame.Rect(0, 175, SCREEN_WIDTH, SCREEN_HEIGHT - 225)
+        self.list_view = ListView(list_rect, self.option_font_size + 10, self.draw_game_row)
+        self.search_rect = self.row_rect(SCREEN_HEIGHT - 20, 30)
+        self.search_shown = False
+
+    def set_games(self, games):
+        self.games = sorted(games, key=lambda game_data: game_data['name'].lower())
+        self.list_view.set_items(self.games, [game_data['name'].lower() for game_data in self.games])
+        self.update_message()
+
     def on_enter(self):
-        self.games = scan_game_directory()
-        self.selected_game = 0
+        self.list_view.select(0, instant=True)
+        self.update_message()
+        self.invalidate()
+
+    def update_message(self):
         if not self.games:
             self.message = "Nenhum jogo encontrado. (Verifique /games/ e os data.inf)"
         else:
             self.message = ""
 
+    def on_catalog_changed(self, event):
+        selected_folder = self.games[self.list_view.selected]['folder'] if self.games else None
+        self.set_games(apply_catalog_delta(self.games, event))
+
+        folders = [game_data['folder'] for game_data in self.games]
+        if selected_folder in folders:
+            self.list_view.select(folders.index(selected_folder))
+        self.invalidate()
+
+    def update(self):
+        super().update()
+        if self.search_shown and not self.list_view.is_searching():
+            self.search_shown = False
+            self.invalidate(self.search_rect)
+
+    def handle_search(self, event, key_name):
+        # Letras que não são controles (ou qualquer letra durante uma busca,
+        # exceto Ação A/B) vão para a busca incremental pelo nome.
+        char = getattr(event, 'unicode', '')
+        if event.key == pygame.K_BACKSPACE and self.list_view.is_searching():
+            self.list_view.erase_char()
+        elif char and char.isprintable() and key_name not in (CONTROLS['A'], CONTROLS['B']) \
+                and (self.list_view.is_searching() or key_name not in CONTROLS.values()):
+            self.list_view.type_char(char)
+        else:
+            return False
+
+        self.search_shown = True
+        self.invalidate(self.search_rect)
+        return True
+
     def handle_event(self, event):
         global current_state
         if event.type == pygame.KEYDOWN:
@@ -225,13 +382,34 @@ class GameLibrary:
             if not self.games:
                 return
 
-            if key_name == CONTROLS['DOWN']:
-                self.selected_game = (self.selected_game + 1) % len(self.games)
+            previous_game = self.list_view.selected
+            if self.handle_search(event, key_name):
+                pass
+            elif key_name == CONTROLS['DOWN']:
+                self.list_view.move(1)
             elif key_name == CONTROLS['UP']:
-                self.selected_game = (self.selected_game - 1) % len(self.games)
+                self.list_view.move(-1)
+            elif key_name == CONTROLS['RIGHT']:
+                self.list_view.page(1)
+            elif key_name == CONTROLS['LEFT']:
+                self.list_view.page(-1)
             elif key_name == CONTROLS['A']:
-                selected_game_data = self.games[self.selected_game]
+                selected_game_data = self.games[self.list_view.selected]
                 launch_game(selected_game_data['folder'])
+                return
+
+            self.invalidate_selection(previous_game)
+
+    def draw_game_row(self, surface, game_data, i, top, selected):
+        y_pos = top + self.list_view.row_height // 2
+        display_name = game_data['name']
+
+        if selected:
+            color = (255, 255, 0)
+            draw_text(surface, f"> {display_name}", self.option_font_size, SCREEN_WIDTH // 2, y_pos, color=color, anchor="center")
+        else:
+            color = (255, 255, 255)
+            draw_text(surface, display_name, self.option_font_size, SCREEN_WIDTH // 2, y_pos, color=color, anchor="center")
 
     def draw(self):
         self.screen.fill((40, 20, 20))
@@ -240,28 +418,18 @@ class GameLibrary:
         if self.message:
             draw_text(self.screen, self.message, 30, SCREEN_WIDTH // 2, 150, color=(255, 255, 255), anchor="center")
 
-        for i, game_data in enumerate(self.games):
-            y_pos = 200 + i * (self.option_font_size + 10)
-
-            display_name = game_data['name']
-
-            if i == self.selected_game:
-                color = (255, 255, 0)
-                draw_text(self.screen, f"> {display_name}", self.option_font_size, SCREEN_WIDTH // 2, y_pos, color=color, anchor="center")
-            else:
-                color = (255, 255, 255)
-                draw_text(self.screen, display_name, self.option_font_size, SCREEN_WIDTH // 2, y_pos, color=color, anchor="center")
+        self.list_view.draw(self.screen)
 
         draw_text(self.screen, f"Pressione '{CONTROLS['B']}' para Voltar", 25, 20, SCREEN_HEIGHT - 30, color=(200, 200, 200), anchor="topleft")
 
+        if self.search_shown:
+            draw_text(self.screen, f"Busca: {self.list_view.search}", 25, SCREEN_WIDTH // 2, SCREEN_HEIGHT - 20, color=(255, 255, 0), anchor="center")
 
 
-class HelpScreen:
-    def __init__(self, screen):
-        self.screen = screen
 
-    def on_enter(self):
-        pass
+class HelpScreen(Screen):
+    def __init__(self, screen):
+        super().__init__(screen)
 
     def handle_event(self, event):
         global current_state
@@ -288,12 +456,9 @@ class HelpScreen:
 
         draw_text(self.screen, f"Pressione '{CONTROLS['B']}' para Voltar", 25, 20, SCREEN_HEIGHT - 30, color=(200, 200, 200), anchor="topleft")
 
-class SettingsScreen:
+class SettingsScreen(Screen):
     def __init__(self, screen):
-        self.screen = screen
-
-    def on_enter(self):
-        pass
+        super().__init__(screen)
 
     def handle_event(self, event):
         global current_state
@@ -314,13 +479,21 @@ class SettingsScreen:
 
         draw_text(self.screen, f"Pressione '{CONTROLS['B']}' para Voltar", 25, 20, SCREEN_HEIGHT - 30, color=(200, 200, 200), anchor="topleft")
 
-class AboutScreen:
+class AboutScreen(Screen):
     def __init__(self, screen):
-        self.screen = screen
+        super().__init__(screen)
         self.game_list = []
 
-    def on_enter(self):
-        self.game_list = scan_game_directory()
+        list_rect = pygame.Rect(0, 370, SCREEN_WIDTH, SCREEN_HEIGHT - 430)
+        self.list_view = ListView(list_rect, 70, self.draw_game_row)
+
+    def set_games(self, games):
+        self.game_list = games
+        self.list_view.set_items(self.game_list)
+
+    def on_catalog_changed(self, event):
+        self.set_games(apply_catalog_delta(self.game_list, event))
+        self.invalidate()
 
     def handle_event(self, event):
         global current_state
@@ -328,6 +501,18 @@ class AboutScreen:
             key_name = pygame.key.name(event.key)
             if key_name == CONTROLS['B']:
                 current_state = main_menu_screen
+            elif key_name == CONTROLS['DOWN']:
+                self.list_view.scroll_rows(1)
+            elif key_name == CONTROLS['UP']:
+                self.list_view.scroll_rows(-1)
+            elif key_name == CONTROLS['RIGHT']:
+                self.list_view.scroll_rows(self.list_view.page_size())
+            elif key_name == CONTROLS['LEFT']:
+                self.list_view.scroll_rows(-self.list_view.page_size())
+
+    def draw_game_row(self, surface, game_data, i, top, selected):
+        draw_text(surface, f"• {game_data['name']}", 30, 120, top, color=(255, 255, 255), anchor="topleft")
+        draw_text(surface, f"  por: {game_data['authors']}", 25, 140, top + 30, color=(200, 200, 200), anchor="topleft")
 
     def draw(self):
         self.screen.fill((20, 40, 40))
@@ -340,43 +525,44 @@ class AboutScreen:
 
         draw_text(self.screen, "Autores dos Jogos:", 40, 100, 320, color=(255, 200, 0), anchor="topleft")
 
-        y_pos = 370
-
         if not self.game_list:
-            draw_text(self.screen, "Nenhum jogo encontrado na pasta /games/", 25, 120, y_pos, color=(200, 200, 200), anchor="topleft")
+            draw_text(self.screen, "Nenhum jogo encontrado na pasta /games/", 25, 120, self.list_view.rect.top, color=(200, 200, 200), anchor="topleft")
         else:
+            self.list_view.draw(self.screen)
 
-            for game_data in self.game_list:
-
-                if y_pos > SCREEN_HEIGHT - 80:
-                    draw_text(self.screen, "...", 25, 120, y_pos, color=(200, 200, 200), anchor="topleft")
-                    break
-
-                game_title = game_data['name']
-                game_authors = game_data['authors']
+        draw_text(self.screen, f"Pressione '{CONTROLS['B']}' para Voltar", 25, 20, SCREEN_HEIGHT - 30, color=(200, 200, 200), anchor="topleft")
 
 
-                draw_text(self.screen, f"• {game_title}", 30, 120, y_pos, color=(255, 255, 255), anchor="topleft")
-                draw_text(self.screen, f"  por: {game_authors}", 25, 140, y_pos + 30, color=(200, 200, 200), anchor="topleft")
+def wait_for_events(state):
+    if state.is_dirty():
+        return pygame.event.get()
 
-                y_pos += 70
+    # Nada para redesenhar: dorme até chegar um evento (teclado, catálogo...).
+    event = pygame.event.wait(IDLE_TIMEOUT_MS)
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()
 
-        draw_text(self.screen, f"Pressione '{CONTROLS['B']}' para Voltar", 25, 20, SCREEN_HEIGHT - 30, color=(200, 200, 200), anchor="topleft")
+def present(state):
+    state.update()
+    if not state.is_dirty():
+        return False
 
+    pygame.display.update(state.render())
+    return True
 
 def main():
-    global screen, clock, current_state
+    global screen, clock, current_state, return_started_at, worker_pool, catalog_watcher
     global main_menu_screen, game_library_screen, help_screen, settings_screen, about_screen
 
+    if LAUNCH_MODE == 'pool':
+        worker_pool = WorkerPool(POOL_SIZE)
+        atexit.register(worker_pool.close)
+
     pygame.init()
     pygame.font.init()
 
-    display_flags = 0
-    if FULLSCREEN:
-        display_flags = pygame.FULLSCREEN | pygame.SCALED
-
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), display_flags)
-    pygame.display.set_caption("PyGaming Hub")
+    screen = create_display()
     clock = pygame.time.Clock()
 
     main_menu_screen = MainMenu(screen)
@@ -385,6 +571,13 @@ def main():
     settings_screen = SettingsScreen(screen)
     about_screen = AboutScreen(screen)
 
+    games = scan_game_directory()
+    game_library_screen.set_games(games)
+    about_screen.set_games(list(games))
+
+    catalog_watcher = CatalogWatcher(game_catalog, CATALOG_POLL_INTERVAL, CATALOG_BACKEND)
+    catalog_watcher.start(games)
+
     current_state = main_menu_screen
 
     if hasattr(current_state, 'on_enter'):
@@ -392,22 +585,34 @@ def main():
 
     running = True
     while running:
-        for event in pygame.event.get():
+        for event in wait_for_events(current_state):
             if event.type == pygame.QUIT:
                 running = False
 
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                current_state.invalidate()
+
+            if event.type == CATALOG_CHANGED:
+                game_library_screen.on_catalog_changed(event)
+                about_screen.on_catalog_changed(event)
+                continue
+
             old_state = current_state
             current_state.handle_event(event)
 
             if current_state != old_state and hasattr(current_state, 'on_enter'):
                 current_state.on_enter()
 
-        current_state.draw()
+        if not present(current_state):
+            continue
 
-        pygame.display.flip()
+        if return_started_at is not None:
+            print(f"Latência de retorno ao menu: {(time.perf_counter() - return_started_at) * 1000:.1f} ms")
+            return_started_at = None
 
         clock.tick(60)
 
+    catalog_watcher.stop()
     pygame.quit()
     sys.exit()
 